@@ -30,6 +30,17 @@ class Config:
     MAX_CONTENT_LENGTH_FIRST_ANALYSIS: int = 8000  # Gemini 1차 분석 최대 글자 수
     MAX_CONTENT_LENGTH_SECOND_ANALYSIS: int = 4000  # Gemini 2차 분석 최대 글자 수
 
+    # Long content map-reduce settings (1차 분석 한도를 넘는 자막/기사: 청크별 분석 → 병합)
+    LONG_CONTENT_ENABLED: bool = True
+    LONG_CONTENT_CHUNK_CHARS: int = 8000  # 청크 크기 (1차 분석 한도와 동일)
+    LONG_CONTENT_CHUNK_OVERLAP: int = 500  # 청크 간 겹침 (경계에 걸친 주장 보존)
+    LONG_CONTENT_MAX_CONCURRENCY: int = 4  # 동시 Gemini 호출 수
+    LONG_CONTENT_TOKEN_BUDGET: int = 60000  # 요청당 토큰 예산 (map + reduce, 추정치)
+    LONG_CONTENT_OUTPUT_TOKENS: int = 1000  # 청크 호출당 예상 출력 토큰
+    LONG_CONTENT_REDUCE_TOKENS: int = 3000  # reduce(전체 요약) 호출 예약분
+    LONG_CONTENT_CHARS_PER_TOKEN: float = 2.5  # 토큰 추정 (한국어/영어 혼합 기준)
+    LONG_CONTENT_MAX_CLAIMS: int = 10  # 병합 후 최대 주장 수
+
     # Article search settings
     MAX_ARTICLES_PER_SEARCH: int = 15  # Google Search로 검색할 최대 기사 수
     MAX_ARTICLES_FOR_AI_ANALYSIS: int = 15  # AI에게 전달할 최대 기사 수
@@ -61,6 +72,103 @@ class Config:
     GDELT_DOC_TIMEOUT: int = 10  # DOC API 타임아웃 (초)
     GDELT_DOC_MAX_RECORDS: int = 50  # DOC API 최대 레코드 수 (250 → 50, 속도-품질 균형)
     GDELT_SEARCH_TIMESPAN: str = '6m'  # 검색 시간 범위 (6개월 유지, 과거 이슈 검색 지원)
+    GDELT_DOC_MAX_CONCURRENCY: int = 4  # DOC API 프로세스 전체 동시 호출 수
+    GDELT_DOC_MIN_INTERVAL: float = 0.25  # DOC API 호출 시작 간 최소 간격 (초)
+    GDELT_DOC_FAILURE_THRESHOLD: int = 3  # 연속 실패(타임아웃/요청 오류)가 이만큼이면 DOC API 일시 중지
+    GDELT_DOC_COOLDOWN_SEC: int = 60  # 일시 중지 시간 (지나면 자동으로 다시 사용)
+    GDELT_TIME_SLICES: int = 1  # 시간 분할 병렬 검색 구간 수 (1이면 단일 호출)
+    GDELT_TIMELINE_CACHE_TTL_SEC: int = 6 * 3600  # 국가별 톤/보도량 타임라인 캐시 시간
+    GDELT_STREAM_TARGET_CANDIDATES: int = 15  # 관련성 통과 후보가 이만큼 모이면 스트림 조기 종료
+    COUNTRY_ARTICLE_QUOTA: int = 5  # 국가별 본문 추출 기사 수 (쿼터)
+    GDELT_ADAPTIVE_SEARCH: bool = True  # 점진 확장 검색 사용 여부
+    QUERY_STATS_TTL_SEC: int = 3600  # 질의별 결과 수 통계 보관 시간 (QueryPlan 예상 결과 추정용)
+    GDELT_ADAPTIVE_STEPS: tuple = (('1w', 25), ('1m', 50), ('6m', 50))  # (timespan, maxrecords) 단계
+
+    # GDELT Local Mirror settings (GKG/Mentions export 로컬 색인)
+    GDELT_LOCAL_STORE_PATH: str = os.environ.get('GDELT_LOCAL_STORE_PATH', '')  # 비어 있으면 비활성화
+    GDELT_LOCAL_MIN_RESULTS: int = 5  # 로컬 결과가 이보다 적으면 miss로 보고 원격 API 사용
+    GDELT_LOCAL_RETENTION_DAYS: int = 30  # 로컬 색인 보관 기간 (일)
+    GDELT_EXPORT_BASE_URL: str = 'http://data.gdeltproject.org/gdeltv2/'
+
+    # Article Corpus settings (추출 기사 전문 로컬 저장소)
+    ARTICLE_CORPUS_PATH: str = os.environ.get('ARTICLE_CORPUS_PATH', '')  # 비어 있으면 비활성화
+    ARTICLE_CORPUS_MIN_RESULTS: int = 5  # 코퍼스 결과가 이보다 적으면 GDELT 검색 진행
+    ARTICLE_CORPUS_RETENTION_DAYS: int = 7  # 최근 이슈용 보관 기간 (일)
+    ARTICLE_CORPUS_MAX_DOCS: int = 20000  # 최대 보관 문서 수 (초과분은 오래된 순 삭제)
+
+    # Article fetch HTTP client settings (공유 커넥션 풀)
+    ARTICLE_FETCH_TIMEOUT: int = 10  # 기사 요청 타임아웃 (초)
+    HTTP_POOL_HOSTS: int = 50  # 커넥션 풀을 유지할 호스트 수
+    HTTP_POOL_PER_HOST: int = 10  # 호스트당 최대 keep-alive 연결 수
+    HTTP_KEEPALIVE_SEC: float = 30.0  # 유휴 연결 유지 시간 (httpx)
+    HTTP2_ENABLED: bool = True  # httpx + h2 설치 시 HTTP/2 사용
+    ARTICLE_MAX_BYTES: int = 2 * 1024 * 1024  # 기사 응답 최대 수신 크기 (초과분은 받지 않음)
+    ARTICLE_STOP_AT_CONTENT_END: bool = True  # </article>, </main> 수신 시 나머지 본문 생략 (HTTP/2 백엔드만, 본문이 부족하면 마커 없이 재수신)
+    ARTICLE_CONTENT_TYPES: tuple = ('text/html', 'application/xhtml+xml')  # 파싱 대상 Content-Type
+
+    # Metadata head fetch settings (제목 없는 후보의 <head>만 조회)
+    METADATA_MAX_BYTES: int = 64 * 1024  # </head> 전까지 최대 수신 크기
+    METADATA_FETCH_TIMEOUT: int = 5  # 메타데이터 요청 타임아웃 (초)
+    METADATA_CACHE_TTL_SEC: int = 6 * 3600  # URL별 메타데이터 캐시 시간
+    METADATA_EMPTY_CACHE_TTL_SEC: int = 300  # 메타데이터를 얻지 못한 URL의 재조회 생략 시간
+    METADATA_PREFETCH_LIMIT: int = 30  # 검색 1회당 메타데이터를 조회할 최대 후보 수
+
+    # HTML parse process pool settings (파싱 단계 분리, GIL 회피)
+    PARSE_POOL_ENABLED: bool = os.environ.get('PARSE_POOL_ENABLED', 'true').lower() == 'true'
+    PARSE_POOL_WORKERS: int = int(os.environ.get('PARSE_POOL_WORKERS', '0'))  # 0이면 CPU 코어 수
+    PARSE_POOL_MAX_PENDING: int = 64  # 풀에 동시에 올라갈 수 있는 파싱 작업 수
+    PARSE_POOL_START_METHOD: str = 'forkserver'  # gRPC 스레드가 있는 프로세스의 fork 회피 (미지원 OS는 spawn)
+    PARSE_TIMEOUT_SEC: int = 20  # 기사 1건 파싱 최대 대기 시간
+
+    # Per-domain extraction profile settings (도메인별 본문 XPath 학습)
+    EXTRACTION_PROFILES_PATH: str = os.environ.get('EXTRACTION_PROFILES_PATH', '')  # 비어 있으면 메모리에만 보관
+    PROFILE_CONFIRMATIONS: int = 2  # 같은 selector가 이만큼 관측되면 프로필 활성화
+    PROFILE_MAX_MISSES: int = 2  # fast path 연속 실패가 이만큼이면 프로필 폐기 후 재학습
+
+    # Per-domain politeness settings (기사 수집 도메인별 제한 + 실패 기억)
+    DOMAIN_MAX_CONCURRENCY: int = 2  # 도메인별 동시 요청 수
+    DOMAIN_MIN_INTERVAL: float = 0.5  # 같은 도메인 요청 시작 간 최소 간격 (초)
+    DOMAIN_FAILURE_THRESHOLD: int = 3  # 실패 점수가 이 이상이면 도메인 일시 제외
+    DOMAIN_FAILURE_TTL_SEC: int = 1800  # 도메인 실패 점수 유지 시간
+    URL_FAILURE_TTL_SEC: int = 6 * 3600  # 실패 URL 재시도 생략 시간 (차단, 404/410, 본문 부족, 미지원)
+    URL_TRANSIENT_FAILURE_TTL_SEC: int = 300  # 일시적 실패(429, 타임아웃, 5xx) URL 재시도 생략 시간
+    INFLIGHT_WAIT_TIMEOUT_SEC: int = 30  # 다른 요청이 추출 중인 기사를 기다리는 최대 시간
+
+    # Article content cache settings (Firestore 'article_cache', 추출 결과 영구 캐시)
+    ARTICLE_CACHE_TTL_SEC: int = 6 * 3600  # 신선도 유지 시간 (만료 후 조건부 요청으로 재검증)
+    ARTICLE_CACHE_RETENTION_DAYS: int = 30  # 보관 기간 (expires_at 필드, Firestore TTL 정책 대상)
+    ARTICLE_CACHE_MAX_CHARS: int = 50000  # 캐시할 본문 최대 길이 (압축 전)
+
+    # Transcript cache settings (Firestore 'transcript_cache', 영상 ID 기준)
+    TRANSCRIPT_CACHE_MAX_CHARS: int = 200000  # 캐시할 텍스트 최대 길이 (압축 전)
+    TRANSCRIPT_CACHE_RETENTION_DAYS: int = 90  # 보관 기간 (expires_at 필드, Firestore TTL 정책 대상)
+
+    # YouTube tier racing settings (자막 → Direct URL → yt-dlp 헤지)
+    YOUTUBE_TRANSCRIPT_HEDGE_SEC: float = 4.0  # 자막이 이 시간 안에 끝나지 않으면 Direct URL 병렬 시작
+    YOUTUBE_DIRECT_HEDGE_SEC: float = 30.0  # 자막 실패 후 Direct URL이 이 시간 안에 끝나지 않으면 yt-dlp 병렬 시작
+    YOUTUBE_TIER_WORKERS: int = 6  # 자막/yt-dlp 단계별 스레드 수
+    YOUTUBE_DIRECT_TIER_WORKERS: int = 16  # Direct URL 단계 스레드 수 (취소 불가 → 진 호출도 끝날 때까지 점유)
+
+    # YouTube pre-flight probe settings (추출 전 길이/자막/공개 여부 조회로 단계 선택)
+    YOUTUBE_PROBE_ENABLED: bool = True
+    YOUTUBE_PROBE_TIMEOUT_SEC: float = 8.0  # yt-dlp 메타데이터/oEmbed 조회 타임아웃
+    YOUTUBE_PROBE_TTL_SEC: int = 6 * 3600  # 영상 ID별 조회 결과 캐시
+    YOUTUBE_MAX_MEDIA_DURATION_SEC: int = 90 * 60  # 초과 시 영상 분석 단계(Direct URL, yt-dlp) 거부 → 자막만
+    YOUTUBE_VIDEO_MAX_DURATION_SEC: int = 20 * 60  # 초과 시 yt-dlp 단계는 오디오만 전송
+
+    # YouTube media streaming settings (yt-dlp stdout → GCS Resumable Upload, 임시 파일 없음)
+    YOUTUBE_AUDIO_ONLY: bool = os.environ.get('YOUTUBE_AUDIO_ONLY', 'false').lower() == 'true'  # 음성 위주 서비스용: 오디오 우선 전송 (긴 영상은 설정과 무관하게 오디오)
+    YOUTUBE_AUDIO_FORMAT: str = 'bestaudio[ext=m4a][abr<=96]/bestaudio[ext=m4a]'
+    YOUTUBE_VIDEO_FORMAT: str = 'best[ext=mp4][height<=720]/best[ext=mp4]'  # 단일 파일(progressive)만 가능
+    YOUTUBE_UPLOAD_CHUNK_BYTES: int = 8 * 1024 * 1024  # 업로드 청크 (256KB 배수)
+    YOUTUBE_MAX_MEDIA_BYTES: int = 500 * 1024 * 1024  # 초과 시 중단
+    VIDEO_BLOB_TTL_DAYS: int = 7  # 영상 ID 기반 GCS 미디어 보관 기간 (버킷 수명 주기 규칙)
+
+    # YouTube batch analysis settings (/api/analyze-batch)
+    YOUTUBE_BATCH_MAX_ITEMS: int = 50  # 요청당 최대 URL 수 (캐시 포함, 새로 분석하는 수는 시간 예산으로 제한)
+    YOUTUBE_BATCH_CONCURRENCY: int = 5  # 동시 Gemini 영상 분석 수
+    YOUTUBE_BATCH_ITEM_TIMEOUT_SEC: float = 120.0  # 영상당 최대 시간 (재시도 포함)
+    YOUTUBE_BATCH_REQUEST_BUDGET_SEC: float = 270.0  # 요청 1회 분석 시간 예산 (Cloud Run 기본 요청 타임아웃 300초 이내)
 
     # Trusted news sources for GDELT filtering
     TRUSTED_DOMAINS: tuple = (
@@ -1,33 +1,36 @@
 """
 Data models package
+
+하위 모듈은 처음 접근할 때 import합니다.
+(파싱 프로세스 풀 워커처럼 article_parser/domain_index만 필요한 곳에서
+Firestore/Vertex AI/yt-dlp 클라이언트까지 초기화하지 않도록)
 """
-from .media import (
-    get_media_credibility,
-    get_all_media,
-    reload_media_cache
-)
-from .extractor import BaseExtractor, YoutubeExtractor, ArticleExtractor
-from .history import (
-    save_analysis_history,
-    get_recent_history,
-    get_popular_content,
-    get_history_by_topic,
-    get_statistics
-)
+import importlib
 
-__all__ = [
+_EXPORTS = {
     # Media
-    'get_media_credibility',
-    'get_all_media',
-    'reload_media_cache',
+    'get_media_credibility': 'media',
+    'get_all_media': 'media',
+    'reload_media_cache': 'media',
     # Extractor
-    'BaseExtractor',
-    'YoutubeExtractor',
-    'ArticleExtractor',
+    'BaseExtractor': 'extractor',
+    'YoutubeExtractor': 'extractor',
+    'ArticleExtractor': 'extractor',
     # History
-    'save_analysis_history',
-    'get_recent_history',
-    'get_popular_content',
-    'get_history_by_topic',
-    'get_statistics',
-]
+    'save_analysis_history': 'history',
+    'get_recent_history': 'history',
+    'get_popular_content': 'history',
+    'get_history_by_topic': 'history',
+    'get_statistics': 'history',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,396 @@
+"""
+Article Parser - 한 번의 파싱으로 제목/메타데이터/본문을 추출하는 엔진
+
+[기존 방식의 문제]
+- response.apparent_encoding: 기사마다 본문 전체에 대해 charset 추정(chardet) 수행
+- BeautifulSoup(html.parser)로 제목만 찾기 위해 전체 트리 생성
+- trafilatura.extract(response.text)가 같은 문서를 다시 파싱
+
+[동작]
+1. 인코딩 결정: Content-Type 헤더 > BOM > <meta charset> > UTF-8 검증 (실패 시에만 추정)
+2. lxml로 한 번만 파싱한 트리에서 제목, og/description 메타데이터 추출
+3. 같은 트리를 trafilatura에 전달 (재파싱 없음)
+4. trafilatura 결과가 부족하면 같은 트리에서 본문 후보 태그 탐색 (폴백)
+5. lxml이 없는 환경에서만 BeautifulSoup으로 한 번 파싱
+
+[도메인 프로필 (fast path)]
+- profile_xpath가 주어지면 trafilatura 전에 해당 XPath 노드의 텍스트를 바로 사용
+- 본문이 부족하면 일반 경로로 폴백 (strategy로 결과 경로 보고 → 프로필 재학습)
+- 일반 경로 성공 시 본문을 감싸는 가장 작은 컨테이너의 XPath를 selector로 보고 (학습용)
+"""
+import re
+import time
+import codecs
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Tuple
+
+
+MIN_CONTENT_LENGTH = 100  # 본문으로 인정할 최소 길이
+PROFILE_MIN_CONTENT_LENGTH = 300  # fast path 결과로 인정할 최소 길이 (부족하면 일반 경로)
+
+_META_CHARSET = re.compile(
+    rb'<meta[^>]+charset\s*=\s*["\']?\s*([a-zA-Z0-9_\-:.]+)', re.IGNORECASE
+)
+_XML_DECLARATION = re.compile(r'^\s*<\?xml[^>]*\?>')
+_BOMS = (
+    (codecs.BOM_UTF8, 'utf-8-sig'),
+    (codecs.BOM_UTF16_LE, 'utf-16'),
+    (codecs.BOM_UTF16_BE, 'utf-16'),
+)
+_NOISE_TAGS = ('script', 'style', 'nav', 'header', 'footer', 'aside', 'form', 'iframe')
+_META_KEYS = ('og:title', 'og:description', 'og:site_name', 'og:type', 'og:url',
+              'og:image', 'article:published_time', 'description', 'pubdate', 'date')
+
+
+def _class_xpath(name: str) -> str:
+    return f"//*[contains(concat(' ', normalize-space(@class), ' '), ' {name} ')]"
+
+
+# 제목 후보 (기존 BeautifulSoup 탐색 순서 유지)
+_TITLE_XPATHS = ('//h1', '//title', _class_xpath('title'), _class_xpath('article-title'))
+# 본문 후보 (폴백용)
+_BODY_XPATHS = ('//article', '//main', "//*[@id='content']",
+                _class_xpath('content'), _class_xpath('article-body'), '//body')
+
+
+# 프로필 학습 대상 컨테이너 (식별 속성이 있는 블록 요소만)
+_CONTAINER_XPATH = (
+    '//*[self::article or self::main or self::section or self::div]'
+    '[@id or @class or @itemprop]'
+)
+_VOLATILE_ID = re.compile(r'\d{4,}')  # 기사마다 바뀌는 ID (예: article-123456)
+
+# 결과 경로
+STRATEGY_PROFILE = 'profile'
+STRATEGY_TRAFILATURA = 'trafilatura'
+STRATEGY_FALLBACK = 'fallback'
+
+
+@dataclass
+class ParsedArticle:
+    """파싱 결과"""
+    title: str = ''
+    content: str = ''
+    metadata: Dict[str, str] = field(default_factory=dict)  # og:*, description 등
+    encoding: str = ''
+    strategy: str = ''  # 본문을 만든 경로 (profile/trafilatura/fallback, 실패 시 '')
+    selector: str = ''  # 본문 컨테이너 XPath (fast path 사용/학습 결과)
+
+
+def _normalize_encoding(name: Optional[str]) -> Optional[str]:
+    """파이썬 코덱으로 확인된 인코딩 이름 (알 수 없으면 None)"""
+    if not name:
+        return None
+    try:
+        return codecs.lookup(name.strip().strip('"\'')).name
+    except LookupError:
+        return None
+
+
+def detect_encoding(content: bytes, header_charset: Optional[str] = None) -> str:
+    """
+    HTML 인코딩 결정 (본문 전체 추정은 최후 수단)
+
+    Content-Type charset > BOM > 문서 앞부분 <meta charset> > UTF-8 검증 > 추정
+    """
+    encoding = _normalize_encoding(header_charset)
+    if encoding:
+        return encoding
+
+    for bom, name in _BOMS:
+        if content.startswith(bom):
+            return name
+
+    match = _META_CHARSET.search(content[:4096])
+    if match:
+        encoding = _normalize_encoding(match.group(1).decode('ascii', 'ignore'))
+        if encoding:
+            return encoding
+
+    try:
+        content.decode('utf-8')
+        return 'utf-8'
+    except UnicodeDecodeError:
+        pass
+
+    try:
+        from charset_normalizer import from_bytes
+        best = from_bytes(content).best()
+        if best and _normalize_encoding(best.encoding):
+            return _normalize_encoding(best.encoding)
+    except ImportError:
+        pass
+    return 'cp1252'
+
+
+def decode_html(content: bytes, header_charset: Optional[str] = None) -> Tuple[str, str]:
+    """HTML 바이트 → (문자열, 사용한 인코딩)"""
+    encoding = detect_encoding(content, header_charset)
+    return content.decode(encoding, errors='replace'), encoding
+
+
+def clean_text(text: str) -> str:
+    """줄 단위 공백 정리 (빈 줄/연속 공백 구간 제거)"""
+    lines = (line.strip() for line in text.splitlines())
+    chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
+    return '\n'.join(chunk for chunk in chunks if chunk)
+
+
+def _trafilatura_extract(document) -> str:
+    """trafilatura 본문 추출 (문자열 또는 lxml 트리, 실패 시 빈 문자열)"""
+    try:
+        import trafilatura
+        return trafilatura.extract(document) or ''
+    except ImportError:
+        return ''  # trafilatura 없으면 폴백 사용
+    except Exception as e:
+        print(f"⚠️ trafilatura 실패, 폴백 추출 사용: {e}")
+        return ''
+
+
+def parse_html(
+    content: bytes,
+    header_charset: Optional[str] = None,
+    profile_xpath: Optional[str] = None,
+) -> ParsedArticle:
+    """
+    HTML 바이트를 한 번만 파싱하여 제목/메타데이터/본문 추출
+
+    Args:
+        content: 응답 본문 바이트
+        header_charset: Content-Type 헤더의 charset (선택)
+        profile_xpath: 도메인 프로필의 본문 XPath (있으면 fast path 먼저 시도)
+    """
+    text, encoding = decode_html(content, header_charset)
+
+    try:
+        import lxml.html
+    except ImportError:
+        return _parse_with_bs4(text, encoding)
+
+    # lxml은 인코딩 선언이 있는 유니코드 문자열을 거부하므로 XML 선언 제거
+    tree = lxml.html.document_fromstring(_XML_DECLARATION.sub('', text, count=1))
+
+    parsed = ParsedArticle(encoding=encoding)
+    parsed.metadata = extract_metadata(tree)
+    parsed.title = _find_title(tree) or parsed.metadata.get('og:title', '')
+
+    # 0단계: 도메인 프로필 fast path (trafilatura 생략)
+    if profile_xpath:
+        body = _extract_by_xpath(tree, profile_xpath)
+        if len(body) >= PROFILE_MIN_CONTENT_LENGTH:
+            parsed.content = body
+            parsed.strategy = STRATEGY_PROFILE
+            parsed.selector = profile_xpath
+            return parsed
+
+    # 1단계: 같은 트리를 trafilatura에 전달
+    body = _trafilatura_extract(tree)
+    if len(body) > MIN_CONTENT_LENGTH:
+        parsed.content = body
+        parsed.strategy = STRATEGY_TRAFILATURA
+        if not profile_xpath:
+            parsed.selector = learn_selector(tree, body)
+        return parsed
+
+    # 2단계: 같은 트리에서 본문 후보 탐색
+    for node in tree.xpath('|'.join(f'//{tag}' for tag in _NOISE_TAGS)):
+        node.drop_tree()
+
+    for xpath in _BODY_XPATHS:
+        nodes = tree.xpath(xpath)
+        if nodes:
+            body = _node_text(nodes[0])
+            if len(body) > MIN_CONTENT_LENGTH:
+                parsed.content = body
+                parsed.strategy = STRATEGY_FALLBACK
+                if not profile_xpath and xpath != '//body':
+                    parsed.selector = xpath
+            break
+
+    return parsed
+
+
+def _node_text(node) -> str:
+    return clean_text('\n'.join(t.strip() for t in node.itertext() if t.strip()))
+
+
+def _extract_by_xpath(tree, xpath: str) -> str:
+    """프로필 XPath 노드의 본문 (잡음 태그 제거 후)"""
+    try:
+        nodes = tree.xpath(xpath)
+    except Exception:
+        return ''
+    if not nodes or not hasattr(nodes[0], 'itertext'):
+        return ''
+    node = nodes[0]
+    for noise in node.xpath('|'.join(f'.//{tag}' for tag in _NOISE_TAGS)):
+        noise.drop_tree()
+    return _node_text(node)
+
+
+def learn_selector(tree, body: str) -> str:
+    """
+    trafilatura 본문을 모두 포함하는 가장 작은 컨테이너의 XPath
+
+    본문 첫 줄/마지막 줄을 모두 포함하는 요소 중 텍스트가 가장 짧은 것을 고르고,
+    기사마다 바뀌지 않는 속성(itemprop/id/class)으로 XPath를 만듭니다. (못 찾으면 '')
+    """
+    lines = [' '.join(line.split()) for line in body.splitlines() if line.strip()]
+    if not lines:
+        return ''
+    head, tail = lines[0][:50], lines[-1][:50]
+
+    best, best_length = None, None
+    for element in tree.xpath(_CONTAINER_XPATH):
+        text = ' '.join(element.text_content().split())
+        if head in text and tail in text and (best_length is None or len(text) < best_length):
+            best, best_length = element, len(text)
+
+    return _selector_for(best) if best is not None else ''
+
+
+def _selector_for(element) -> str:
+    tag = element.tag if isinstance(element.tag, str) else '*'
+    itemprop = element.get('itemprop', '')
+    if itemprop == 'articleBody':
+        return "//*[@itemprop='articleBody']"
+
+    element_id = element.get('id', '')
+    if element_id and "'" not in element_id and not _VOLATILE_ID.search(element_id):
+        return f"//{tag}[@id='{element_id}']"
+
+    classes = ' '.join(element.get('class', '').split())
+    if classes and "'" not in classes and not _VOLATILE_ID.search(classes):
+        return f"//{tag}[@class='{classes}']"
+    return ''
+
+
+def parse_to_dict(
+    content: bytes,
+    header_charset: Optional[str] = None,
+    profile_xpath: Optional[str] = None,
+) -> Dict:
+    """
+    프로세스 풀 작업 함수 (바이트 입력 → 작은 결과 딕셔너리 출력)
+
+    Returns:
+        {'title', 'content', 'strategy', 'selector', 'parse_sec'}
+    """
+    started = time.perf_counter()
+    parsed = parse_html(content, header_charset, profile_xpath)
+    return {
+        'title': parsed.title,
+        'content': parsed.content,
+        'strategy': parsed.strategy,
+        'selector': parsed.selector,
+        'parse_sec': time.perf_counter() - started,
+    }
+
+
+def parse_head(content: bytes, header_charset: Optional[str] = None) -> Dict[str, str]:
+    """
+    문서 앞부분(<head>까지)만으로 메타데이터 추출 (본문 파싱 없음)
+
+    Returns:
+        {'title', 'description', 'published', 'site_name'} (찾은 항목만)
+    """
+    text, _ = decode_html(content, header_charset)
+
+    try:
+        import lxml.html
+        tree = lxml.html.document_fromstring(_XML_DECLARATION.sub('', text, count=1))
+        metadata = extract_metadata(tree)
+        page_title = ' '.join((tree.findtext('.//title') or '').split())
+    except ImportError:
+        from bs4 import BeautifulSoup
+        soup = BeautifulSoup(text, 'html.parser')
+        metadata = {}
+        for meta in soup.find_all('meta'):
+            key = (meta.get('property') or meta.get('name') or '').strip().lower()
+            value = (meta.get('content') or '').strip()
+            if key in _META_KEYS and value and key not in metadata:
+                metadata[key] = value
+        page_title = ' '.join(soup.title.get_text(' ').split()) if soup.title else ''
+
+    head = {
+        'title': metadata.get('og:title') or page_title,
+        'description': metadata.get('og:description') or metadata.get('description', ''),
+        'published': (
+            metadata.get('article:published_time')
+            or metadata.get('pubdate')
+            or metadata.get('date', '')
+        ),
+        'site_name': metadata.get('og:site_name', ''),
+    }
+    return {key: value for key, value in head.items() if value}
+
+
+def extract_metadata(tree) -> Dict[str, str]:
+    """lxml 트리에서 og/description 메타데이터 추출"""
+    metadata: Dict[str, str] = {}
+    for meta in tree.iter('meta'):
+        key = (meta.get('property') or meta.get('name') or '').strip().lower()
+        value = (meta.get('content') or '').strip()
+        if key in _META_KEYS and value and key not in metadata:
+            metadata[key] = value
+    return metadata
+
+
+def _find_title(tree) -> str:
+    for xpath in _TITLE_XPATHS:
+        nodes = tree.xpath(xpath)
+        if nodes:
+            title = ' '.join(nodes[0].text_content().split())
+            if title:
+                return title
+    return ''
+
+
+def _parse_with_bs4(text: str, encoding: str) -> ParsedArticle:
+    """lxml이 없는 환경용 폴백 (BeautifulSoup 트리 1회 생성)"""
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(text, 'html.parser')
+    parsed = ParsedArticle(encoding=encoding)
+
+    for meta in soup.find_all('meta'):
+        key = (meta.get('property') or meta.get('name') or '').strip().lower()
+        value = (meta.get('content') or '').strip()
+        if key in _META_KEYS and value and key not in parsed.metadata:
+            parsed.metadata[key] = value
+
+    title_tag = (
+        soup.find('h1')
+        or soup.find('title')
+        or soup.find(class_='title')
+        or soup.find(class_='article-title')
+    )
+    if title_tag:
+        parsed.title = ' '.join(title_tag.get_text(' ').split())
+    parsed.title = parsed.title or parsed.metadata.get('og:title', '')
+
+    body = _trafilatura_extract(text)
+    if len(body) > MIN_CONTENT_LENGTH:
+        parsed.content = body
+        parsed.strategy = STRATEGY_TRAFILATURA
+        return parsed
+
+    for tag in soup(list(_NOISE_TAGS)):
+        tag.decompose()
+
+    article = (
+        soup.find('article')
+        or soup.find('main')
+        or soup.find(id='content')
+        or soup.find(class_='content')
+        or soup.find(class_='article-body')
+        or soup.body
+    )
+    if article:
+        body = clean_text(article.get_text(separator='\n', strip=True))
+        if len(body) > MIN_CONTENT_LENGTH:
+            parsed.content = body
+            parsed.strategy = STRATEGY_FALLBACK
+
+    return parsed
@@ -0,0 +1,179 @@
+"""
+Domain Intelligence Index
+도메인 → (국가, 국영/민영, 방송/신문) O(1) 조회용 사전 컴파일 색인
+
+[데이터 출처]
+1. 언론사 컬렉션 (Firestore 'media_credibility'의 domain/name)
+2. Public Suffix 테이블 (co.kr, com.cn 등 다단계 접미사 → 등록 도메인 추출)
+3. GDELT sourcecountry (DOC API 응답의 국가명, 관측값을 도메인별로 학습)
+
+[조회 우선순위 (국가)]
+언론사 컬렉션 > 기사별 sourcecountry > 학습된 sourcecountry > ccTLD > 'Unknown'
+(.com/.org 등 일반 TLD는 국가를 추정하지 않음)
+"""
+import threading
+from dataclasses import dataclass
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+
+@dataclass(frozen=True)
+class DomainInfo:
+    """도메인 색인 항목"""
+    country: str
+    media_type: str = "알 수 없음"  # 국영/민영
+    category: str = "알 수 없음"  # broadcasting/newspaper
+    name: str = ""
+
+
+# 다단계 공개 접미사 (등록 도메인 = 접미사 바로 앞 라벨 + 접미사)
+PUBLIC_SUFFIXES = frozenset({
+    'co.kr', 'or.kr', 'go.kr', 'ne.kr', 're.kr', 'ac.kr',
+    'co.jp', 'ne.jp', 'or.jp', 'go.jp', 'ac.jp',
+    'com.cn', 'net.cn', 'org.cn', 'gov.cn', 'edu.cn',
+    'com.hk', 'com.tw', 'org.tw', 'gov.tw', 'com.mo',
+    'co.uk', 'org.uk', 'ac.uk', 'gov.uk', 'me.uk',
+    'com.au', 'net.au', 'org.au', 'gov.au', 'co.nz',
+    'co.in', 'net.in', 'org.in', 'gov.in',
+    'co.id', 'or.id', 'go.id', 'com.sg', 'com.my', 'com.ph', 'com.vn', 'co.th', 'or.th',
+    'com.pk', 'com.bd', 'com.kh', 'com.mm', 'com.np', 'com.lk',
+    'com.tr', 'com.ua', 'com.ru', 'com.eg', 'com.sa', 'co.il', 'org.il', 'com.qa', 'com.kw',
+    'com.br', 'com.mx', 'com.ar', 'com.co', 'com.pe', 'com.ve',
+    'co.za', 'com.ng', 'co.ke',
+})
+
+# ccTLD → ISO 3166-1 alpha-2 (대부분 동일, 예외만 보정)
+_CCTLD_EXCEPTIONS = {'uk': 'GB'}
+_GENERIC_TLDS = frozenset({
+    'com', 'org', 'net', 'info', 'biz', 'news', 'media', 'tv', 'io', 'co', 'me', 'fm', 'eu', 'int',
+})
+
+# GDELT sourcecountry(국가명) → ISO 코드
+GDELT_COUNTRY_NAMES = {
+    'united states': 'US', 'south korea': 'KR', 'north korea': 'KP', 'japan': 'JP',
+    'china': 'CN', 'taiwan': 'TW', 'hong kong': 'HK', 'united kingdom': 'GB',
+    'germany': 'DE', 'france': 'FR', 'russia': 'RU', 'ukraine': 'UA', 'india': 'IN',
+    'vietnam': 'VN', 'thailand': 'TH', 'indonesia': 'ID', 'malaysia': 'MY',
+    'singapore': 'SG', 'philippines': 'PH', 'cambodia': 'KH', 'australia': 'AU',
+    'new zealand': 'NZ', 'canada': 'CA', 'brazil': 'BR', 'mexico': 'MX',
+    'argentina': 'AR', 'italy': 'IT', 'spain': 'ES', 'netherlands': 'NL',
+    'belgium': 'BE', 'switzerland': 'CH', 'sweden': 'SE', 'norway': 'NO',
+    'poland': 'PL', 'turkey': 'TR', 'israel': 'IL', 'iran': 'IR', 'iraq': 'IQ',
+    'saudi arabia': 'SA', 'qatar': 'QA', 'united arab emirates': 'AE', 'egypt': 'EG',
+    'south africa': 'ZA', 'nigeria': 'NG', 'kenya': 'KE', 'pakistan': 'PK',
+    'bangladesh': 'BD', 'myanmar': 'MM', 'ireland': 'IE', 'austria': 'AT',
+}
+
+
+_GDELT_NAMES_BY_CODE = {code: name for name, code in GDELT_COUNTRY_NAMES.items()}
+
+
+def gdelt_country_name(country_code: str) -> Optional[str]:
+    """ISO 코드 → GDELT sourcecountry 국가명 (예: "KR" → "south korea")"""
+    return _GDELT_NAMES_BY_CODE.get((country_code or '').upper())
+
+
+def registrable_domain(value: str) -> str:
+    """
+    URL/호스트/도메인 문자열에서 등록 도메인 추출
+
+    예: "https://www.news.bbc.co.uk/x" → "bbc.co.uk", "edition.cnn.com" → "cnn.com"
+    """
+    if not value:
+        return ''
+    host = value.strip().lower()
+    if '://' in host:
+        host = urlparse(host).netloc
+    host = host.split('/')[0].split(':')[0].strip('.')
+    if not host or '.' not in host:
+        return host
+
+    labels = host.split('.')
+    # 가장 긴 공개 접미사부터 확인 (최대 2단계)
+    for size in (2, 1):
+        if len(labels) > size and '.'.join(labels[-size:]) in PUBLIC_SUFFIXES:
+            return '.'.join(labels[-(size + 1):])
+    return '.'.join(labels[-2:])
+
+
+def country_from_tld(domain: str) -> Optional[str]:
+    """ccTLD 기반 국가 추정 (일반 TLD면 None)"""
+    tld = domain.rsplit('.', 1)[-1].lower() if domain else ''
+    if len(tld) != 2 or tld in _GENERIC_TLDS:
+        return None
+    return _CCTLD_EXCEPTIONS.get(tld, tld.upper())
+
+
+class DomainIndex:
+    """
+    등록 도메인/언론사명 → DomainInfo 해시 색인
+
+    언론사 컬렉션으로 한 번 컴파일되며, GDELT sourcecountry 관측값은
+    조회 중 도메인별로 누적됩니다 (스레드 안전).
+    """
+
+    def __init__(self, media_by_country: Optional[Dict[str, Dict]] = None):
+        self._by_domain: Dict[str, DomainInfo] = {}
+        self._by_name: Dict[str, DomainInfo] = {}
+        self._observed: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+        for country_code, country_data in (media_by_country or {}).items():
+            for category, key in (('broadcasting', 'broadcasting'), ('newspaper', 'newspapers')):
+                for media in country_data.get(key, []):
+                    info = DomainInfo(
+                        country=country_code,
+                        media_type=media.get('type', '알 수 없음'),
+                        category=category,
+                        name=media.get('name', ''),
+                    )
+                    domain = registrable_domain(media.get('domain', ''))
+                    if domain:
+                        self._by_domain.setdefault(domain, info)
+                    name = media.get('name', '').strip().lower()
+                    if name:
+                        self._by_name.setdefault(name, info)
+
+    def __len__(self) -> int:
+        return len(self._by_domain)
+
+    def lookup(self, source: str) -> Optional[DomainInfo]:
+        """도메인/URL 또는 언론사명으로 조회 (언론사 컬렉션에 있는 경우만)"""
+        if not source:
+            return None
+        info = self._by_domain.get(registrable_domain(source))
+        if info:
+            return info
+        return self._by_name.get(source.strip().lower())
+
+    def observe(self, domain: str, source_country: str) -> None:
+        """GDELT sourcecountry 관측값 기록"""
+        code = GDELT_COUNTRY_NAMES.get((source_country or '').strip().lower())
+        key = registrable_domain(domain)
+        if code and key:
+            with self._lock:
+                self._observed[key] = code
+
+    def country_for(self, domain: str, source_country: str = '') -> str:
+        """
+        도메인의 국가 코드 추정
+
+        Args:
+            domain: 도메인 또는 URL
+            source_country: GDELT DOC API의 sourcecountry (선택)
+        """
+        key = registrable_domain(domain)
+        info = self._by_domain.get(key)
+        if info:
+            return info.country
+
+        code = GDELT_COUNTRY_NAMES.get((source_country or '').strip().lower())
+        if code:
+            self.observe(key, source_country)
+            return code
+
+        observed = self._observed.get(key)
+        if observed:
+            return observed
+
+        return country_from_tld(key) or 'Unknown'
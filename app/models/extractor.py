@@ -2,13 +2,13 @@
 Content extractors for different media types
 """
 from abc import ABC, abstractmethod
-import os
-import uuid
-import tempfile
-import requests
-from bs4 import BeautifulSoup
+import re
+import time
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Callable, Dict, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
 from youtube_transcript_api import YouTubeTranscriptApi
-import yt_dlp
 
 import vertexai
 from vertexai.preview.generative_models import GenerativeModel, Part
@@ -17,6 +17,66 @@ from google.cloud import storage
 from app.config import config
 
 
+# 유튜브 영상 ID (11자)
+_VIDEO_ID = re.compile(r'^[A-Za-z0-9_-]{11}$')
+_YOUTUBE_HOSTS = ('youtube.com', 'youtube-nocookie.com', 'youtu.be')
+# 경로에 영상 ID가 들어가는 형식: /shorts/ID, /embed/ID, /live/ID, /v/ID, /e/ID
+_PATH_PREFIXES = ('shorts', 'embed', 'live', 'v', 'e')
+
+
+def extract_video_id(url: str) -> Optional[str]:
+    """
+    모든 유튜브 URL 형식에서 정규화된 영상 ID 추출 (유튜브가 아니면 None)
+
+    지원: youtu.be/ID, watch?v=ID(&t=..), /shorts/ID, /embed/ID, /live/ID, /v/ID,
+    m./music./www. 서브도메인, youtube-nocookie.com, 스킴 없는 URL, ID 단독 입력
+    """
+    if not url:
+        return None
+    url = url.strip()
+    if _VIDEO_ID.match(url):
+        return url
+    if '://' not in url:
+        url = f"https://{url}"
+
+    parts = urlparse(url)
+    host = parts.netloc.lower().split(':')[0]
+    if not any(host == h or host.endswith('.' + h) for h in _YOUTUBE_HOSTS):
+        return None
+
+    segments = [s for s in parts.path.split('/') if s]
+    candidate = None
+    if host.endswith('youtu.be'):
+        candidate = segments[0] if segments else None
+    elif segments and segments[0] in _PATH_PREFIXES and len(segments) > 1:
+        candidate = segments[1]
+    else:
+        candidate = (parse_qs(parts.query).get('v') or [None])[0]
+
+    if candidate and _VIDEO_ID.match(candidate):
+        return candidate
+    return None
+
+
+# 유튜브 추출 단계
+TIER_TRANSCRIPT = 'transcript'
+TIER_VIDEO = 'ytdlp_gcs'
+TIER_DIRECT = 'direct_url'
+TIER_LABELS = {
+    TIER_TRANSCRIPT: '자막 추출',
+    TIER_VIDEO: 'yt-dlp 방식',
+    TIER_DIRECT: 'Direct URL 방식',
+}
+
+
+# 자막 단계에서 찾는 언어 (우선순위 순)
+TRANSCRIPT_LANGUAGES = ('ko', 'en')
+
+
+class TierCancelled(Exception):
+    """다른 추출 단계가 먼저 성공하여 중단됨"""
+
+
 class BaseExtractor(ABC):
     """콘텐츠 추출기 기본 클래스"""
 
@@ -29,17 +89,45 @@ class BaseExtractor(ABC):
 class YoutubeExtractor(BaseExtractor):
     """유튜브 자막 추출 전략 (3단계 하이브리드 방식)"""
 
-    def __init__(self):
-        """GCS, Gemini, YouTube Video Service 초기화"""
+    def __init__(self, transcript_cache=None, storage_client=None):
+        """
+        GCS, Gemini, YouTube Video Service 초기화
+
+        Args:
+            transcript_cache: 영상 텍스트 캐시 (TranscriptCache, 선택)
+            storage_client: GCS 클라이언트 주입 (테스트용 가짜 클라이언트 등, 없으면 storage.Client)
+        """
+        self.transcript_cache = transcript_cache
+        # 단계별 경주용 스레드 (진 단계는 백그라운드에서 정리 후 종료)
+        # 취소할 수 없는 Direct URL 호출이 스레드를 잡고 있어도 다른 요청의 자막 단계가 밀리지 않도록 분리
+        self._tier_executors = {
+            TIER_TRANSCRIPT: ThreadPoolExecutor(
+                max_workers=config.YOUTUBE_TIER_WORKERS, thread_name_prefix='youtube-transcript'
+            ),
+            TIER_DIRECT: ThreadPoolExecutor(
+                max_workers=config.YOUTUBE_DIRECT_TIER_WORKERS, thread_name_prefix='youtube-direct'
+            ),
+            TIER_VIDEO: ThreadPoolExecutor(
+                max_workers=config.YOUTUBE_TIER_WORKERS, thread_name_prefix='youtube-video'
+            ),
+        }
+        # 사전 조회 (yt-dlp 메타데이터 조회는 수 초 걸리므로 자막 단계와 병렬 실행)
+        self._probe_executor = ThreadPoolExecutor(
+            max_workers=config.YOUTUBE_TIER_WORKERS, thread_name_prefix='youtube-probe'
+        )
+
         # GCS 및 Gemini 모델 초기화 (yt-dlp 방식용)
         self.storage_client = None
         self.bucket = None
+        self.video_blobs = None
         self.gemini_model = None
 
         if config.GCS_BUCKET_NAME:
             try:
-                self.storage_client = storage.Client(project=config.GCP_PROJECT)
+                from app.utils.video_blob_store import VideoBlobStore
+                self.storage_client = storage_client or storage.Client(project=config.GCP_PROJECT)
                 self.bucket = self.storage_client.bucket(config.GCS_BUCKET_NAME)
+                self.video_blobs = VideoBlobStore(self.bucket, config.GCS_BUCKET_NAME)
 
                 # Gemini 2.0 모델 초기화
                 vertexai.init(project=config.GCP_PROJECT, location=config.GCP_REGION)
@@ -58,302 +146,386 @@ class YoutubeExtractor(BaseExtractor):
             print(f"⚠️ (YoutubeExtractor) YouTube Video Service 초기화 실패: {e}")
 
     def extract(self, url: str) -> str:
-        """3단계 하이브리드 방식: 자막 → yt-dlp+GCS → Direct URL Processing"""
+        """3단계 하이브리드 방식: 자막 → Direct URL Processing / yt-dlp+GCS (헤지 경주)"""
+
+        video_id = extract_video_id(url)
+
+        # 0단계: 영상 ID 기준 캐시 (URL 형식과 무관, 어떤 단계의 결과든 재사용)
+        if self.transcript_cache and video_id:
+            cached = self.transcript_cache.get_best(video_id)
+            if cached:
+                text, source = cached
+                print(f"💾 영상 텍스트 캐시 히트 ({video_id}, {source}): {len(text)} 글자")
+                return text
+
+        # 사전 조회(길이/자막/공개 여부)는 자막 단계와 병렬로 실행 → 결과로 나머지 단계 결정
+        probe = None
+        if config.YOUTUBE_PROBE_ENABLED and video_id:
+            probe = self._probe_executor.submit(self._probe, url, video_id)
+
+        # 1~3단계: 헤지 경주 (먼저 성공한 단계 채택, 나머지는 취소)
+        return self._race_tiers(url, video_id, self._available_tiers(), probe)
+
+    def _probe(self, url: str, video_id: Optional[str]):
+        """영상 사전 조회 결과 (VideoProbeResult, 비활성/실패 시 None)"""
+        if not config.YOUTUBE_PROBE_ENABLED or not video_id:
+            return None
+        try:
+            from app.utils.video_probe import get_video_probe
+            return get_video_probe().probe(url, video_id)
+        except Exception as e:
+            print(f"⚠️ 영상 사전 조회 실패: {e}")
+            return None
+
+    def _available_tiers(self) -> Dict[str, Callable]:
+        """초기화에 성공한 단계 (사전 조회 전 기본값)"""
+        runners: Dict[str, Callable] = {TIER_TRANSCRIPT: self._run_transcript_tier}
+        if self.video_service:
+            runners[TIER_DIRECT] = self._run_direct_tier
+        if self.gemini_model and self.video_blobs:
+            runners[TIER_VIDEO] = self._run_video_tier
+        return runners
+
+    def _plan_tiers(self, runners: Dict[str, Callable], probe) -> Dict[str, Callable]:
+        """
+        사전 조회 결과로 실행할 단계 선택 (probe가 None이면 그대로)
+
+        - 비공개/삭제 영상: 모든 단계 생략하고 즉시 실패
+        - 한국어/영어 자막 없음: 자막 단계 생략 (Direct URL 즉시 시작)
+        - 라이브 또는 YOUTUBE_MAX_MEDIA_DURATION_SEC 초과: 영상 분석 단계(Direct URL, yt-dlp) 거부
+        - YOUTUBE_VIDEO_MAX_DURATION_SEC 초과: yt-dlp 단계는 오디오만 전송
+        """
+        runners = dict(runners)
+        if probe is None:
+            return runners
+
+        if not probe.available:
+            raise Exception("영상을 사용할 수 없습니다 (비공개/삭제/지역 제한)")
+
+        minutes = (probe.duration or 0) // 60
+        print(f"🔎 영상 사전 조회: {minutes}분, 자막 {list(probe.caption_languages) or '없음'}"
+              f"{', 라이브' if probe.is_live else ''} ({probe.source})")
+
+        refused = None
+        if probe.has_transcript_for(TRANSCRIPT_LANGUAGES) is False:
+            print("⏭️ 한국어/영어 자막 없음 → 자막 단계 생략")
+            runners.pop(TIER_TRANSCRIPT, None)
+
+        if probe.is_live:
+            refused = "라이브 방송은 영상 분석을 지원하지 않습니다"
+        elif probe.duration and probe.duration > config.YOUTUBE_MAX_MEDIA_DURATION_SEC:
+            refused = f"영상이 너무 깁니다 ({minutes}분, 최대 {config.YOUTUBE_MAX_MEDIA_DURATION_SEC // 60}분)"
+        elif probe.duration and probe.duration > config.YOUTUBE_VIDEO_MAX_DURATION_SEC and TIER_VIDEO in runners:
+            print(f"🔉 {minutes}분 영상 → yt-dlp 단계는 오디오만 전송")
+            runners[TIER_VIDEO] = lambda url, video_id, cancel: self._run_video_tier(
+                url, video_id, cancel, audio_only=True
+            )
 
+        if refused:
+            print(f"⏭️ {refused} → 영상 분석 단계 생략")
+            runners.pop(TIER_DIRECT, None)
+            runners.pop(TIER_VIDEO, None)
+
+        if not runners:
+            raise Exception(refused or "자막이 없고 영상 분석을 사용할 수 없습니다")
+        return runners
+
+    def _race_tiers(
+        self,
+        url: str,
+        video_id: Optional[str],
+        runners: Dict[str, Callable],
+        probe: Optional[Future] = None,
+    ) -> str:
+        """
+        단계 헤지 정책 (runners: 사용 가능한 단계, probe: 진행 중인 사전 조회)
+
+        - 자막: 사전 조회를 기다리지 않고 즉시 시작
+        - 사전 조회가 끝나면 _plan_tiers로 나머지 단계 결정 (자막 단계가 생략되면 실패한 것으로 간주)
+          → 조회가 끝나기 전에는 Direct URL/yt-dlp를 시작하지 않음 (자막이 먼저 성공하면 바로 반환)
+        - Direct URL: 자막이 실패하거나 YOUTUBE_TRANSCRIPT_HEDGE_SEC 안에 끝나지 않으면 병렬 시작
+        - yt-dlp + GCS: 자막이 실패했고, Direct URL이 실패했거나(또는 사용 불가)
+          YOUTUBE_DIRECT_HEDGE_SEC 안에 끝나지 않으면 병렬 시작 (가장 비싼 단계)
+        - 첫 성공 결과를 반환하고 cancel 이벤트로 나머지 단계 중단
+          (yt-dlp는 스트리밍 청크마다 중단 여부를 확인하고 미완성 업로드는 폐기)
+        - 헤지 타이머는 단계가 스레드에서 실제로 시작된 시점부터 계산 (대기열 시간 제외)
+        """
+        cancel = threading.Event()
+        pending: Dict[Future, str] = {}
+        submitted = set()
+        started_at: Dict[str, float] = {}  # 워커 스레드에서 실행을 시작한 시각
+        failed = set() if TIER_TRANSCRIPT in runners else {TIER_TRANSCRIPT}
         errors = []
 
-        # 1단계: 자막 추출 시도 (가장 빠름)
-        try:
-            print("📝 [1/3] 자막 추출 시도 중...")
-            transcript_text = self._extract_transcript(url)
-            print(f"✅ 자막 추출 성공: {len(transcript_text)} 글자")
-            return transcript_text
-        except Exception as transcript_error:
-            error_msg = f"자막 추출 실패: {transcript_error}"
-            print(f"⚠️ {error_msg}")
-            errors.append(error_msg)
-
-        # 2단계: yt-dlp + GCS 방식 시도 (이전 작동 방식)
-        if self.gemini_model and self.bucket:
-            try:
-                print("🎬 [2/3] yt-dlp + GCS 방식 시도 중...")
-                video_analysis = self._analyze_video_with_ytdlp_gcs(url)
-                print(f"✅ yt-dlp 분석 성공: {len(video_analysis)} 글자")
-                return video_analysis
-            except Exception as ytdlp_error:
-                error_msg = f"yt-dlp 방식 실패: {ytdlp_error}"
-                print(f"⚠️ {error_msg}")
-                errors.append(error_msg)
-
-        # 3단계: Direct URL Processing 시도 (최후 수단)
-        if self.video_service:
-            try:
-                print("🌐 [3/3] Direct URL Processing 시도 중...")
-                result = self.video_service.analyze_video(url, analysis_type="transcript")
+        def start(tier: str) -> None:
+            if tier in runners and tier not in submitted:
+                submitted.add(tier)
+
+                def run(runner=runners[tier]):
+                    started_at[tier] = time.monotonic()
+                    return runner(url, video_id, cancel)
+
+                pending[self._tier_executors[tier].submit(run)] = tier
 
-                transcript = result.get('transcript', '')
-                if transcript:
-                    print(f"✅ Direct URL 분석 성공: {len(transcript)} 글자")
-                    return transcript
-                else:
-                    raise Exception("영상 분석 결과에 transcript가 없습니다")
+        def elapsed(tier: str, now: float) -> float:
+            return now - started_at[tier] if tier in started_at else 0.0
 
-            except Exception as direct_error:
-                error_msg = f"Direct URL 방식 실패: {direct_error}"
-                print(f"❌ {error_msg}")
-                errors.append(error_msg)
+        start(TIER_TRANSCRIPT)
+        try:
+            while True:
+                if probe is not None and probe.done():
+                    runners = self._plan_tiers(runners, probe.result())
+                    if TIER_TRANSCRIPT not in runners:
+                        failed.add(TIER_TRANSCRIPT)
+                    probe = None
+
+                now = time.monotonic()
+                transcript_elapsed = elapsed(TIER_TRANSCRIPT, now)
+                direct_elapsed = elapsed(TIER_DIRECT, now)
+                deadlines = []
+                if probe is None:
+                    if TIER_TRANSCRIPT in failed or transcript_elapsed >= config.YOUTUBE_TRANSCRIPT_HEDGE_SEC:
+                        start(TIER_DIRECT)
+                    direct_done = TIER_DIRECT not in runners or TIER_DIRECT in failed
+                    if TIER_TRANSCRIPT in failed and (
+                            direct_done or direct_elapsed >= config.YOUTUBE_DIRECT_HEDGE_SEC):
+                        start(TIER_VIDEO)
+
+                    # 다음 헤지 시점까지만 대기 (대기열에 있는 단계는 다음 확인 시점에 다시 계산)
+                    if TIER_DIRECT in runners and TIER_DIRECT not in submitted:
+                        deadlines.append(config.YOUTUBE_TRANSCRIPT_HEDGE_SEC - transcript_elapsed)
+                    if (TIER_TRANSCRIPT in failed and TIER_VIDEO in runners
+                            and TIER_VIDEO not in submitted and TIER_DIRECT in submitted):
+                        deadlines.append(config.YOUTUBE_DIRECT_HEDGE_SEC - direct_elapsed)
+
+                if not pending and probe is None:
+                    break
+
+                timeout = max(0.0, min(deadlines)) if deadlines else None
+                waiting = list(pending) + ([probe] if probe is not None else [])
+                done, _ = wait(waiting, timeout=timeout, return_when=FIRST_COMPLETED)
+                for future in done:
+                    if future not in pending:
+                        continue  # 사전 조회 완료 → 다음 반복에서 단계 결정
+                    tier = pending.pop(future)
+                    try:
+                        text = future.result()
+                    except Exception as e:
+                        error_msg = f"{TIER_LABELS[tier]} 실패: {e}"
+                        print(f"⚠️ {error_msg}")
+                        errors.append(error_msg)
+                        failed.add(tier)
+                        continue
+
+                    losers = [TIER_LABELS[t] for t in pending.values()]
+                    if losers:
+                        print(f"🏁 {TIER_LABELS[tier]} 채택, 진행 중인 단계 취소: {', '.join(losers)}")
+                    return text
+        finally:
+            cancel.set()
+            for future in pending:
+                future.cancel()
 
         # 모든 방법 실패
         raise Exception(
             f"모든 영상 분석 방법이 실패했습니다:\n" + "\n".join(f"- {e}" for e in errors)
         )
 
-    def _extract_transcript(self, url: str) -> str:
-        """유튜브 자막 추출 (기존 로직)"""
-        if 'v=' in url:
-            video_id = url.split('v=')[1].split('&')[0]
-        elif 'youtu.be/' in url:
-            video_id = url.split('youtu.be/')[1].split('?')[0]
-        else:
+    def _run_transcript_tier(self, url: str, video_id: Optional[str], cancel: threading.Event) -> str:
+        """1단계: 자막 추출 (가장 빠름)"""
+        print("📝 [1/3] 자막 추출 시도 중...")
+        if not video_id:
             raise ValueError("유효하지 않은 유튜브 URL")
-
+        transcript_text, language = self._extract_transcript(video_id)
+        print(f"✅ 자막 추출 성공: {len(transcript_text)} 글자")
+        self._cache_text(video_id, language, transcript_text)
+        return transcript_text
+
+    def _run_video_tier(
+        self, url: str, video_id: Optional[str], cancel: threading.Event, audio_only: bool = False
+    ) -> str:
+        """2단계: yt-dlp + GCS (이전 작동 방식)"""
+        print("🎬 [2/3] yt-dlp + GCS 방식 시도 중...")
+        video_analysis = self._analyze_video_with_ytdlp_gcs(url, cancel, video_id, audio_only)
+        print(f"✅ yt-dlp 분석 성공: {len(video_analysis)} 글자")
+        self._cache_text(video_id, 'gemini_video', video_analysis)
+        return video_analysis
+
+    def _run_direct_tier(self, url: str, video_id: Optional[str], cancel: threading.Event) -> str:
+        """3단계: Direct URL Processing (단일 Gemini 호출이라 중간 취소 불가, 결과는 캐시에 보관)"""
+        print("🌐 [3/3] Direct URL Processing 시도 중...")
+        result = self.video_service.analyze_video(url, analysis_type="transcript")
+
+        transcript = result.get('transcript', '')
+        if not transcript:
+            raise Exception("영상 분석 결과에 transcript가 없습니다")
+        print(f"✅ Direct URL 분석 성공: {len(transcript)} 글자")
+        self._cache_text(video_id, 'gemini_url', transcript)
+        return transcript
+
+    def _cache_text(self, video_id: str, source: str, text: str) -> None:
+        if self.transcript_cache and video_id and text:
+            self.transcript_cache.set(video_id, source, text)
+
+    def _extract_transcript(self, video_id: str) -> Tuple[str, str]:
+        """유튜브 자막 추출 → (텍스트, 언어 코드)"""
         transcript_list = YouTubeTranscriptApi.list_transcripts(video_id)
 
         try:
             # 1. 한국어 자막 시도
-            transcript = transcript_list.find_transcript(['ko'])
+            transcript = transcript_list.find_transcript([TRANSCRIPT_LANGUAGES[0]])
         except:
             # 2. 영어 자막 시도
-            transcript = transcript_list.find_transcript(['en'])
+            transcript = transcript_list.find_transcript([TRANSCRIPT_LANGUAGES[1]])
 
         text = ' '.join([item['text'] for item in transcript.fetch()])
-        return text
-
-    def _analyze_video_with_ytdlp_gcs(self, url: str) -> str:
-        """yt-dlp + GCS 방식으로 영상 분석 (이전 작동 방식)"""
-        local_video_path = None
-        gcs_blob_name = None
-
-        try:
-            # 1. 영상 다운로드 (progressive=True로 병합된 스트림만 선택)
-            temp_dir = tempfile.gettempdir()
-            unique_filename = f"{uuid.uuid4()}.mp4"
-            local_video_path = os.path.join(temp_dir, unique_filename)
-
-            ydl_opts = {
-                'format': 'bestvideo[ext=mp4][progressive=True][height<=720]/best[ext=mp4][progressive=True]/best[ext=mp4]',
-                'outtmpl': local_video_path,
-                'quiet': False,  # 디버깅용
-            }
-
-            print(f"📥 yt-dlp로 영상 다운로드 중...")
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                ydl.download([url])
-
-            if not os.path.exists(local_video_path):
-                raise Exception("yt-dlp 다운로드 실패 (파일이 생성되지 않음)")
-
-            print(f"✅ 다운로드 완료: {local_video_path}")
-
-            # 2. GCS 업로드
-            gcs_blob_name = f"video-analysis/{unique_filename}"
-            blob = self.bucket.blob(gcs_blob_name)
-
-            print(f"☁️ GCS 업로드 중...")
-            blob.upload_from_filename(local_video_path)
-            gcs_uri = f"gs://{config.GCS_BUCKET_NAME}/{gcs_blob_name}"
-            print(f"✅ GCS 업로드 완료: {gcs_uri}")
+        return text, transcript.language_code
+
+    def _analyze_video_with_ytdlp_gcs(
+        self,
+        url: str,
+        cancel: Optional[threading.Event] = None,
+        video_id: Optional[str] = None,
+        audio_only: bool = False,
+    ) -> str:
+        """
+        yt-dlp + GCS 방식으로 영상 분석 (영상 ID 기반 GCS 객체 재사용)
 
-            # 3. Gemini API 호출
-            print(f"🤖 Gemini로 영상 분석 중...")
-            video_part = Part.from_uri(uri=gcs_uri, mime_type="video/mp4")
+        같은 영상·포맷이 이미 업로드되어 있으면 다운로드/업로드 없이 바로 Gemini를 호출합니다.
+        없으면 yt-dlp 출력을 GCS로 바로 스트리밍합니다 (YOUTUBE_AUDIO_ONLY면 오디오 우선).
+        업로드한 객체는 삭제하지 않고 버킷 수명 주기 규칙에 맡깁니다 (재시도/재분석 시 재사용).
 
-            prompt = """
-            이 영상의 내용을 상세히 분석하여 텍스트로 변환해주세요.
+        Args:
+            cancel: 다른 단계가 먼저 성공하면 설정되는 이벤트 (스트리밍 청크마다/분석 전에 중단)
+            video_id: 정규화 영상 ID (객체 키)
+            audio_only: 오디오만 전송 (긴 영상, YOUTUBE_AUDIO_ONLY 설정과 무관)
+        """
+        from app.utils.media_stream import MEDIA_AUDIO, MEDIA_FORMATS, MEDIA_VIDEO
 
-            다음 정보를 포함해주세요:
-            1. 영상의 주요 주제와 핵심 메시지
-            2. 언급된 구체적인 사실, 통계, 주장
-            3. 화자의 주요 논점과 근거
-            4. 중요한 맥락이나 배경 정보
+        cancel = cancel or threading.Event()
 
-            가능한 한 상세하고 정확하게 작성해주세요.
-            """
+        def check_cancel():
+            if cancel.is_set():
+                raise TierCancelled("다른 단계가 먼저 성공하여 중단")
 
-            response = self.gemini_model.generate_content([prompt, video_part])
-            return response.text
+        if audio_only:
+            modes = [MEDIA_AUDIO]
+        elif config.YOUTUBE_AUDIO_ONLY:
+            modes = [MEDIA_AUDIO, MEDIA_VIDEO]
+        else:
+            modes = [MEDIA_VIDEO]
 
-        finally:
-            # 4. 정리 (로컬 파일 및 GCS 파일 삭제)
-            try:
-                if local_video_path and os.path.exists(local_video_path):
-                    os.remove(local_video_path)
-                    print(f"🗑️ 로컬 파일 삭제 완료")
+        # 1. GCS 미디어 확보 (재사용 또는 yt-dlp → GCS 스트리밍 업로드)
+        try:
+            gcs_uri, mode = self.video_blobs.get_or_upload(url, video_id, modes, should_stop=cancel.is_set)
+        except InterruptedError:
+            check_cancel()
+            raise
+        check_cancel()
+
+        # 2. Gemini API 호출
+        print(f"🤖 Gemini로 영상 분석 중...")
+        video_part = Part.from_uri(uri=gcs_uri, mime_type=MEDIA_FORMATS[mode][1])
+
+        # 오디오만 보낸 경우 화면 정보가 없으므로 음성 기준으로 요청
+        source = "영상의 오디오(음성)" if mode == MEDIA_AUDIO else "영상의"
+        prompt = f"""
+        이 {source} 내용을 상세히 분석하여 텍스트로 변환해주세요.
+
+        다음 정보를 포함해주세요:
+        1. 영상의 주요 주제와 핵심 메시지
+        2. 언급된 구체적인 사실, 통계, 주장
+        3. 화자의 주요 논점과 근거
+        4. 중요한 맥락이나 배경 정보
+
+        가능한 한 상세하고 정확하게 작성해주세요.
+        """
 
-                if gcs_blob_name and self.bucket:
-                    blob = self.bucket.blob(gcs_blob_name)
-                    if blob.exists():
-                        blob.delete()
-                        print(f"🗑️ GCS 파일 삭제 완료")
-            except Exception as cleanup_error:
-                print(f"⚠️ 정리 작업 실패: {cleanup_error}")
+        response = self.gemini_model.generate_content([prompt, video_part])
+        return response.text
 
 
 class ArticleExtractor(BaseExtractor):
-    """기사 본문 추출 전략 (향상된 봇 방어 우회)"""
+    """기사 본문 추출 전략 (공유 커넥션 풀 수신 + 프로세스 풀 파싱)"""
+
+    # 본문 수신 중단 마커 (기사 본문이 끝난 뒤의 관련기사/댓글/스크립트는 받지 않음)
+    STOP_MARKERS = (b'</article>', b'</main>')
+    # 요청하지 않을 비 HTML 확장자
+    SKIP_EXTENSIONS = (
+        '.pdf', '.jpg', '.jpeg', '.png', '.gif', '.webp', '.svg',
+        '.mp3', '.mp4', '.m4a', '.mov', '.avi', '.zip', '.doc', '.docx', '.xls', '.xlsx',
+    )
 
-    def extract_with_title(self, url: str) -> dict:
+    def extract_with_title(self, url: str, validators: dict = None) -> dict:
         """URL에서 제목과 본문을 모두 추출합니다.
 
+        Args:
+            url: 기사 URL
+            validators: 조건부 요청 헤더 (If-None-Match / If-Modified-Since, 선택)
+
         Returns:
-            {'title': str, 'content': str}
+            {'title': str, 'content': str, 'etag': str, 'last_modified': str, 'not_modified': bool}
+            (실패 시 'error', 'status' 포함, HTML이 아니면 'unsupported')
         """
-        try:
-            # 봇 탐지 우회를 위한 현대적인 브라우저 헤더
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8',
-                'Accept-Language': 'en-US,en;q=0.5',
-                'Accept-Encoding': 'gzip, deflate, br',
-                'Referer': 'https://www.google.com/',
-                'DNT': '1',
-                'Connection': 'keep-alive',
-                'Upgrade-Insecure-Requests': '1'
-            }
-
-            response = requests.get(url, headers=headers, timeout=10)
-            response.raise_for_status()
-            response.encoding = response.apparent_encoding  # 인코딩 자동 감지
-
-            soup = BeautifulSoup(response.content, 'html.parser')
-
-            # 제목 추출 시도
-            title = ''
-            title_tag = (
-                soup.find('h1')
-                or soup.find('title')
-                or soup.find(class_='title')
-                or soup.find(class_='article-title')
-                or soup.find(property='og:title')
-            )
-            if title_tag:
-                if title_tag.get('content'):  # og:title의 경우
-                    title = title_tag.get('content')
-                else:
-                    title = title_tag.get_text(strip=True)
-
-            # 1단계: trafilatura 사용 (고품질 텍스트 추출)
-            try:
-                import trafilatura
-                text = trafilatura.extract(response.text)
-                if text and len(text) > 100:
-                    return {'title': title, 'content': text}
-            except ImportError:
-                pass  # trafilatura 없으면 BeautifulSoup 사용
-            except Exception as e:
-                print(f"⚠️ trafilatura 실패, BeautifulSoup 사용: {e}")
-
-            # 2단계: BeautifulSoup 폴백
-            # 불필요한 태그 제거
-            for tag in soup(
-                ['script', 'style', 'nav', 'header', 'footer', 'aside', 'form', 'iframe']
-            ):
-                tag.decompose()
-
-            # 기사 본문 유력 태그 탐색
-            article = (
-                soup.find('article')
-                or soup.find('main')
-                or soup.find(id='content')
-                or soup.find(class_='content')
-                or soup.find(class_='article-body')
-                or soup.body
+        from app.utils.http_client import FetchError, SkippedContent, get_http_client
+        from app.utils.parse_pool import get_parse_pool
+        from app.utils.extraction_profiles import get_profile_store
+        from app.models.article_parser import PROFILE_MIN_CONTENT_LENGTH
+
+        # PDF/이미지/영상 등 HTML이 아닌 URL은 요청 없이 건너뜀
+        if urlparse(url).path.lower().endswith(self.SKIP_EXTENSIONS):
+            print(f"⏭️ HTML이 아닌 URL 건너뜀: {url}")
+            return {'title': '', 'content': '', 'unsupported': True}
+
+        profiles = get_profile_store()
+        profile_xpath = profiles.fast_path(url)
+
+        def fetch_and_parse(stop_markers, headers):
+            # 공유 커넥션 풀 + 스트리밍 수신 (크기 제한, 본문 종료 태그에서 중단)
+            response = get_http_client().get(
+                url,
+                headers=headers,
+                max_bytes=config.ARTICLE_MAX_BYTES,
+                content_types=config.ARTICLE_CONTENT_TYPES,
+                stop_markers=stop_markers,
             )
+            if response.not_modified:
+                return response, None
+            # 파싱은 프로세스 풀에서 수행 (lxml 1회 파싱, 학습된 도메인 프로필이 있으면 fast path)
+            return response, get_parse_pool().parse(response.content, response.encoding, profile_xpath)
 
-            if article:
-                text = article.get_text(separator='\n', strip=True)
-                # 공백 정리
-                lines = (line.strip() for line in text.splitlines())
-                chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-                text = '\n'.join(chunk for chunk in chunks if chunk)
-
-                # 최소 길이 체크
-                if len(text) > 100:
-                    return {'title': title, 'content': text}
-
-            return {'title': title, 'content': ''}
-
-        except requests.RequestException as e:
-            print(f"⚠️ 기사 요청 실패: {e}")
-            return {'title': '', 'content': ''}
-        except Exception as e:
-            print(f"⚠️ 기사 처리 실패: {e}")
-            return {'title': '', 'content': ''}
-
-    def extract(self, url: str) -> str:
         try:
-            # 봇 탐지 우회를 위한 현대적인 브라우저 헤더
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8',
-                'Accept-Language': 'en-US,en;q=0.5',
-                'Accept-Encoding': 'gzip, deflate, br',
-                'Referer': 'https://www.google.com/',
-                'DNT': '1',
-                'Connection': 'keep-alive',
-                'Upgrade-Insecure-Requests': '1'
+            stop_markers = self.STOP_MARKERS if config.ARTICLE_STOP_AT_CONTENT_END else ()
+            response, parsed = fetch_and_parse(stop_markers, validators)
+
+            # 캐시된 본문이 여전히 유효 (본문 수신/파싱 없음)
+            if response.not_modified:
+                return {'title': '', 'content': '', 'not_modified': True}
+
+            # 본문 앞의 티저/카드 <article>에서 수신이 끊겨 본문이 부족하면 중단 마커 없이 다시 수신
+            if stop_markers and response.truncated and len(parsed['content']) < PROFILE_MIN_CONTENT_LENGTH:
+                print(f"🔁 중단 마커 이후 본문 부족 ({len(parsed['content'])}자), 전체 재수신: {url}")
+                response, parsed = fetch_and_parse((), None)
+
+            profiles.observe(url, profile_xpath, parsed['strategy'], parsed['selector'])
+            return {
+                'title': parsed['title'],
+                'content': parsed['content'],
+                'etag': response.headers.get('etag', ''),
+                'last_modified': response.headers.get('last-modified', ''),
             }
 
-            response = requests.get(url, headers=headers, timeout=10)
-            response.raise_for_status()
-            response.encoding = response.apparent_encoding  # 인코딩 자동 감지
-
-            # 1단계: trafilatura 사용 (고품질 텍스트 추출)
-            try:
-                import trafilatura
-                text = trafilatura.extract(response.text)
-                if text and len(text) > 100:
-                    return text
-            except ImportError:
-                pass  # trafilatura 없으면 BeautifulSoup 사용
-            except Exception as e:
-                print(f"⚠️ trafilatura 실패, BeautifulSoup 사용: {e}")
-
-            # 2단계: BeautifulSoup 폴백
-            soup = BeautifulSoup(response.content, 'html.parser')
-
-            # 불필요한 태그 제거
-            for tag in soup(
-                ['script', 'style', 'nav', 'header', 'footer', 'aside', 'form', 'iframe']
-            ):
-                tag.decompose()
-
-            # 기사 본문 유력 태그 탐색
-            article = (
-                soup.find('article')
-                or soup.find('main')
-                or soup.find(id='content')
-                or soup.find(class_='content')
-                or soup.find(class_='article-body')
-                or soup.body
-            )
-
-            if article:
-                text = article.get_text(separator='\n', strip=True)
-                # 공백 정리
-                lines = (line.strip() for line in text.splitlines())
-                chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-                text = '\n'.join(chunk for chunk in chunks if chunk)
-
-                # 최소 길이 체크
-                if len(text) > 100:
-                    return text
-
-            return ""
-
-        except requests.RequestException as e:
+        except SkippedContent as e:
+            print(f"⏭️ 기사 건너뜀: {e}")
+            return {'title': '', 'content': '', 'unsupported': True}
+        except FetchError as e:
             print(f"⚠️ 기사 요청 실패: {e}")
-            return ""  # 예외 발생 대신 빈 문자열 반환 (병렬 처리 시 안정적)
+            return {'title': '', 'content': '', 'error': str(e), 'status': e.status_code}
         except Exception as e:
+            # 파싱 풀 ParseError 포함 → 'error'가 있으므로 일시적 실패로 기록됨 (본문 부족 아님)
             print(f"⚠️ 기사 처리 실패: {e}")
-            return ""
+            return {'title': '', 'content': '', 'error': str(e), 'status': 0}
+
+    def extract(self, url: str) -> str:
+        # 예외 발생 대신 빈 문자열 반환 (병렬 처리 시 안정적)
+        return self.extract_with_title(url)['content']
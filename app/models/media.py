@@ -13,8 +13,10 @@ Firestore 구조:
   │   └── newspapers: [...]
   └── ...
 """
+import threading
 from google.cloud import firestore
 from app.config import config
+from app.models.domain_index import DomainIndex
 
 # Firestore 클라이언트 초기화
 db = None
@@ -28,6 +30,13 @@ except Exception as e:
 _media_cache = {}
 _cache_loaded = False
 
+# 도메인 색인 (언론사 캐시로부터 컴파일, 캐시 재로드 시 재생성)
+_domain_index = None
+_domain_index_lock = threading.Lock()
+
+# 부분 매칭 결과 메모 (source_name, country_hint) → 결과
+_credibility_memo = {}
+
 
 def _load_media_from_firestore():
     """Firestore 'media_credibility' 컬렉션에서 모든 국가 언론사 정보를 로드하여 캐시"""
@@ -201,12 +210,36 @@ def get_all_media():
     return all_media
 
 
+def get_domain_index():
+    """
+    도메인 색인 조회 (최초 호출 시 언론사 캐시로부터 1회 컴파일)
+
+    gdelt_search의 국가 추론과 get_media_credibility가 공유합니다.
+    """
+    global _domain_index
+
+    if _domain_index is not None:
+        return _domain_index
+
+    if not _cache_loaded:
+        _load_media_from_firestore()
+
+    with _domain_index_lock:
+        if _domain_index is None:
+            _domain_index = DomainIndex(_media_cache)
+            print(f"✅ 도메인 색인 생성: {len(_domain_index)}개 도메인")
+    return _domain_index
+
+
 def reload_media_cache():
     """캐시 강제 새로고침 (관리 목적)"""
-    global _cache_loaded
+    global _cache_loaded, _domain_index
     _cache_loaded = False
     _media_cache.clear()
+    _credibility_memo.clear()
     _load_media_from_firestore()
+    with _domain_index_lock:
+        _domain_index = None
     return len(_media_cache)
 
 
@@ -228,11 +261,32 @@ def get_media_credibility(source_name, country_hint=None):
             "category": str (broadcasting/newspaper/알 수 없음)
         }
     """
-    # 캐시 로드
-    if not _cache_loaded:
-        _load_media_from_firestore()
+    # 1. 도메인/언론사명 색인 조회 (O(1))
+    info = get_domain_index().lookup(source_name)
+    if info:
+        return {
+            "country": info.country,
+            "type": info.media_type,
+            "category": info.category
+        }
+
+    # 2. 부분 매칭 (예: "BBC News" → "BBC"), 결과는 메모하여 반복 스캔 방지
+    memo_key = (source_name, country_hint)
+    if memo_key in _credibility_memo:
+        return _credibility_memo[memo_key]
+
+    result = _match_media_partial(source_name, country_hint)
+    if len(_credibility_memo) >= 10000:
+        _credibility_memo.clear()
+    _credibility_memo[memo_key] = result
+    return result
 
+
+def _match_media_partial(source_name, country_hint=None):
+    """언론사 이름/도메인 부분 매칭 (색인 미스 시에만 사용)"""
     source_name_lower = source_name.lower()
+    if not source_name_lower:
+        return _unknown_media(country_hint)
 
     # 국가 힌트가 있으면 해당 국가만 검색 (성능 최적화)
     countries_to_search = [country_hint] if country_hint and country_hint in _media_cache else _media_cache.keys()
@@ -240,41 +294,28 @@ def get_media_credibility(source_name, country_hint=None):
     for country_code in countries_to_search:
         country_data = _media_cache.get(country_code, {})
 
-        # 방송사 검색
-        for media in country_data.get("broadcasting", []):
-            media_name_lower = media.get("name", "").lower()
-            media_domain_lower = media.get("domain", "").lower()
-
-            # 이름 또는 도메인 매칭
-            if (media_name_lower in source_name_lower or
-                source_name_lower in media_name_lower or
-                media_domain_lower in source_name_lower or
-                source_name_lower in media_domain_lower):
+        for category, key in (("broadcasting", "broadcasting"), ("newspaper", "newspapers")):
+            for media in country_data.get(key, []):
+                media_name_lower = media.get("name", "").lower()
+                media_domain_lower = media.get("domain", "").lower()
 
-                return {
-                    "country": country_code,
-                    "type": media.get("type", "알 수 없음"),
-                    "category": "broadcasting"
-                }
+                # 이름 또는 도메인 매칭 (빈 값은 모든 문자열에 포함되므로 제외)
+                if ((media_name_lower and (media_name_lower in source_name_lower or
+                                           source_name_lower in media_name_lower)) or
+                        (media_domain_lower and (media_domain_lower in source_name_lower or
+                                                 source_name_lower in media_domain_lower))):
 
-        # 신문사 검색
-        for media in country_data.get("newspapers", []):
-            media_name_lower = media.get("name", "").lower()
-            media_domain_lower = media.get("domain", "").lower()
+                    return {
+                        "country": country_code,
+                        "type": media.get("type", "알 수 없음"),
+                        "category": category
+                    }
 
-            # 이름 또는 도메인 매칭
-            if (media_name_lower in source_name_lower or
-                source_name_lower in media_name_lower or
-                media_domain_lower in source_name_lower or
-                source_name_lower in media_domain_lower):
+    return _unknown_media(country_hint)
 
-                return {
-                    "country": country_code,
-                    "type": media.get("type", "알 수 없음"),
-                    "category": "newspaper"
-                }
 
-    # 찾지 못한 경우 기본값
+def _unknown_media(country_hint=None):
+    """찾지 못한 경우 기본값"""
     return {
         "country": country_hint if country_hint else "Unknown",
         "type": "알 수 없음",
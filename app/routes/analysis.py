@@ -3,6 +3,7 @@ Analysis API endpoints
 Global Insight Explorer - Refactored for Perspective Analysis
 """
 from flask import Blueprint, request, jsonify
+from app.config import config
 from app.utils.analysis_service import AnalysisService
 from app.models.history import save_analysis_history
 
@@ -41,6 +42,52 @@ def analyze():
         return jsonify({'error': str(e)}), 500
 
 
+@analysis_bp.route('/analyze-batch', methods=['POST'])
+def analyze_batch():
+    """
+    유튜브 일괄 1차 분석 (플레이리스트 등 여러 영상을 한 번의 요청으로)
+    Input: { "urls": ["https://youtu.be/...", ...] }
+    Output: { "results": [{url, video_id, analysis, cached} | {url, video_id, error(, deferred)}], "summary": {...} }
+    (새로 분석하는 영상 수는 요청 시간 예산으로 제한 → deferred 항목은 다시 요청하면 이어서 분석)
+    """
+    try:
+        data = request.get_json() or {}
+        urls = data.get('urls')
+        if not isinstance(urls, list) or not urls or not all(isinstance(u, str) for u in urls):
+            return jsonify({'error': 'urls 목록이 필요합니다'}), 400
+        if len(urls) > config.YOUTUBE_BATCH_MAX_ITEMS:
+            return jsonify({'error': f'한 번에 최대 {config.YOUTUBE_BATCH_MAX_ITEMS}개까지 분석할 수 있습니다'}), 400
+
+        results = analysis_service.analyze_youtube_batch(urls)
+
+        # 새로 분석한 영상만 히스토리 저장 (에러 무시)
+        saved = set()
+        for item in results:
+            if item.get('analysis') and not item.get('cached') and item['video_id'] not in saved:
+                saved.add(item['video_id'])
+                try:
+                    save_analysis_history(item['url'], 'youtube', item['analysis'])
+                except Exception:
+                    pass
+
+        succeeded = sum(1 for item in results if 'analysis' in item)
+        return jsonify({
+            'success': True,
+            'results': results,
+            'summary': {
+                'total': len(results),
+                'succeeded': succeeded,
+                'failed': len(results) - succeeded,
+                'cached': sum(1 for item in results if item.get('cached')),
+                'deferred': sum(1 for item in results if item.get('deferred')),
+            },
+        })
+
+    except Exception as e:
+        print(f"❌ /api/analyze-batch 에러: {e}")
+        return jsonify({'error': str(e)}), 500
+
+
 @analysis_bp.route('/optimize-query', methods=['POST'])
 def optimize_query():
     """
@@ -144,3 +191,26 @@ def find_sources():
         import traceback
         traceback.print_exc()
         return jsonify({'status': 'error', 'message': str(e)}), 500
+
+
+@analysis_bp.route('/tone-timeline', methods=['POST'])
+def tone_timeline():
+    """
+    국가별 보도량 + 평균 톤 시계열 (기사 추출 없는 빠른 국가 비교)
+
+    - Input: { "search_params": optimize-query 결과 JSON }
+    - Output: { "success": true, "result": { "data": { "KR": {"series": [...], ...}, ... } } }
+    """
+    try:
+        data = request.get_json()
+        search_params = data.get('search_params')
+
+        if not search_params:
+            return jsonify({'error': '검색 파라미터가 필요합니다'}), 400
+
+        result = analysis_service.get_tone_timeline(search_params)
+        return jsonify({'success': True, 'result': result}), 200
+
+    except Exception as e:
+        print(f"❌ /api/tone-timeline 에러: {e}")
+        return jsonify({'status': 'error', 'message': str(e)}), 500
@@ -3,6 +3,7 @@ Health check endpoints
 """
 from flask import Blueprint, jsonify
 from app.models.media import get_all_media
+from app.utils.parse_pool import get_parse_pool
 
 health_bp = Blueprint('health', __name__)
 
@@ -12,5 +13,9 @@ def health():
     """서버 상태 및 연결 상태 확인"""
     media_data = get_all_media()
     return jsonify(
-        {'status': 'healthy', 'media_database_size': len(media_data)}
+        {
+            'status': 'healthy',
+            'media_database_size': len(media_data),
+            'parse_pool': get_parse_pool().stats(),
+        }
     )
@@ -17,10 +17,19 @@ from vertexai.language_models import TextEmbeddingModel  # [신규] 임베딩 
 from google.cloud import firestore
 from google.api_core.exceptions import GoogleAPICallError
 
-from app.models.extractor import BaseExtractor, YoutubeExtractor, ArticleExtractor
+from app.models.extractor import BaseExtractor, YoutubeExtractor, ArticleExtractor, extract_video_id
 from app.models.media import get_media_credibility
 from app.config import config
 from app.utils.gdelt_search import GDELTSearcher
+from app.utils.article_corpus import get_article_corpus
+from app.utils.article_cache import ArticleContentCache, canonical_url
+from app.utils.inflight import article_fetches
+from app.utils.long_content import estimate_tokens, merge_claims, merge_topics, select_within_budget, split_chunks
+from app.utils.transcript_cache import TranscriptCache
+from app.utils.youtube_video_service import AsyncYouTubeVideoService
+from app.utils.metadata_fetcher import ArticleMetadataFetcher
+from app.utils.domain_scheduler import FAILURE_UNSUPPORTED, classify_failure, domain_scheduler
+from app.utils.query_planner import QueryPlan
 from app.prompts.analysis_prompts import QUERY_OPTIMIZATION_PROMPT
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
@@ -51,10 +60,14 @@ except Exception as e:
 class AnalysisService:
     def __init__(self):
         self.extractors = {
-            'youtube': YoutubeExtractor(),
+            'youtube': YoutubeExtractor(transcript_cache=TranscriptCache(db)),
             'article': ArticleExtractor(),
         }
-        self.gdelt = GDELTSearcher()  # GDELT 검색 엔진 초기화
+        self.corpus = get_article_corpus()  # 추출 기사 코퍼스 (미설정 시 None)
+        self.gdelt = GDELTSearcher(corpus=self.corpus)  # GDELT 검색 엔진 초기화
+        self.article_cache = ArticleContentCache(db)  # 추출 기사 영구 캐시 (Firestore 미연결 시 비활성)
+        self.metadata_fetcher = ArticleMetadataFetcher()  # 제목 없는 후보용 <head> 메타데이터 조회
+        self.batch_video_service = AsyncYouTubeVideoService()  # 유튜브 일괄 분석 (Direct URL, 비동기)
 
     # ==================================================================
     # [신규] 임베딩 기반 스마트 필터링 헬퍼 함수
@@ -139,15 +152,30 @@ class AnalysisService:
     def _analyze_with_gemini_bridge(self, content: str):
         """
         Gemini 프롬프트: 한국어 입력을 받아 '한국어 요약'과 '영어 검색어'를 동시 생성
+
+        MAX_CONTENT_LENGTH_FIRST_ANALYSIS보다 긴 본문은 잘라내지 않고 map-reduce로 분석합니다.
         """
         if not gemini:
             raise Exception("Gemini API를 사용할 수 없습니다.")
 
+        if config.LONG_CONTENT_ENABLED and len(content) > config.MAX_CONTENT_LENGTH_FIRST_ANALYSIS:
+            return self._analyze_long_content(content)
+
         content = content[:config.MAX_CONTENT_LENGTH_FIRST_ANALYSIS]
 
-        prompt = f"""
+        try:
+            response = gemini.generate_content(self._build_bridge_prompt(content))
+            return self._parse_bridge_response(response.text)
+        except Exception as e:
+            print(f"❌ AI 1차 분석 실패: {e}")
+            raise Exception(f"AI 분석 중 오류가 발생했습니다: {e}")
+
+    def _build_bridge_prompt(self, content: str, part_note: str = '') -> str:
+        """1차 분석 프롬프트 (part_note: 긴 본문의 일부일 때 위치 안내)"""
+        return f"""
         당신은 국제 정세 및 미디어 분석 전문가입니다. 
         주어진 텍스트(영상 자막 또는 기사)를 분석하여 다음 정보를 JSON 형식으로 추출하세요.
+        {part_note}
 
         [분석 대상 텍스트]
         {content}
@@ -186,37 +214,177 @@ class AnalysisService:
         JSON 외에 다른 말은 하지 마세요.
         """
 
+    def _parse_bridge_response(self, text: str) -> dict:
+        """1차 분석 응답 JSON 파싱 + 키워드 검증"""
+        result_text = text.strip().replace('```json', '').replace('```', '').strip()
+        return self._validate_analysis(json.loads(result_text))
+
+    def _validate_analysis(self, analysis_result: dict) -> dict:
+        """1차 분석 결과 키워드/국가 코드 검증 (누락 시 보정)"""
+        # ✅ 영어 키워드 검증 및 자동 생성
+        if 'key_claims' in analysis_result:
+            for claim in analysis_result['key_claims']:
+                # search_keywords_en이 없거나 비어있으면 claim_kr로 생성 (폴백)
+                if not claim.get('search_keywords_en') or len(claim.get('search_keywords_en', [])) == 0:
+                    print(f"⚠️ 영어 키워드 누락 감지, claim_kr로 대체: {claim.get('claim_kr', '')[:30]}...")
+                    claim['search_keywords_en'] = [claim.get('claim_kr', '')]
+                else:
+                    # 한글 포함 여부 확인 (간단한 유니코드 범위 체크)
+                    keywords = claim.get('search_keywords_en', [])
+                    has_korean = any(
+                        any('\uac00' <= char <= '\ud7a3' for char in keyword)
+                        for keyword in keywords
+                    )
+                    if has_korean:
+                        print(f"⚠️ search_keywords_en에 한글 감지! AI가 프롬프트를 따르지 않았습니다: {keywords}")
+                        print(f"   → 이 키워드로 GDELT 검색이 실패할 수 있습니다. claim_kr: {claim.get('claim_kr', '')[:50]}")
+
+                # target_country_codes가 없으면 빈 배열로 초기화
+                if 'target_country_codes' not in claim:
+                    claim['target_country_codes'] = []
+
+        return analysis_result
+
+    def _analyze_long_content(self, content: str):
+        """
+        긴 본문 map-reduce 1차 분석
+
+        1. map: 겹치는 청크로 나눠 청크별 1차 분석을 동시 실행 (LONG_CONTENT_MAX_CONCURRENCY)
+           - 요청당 토큰 예산(LONG_CONTENT_TOKEN_BUDGET)을 넘으면 전체 구간에 고르게 청크 선택
+        2. reduce: 주장/키워드/국가 코드 병합 + 중복 제거, 제목/요약은 청크 요약을 모아 한 번 더 생성
+        """
+        chunks = split_chunks(content, config.LONG_CONTENT_CHUNK_CHARS, config.LONG_CONTENT_CHUNK_OVERLAP)
+        prompt_tokens = estimate_tokens(self._build_bridge_prompt('')) + config.LONG_CONTENT_OUTPUT_TOKENS
+        map_budget = config.LONG_CONTENT_TOKEN_BUDGET - config.LONG_CONTENT_REDUCE_TOKENS
+        selected = select_within_budget(chunks, prompt_tokens, map_budget)
+        print(f"🧩 긴 본문 map-reduce 분석: {len(content)} 글자 → 청크 {len(chunks)}개 중 {len(selected)}개 분석")
+
+        def analyze_chunk(index):
+            note = f"(전체 텍스트 {len(chunks)}개 구간 중 {index + 1}번째 구간입니다. 이 구간에 나온 주장만 추출하세요.)"
+            response = gemini.generate_content(self._build_bridge_prompt(chunks[index], note))
+            return self._parse_bridge_response(response.text)
+
+        partials = {}
+        with ThreadPoolExecutor(max_workers=config.LONG_CONTENT_MAX_CONCURRENCY) as executor:
+            futures = {executor.submit(analyze_chunk, index): index for index in selected}
+            for future in as_completed(futures):
+                index = futures[future]
+                try:
+                    partials[index] = future.result()
+                except Exception as e:
+                    print(f"⚠️ 청크 {index + 1}/{len(chunks)} 분석 실패: {e}")
+
+        if not partials:
+            raise Exception("AI 분석 중 오류가 발생했습니다: 모든 구간 분석 실패")
+
+        ordered = [partials[index] for index in sorted(partials)]
+        result = {
+            'title_kr': ordered[0].get('title_kr', ''),
+            'summary_kr': ' '.join(p.get('summary_kr', '') for p in ordered if p.get('summary_kr')),
+            'topics': merge_topics(ordered),
+            'key_claims': merge_claims(ordered, config.LONG_CONTENT_MAX_CLAIMS),
+        }
+        if len(ordered) > 1:
+            result.update(self._reduce_long_summary(ordered))
+        print(f"✅ map-reduce 병합 완료: 구간 {len(ordered)}개, 주장 {len(result['key_claims'])}개")
+        return result
+
+    def _reduce_long_summary(self, partials: list) -> dict:
+        """구간별 제목/요약을 전체 제목/요약으로 통합 (실패 시 빈 딕셔너리 → 구간 요약 이어붙이기 유지)"""
+        sections = '\n'.join(
+            f"{i + 1}. {p.get('title_kr', '')}: {p.get('summary_kr', '')}" for i, p in enumerate(partials)
+        )
+        prompt = f"""
+        다음은 긴 영상 자막(또는 기사)을 구간별로 요약한 내용입니다.
+        전체 내용을 대표하는 한국어 제목과 3~5문장 요약을 JSON으로 작성하세요.
+
+        [구간별 요약]
+        {sections}
+
+        [출력 형식 (JSON Only)]
+        {{"title_kr": "전체 제목", "summary_kr": "전체 요약"}}
+        """
         try:
-            response = gemini.generate_content(prompt)
-            result_text = response.text.strip().replace('```json', '').replace('```', '').strip()
-            analysis_result = json.loads(result_text)
-
-            # ✅ 영어 키워드 검증 및 자동 생성
-            if 'key_claims' in analysis_result:
-                for claim in analysis_result['key_claims']:
-                    # search_keywords_en이 없거나 비어있으면 claim_kr로 생성 (폴백)
-                    if not claim.get('search_keywords_en') or len(claim.get('search_keywords_en', [])) == 0:
-                        print(f"⚠️ 영어 키워드 누락 감지, claim_kr로 대체: {claim.get('claim_kr', '')[:30]}...")
-                        claim['search_keywords_en'] = [claim.get('claim_kr', '')]
-                    else:
-                        # 한글 포함 여부 확인 (간단한 유니코드 범위 체크)
-                        keywords = claim.get('search_keywords_en', [])
-                        has_korean = any(
-                            any('\uac00' <= char <= '\ud7a3' for char in keyword)
-                            for keyword in keywords
-                        )
-                        if has_korean:
-                            print(f"⚠️ search_keywords_en에 한글 감지! AI가 프롬프트를 따르지 않았습니다: {keywords}")
-                            print(f"   → 이 키워드로 GDELT 검색이 실패할 수 있습니다. claim_kr: {claim.get('claim_kr', '')[:50]}")
-
-                    # target_country_codes가 없으면 빈 배열로 초기화
-                    if 'target_country_codes' not in claim:
-                        claim['target_country_codes'] = []
-
-            return analysis_result
+            response = gemini.generate_content(prompt, generation_config={"temperature": 0.2})
+            reduced = json.loads(response.text.strip().replace('```json', '').replace('```', '').strip())
+            return {k: reduced[k] for k in ('title_kr', 'summary_kr') if reduced.get(k)}
         except Exception as e:
-            print(f"❌ AI 1차 분석 실패: {e}")
-            raise Exception(f"AI 분석 중 오류가 발생했습니다: {e}")
+            print(f"⚠️ 전체 요약 통합 실패, 구간 요약 사용: {e}")
+            return {}
+
+    # ==================================================================
+    # 1️⃣-B 유튜브 일괄 1차 분석 (Batch)
+    # ==================================================================
+    def analyze_youtube_batch(self, urls: list):
+        """
+        여러 유튜브 URL을 한 번에 1차 분석
+
+        1. 영상 ID 기준 중복 제거 (같은 영상의 다른 URL 형식은 한 번만 분석)
+        2. 분석 캐시 일괄 조회 (Firestore get_all 1회)
+        3. 캐시 miss만 AsyncYouTubeVideoService로 동시 분석 (동시 실행 수 제한 + 재시도)
+           → /api/analyze와 같은 스키마로 검증 후 캐시 저장
+        4. 새로 분석하는 영상 수는 요청 시간 예산으로 제한
+           (ceil(분석 수 / 동시 실행 수) * 영상당 타임아웃 <= YOUTUBE_BATCH_REQUEST_BUDGET_SEC)
+           → 넘는 영상은 'deferred'로 표시 (같은 목록을 다시 요청하면 캐시 히트 후 이어서 분석)
+
+        Returns:
+            입력 순서대로 {'url', 'video_id', 'analysis', 'cached'} 또는 {'url', 'video_id', 'error'(, 'deferred')}
+        """
+        video_urls = {}  # video_id → 정규화 URL
+        for url in urls:
+            video_id = extract_video_id(url or '')
+            if video_id and video_id not in video_urls:
+                video_urls[video_id] = f"https://www.youtube.com/watch?v={video_id}"
+
+        cached = self._get_cache_many(list(video_urls.values()))
+        misses = [u for u in video_urls.values() if u not in cached]
+        rounds = max(1, int(config.YOUTUBE_BATCH_REQUEST_BUDGET_SEC // config.YOUTUBE_BATCH_ITEM_TIMEOUT_SEC))
+        limit = rounds * config.YOUTUBE_BATCH_CONCURRENCY
+        misses, deferred = misses[:limit], set(misses[limit:])
+        print(f"📦 일괄 분석: 입력 {len(urls)}개 → 영상 {len(video_urls)}개 "
+              f"(캐시 {len(cached)}개, 분석 {len(misses)}개, 다음 요청으로 미룸 {len(deferred)}개)")
+
+        fresh, errors = {}, {}
+        if misses:
+            prompt = self._build_bridge_prompt(
+                '(첨부된 영상의 음성과 화면 내용)',
+                part_note='(분석 대상은 텍스트가 아니라 첨부된 유튜브 영상입니다.)',
+            )
+            outcomes = self.batch_video_service.analyze_many(
+                misses,
+                prompt=prompt,
+                max_concurrent=config.YOUTUBE_BATCH_CONCURRENCY,
+                timeout=config.YOUTUBE_BATCH_ITEM_TIMEOUT_SEC,
+            )
+            for outcome in outcomes:
+                url = outcome['url']
+                if 'error' in outcome:
+                    errors[url] = outcome['error']
+                    continue
+                try:
+                    fresh[url] = self._validate_analysis(outcome['result'])
+                    self._set_cache(url, fresh[url])
+                except Exception as e:
+                    errors[url] = f"분석 결과 형식 오류: {e}"
+
+        items = []
+        for url in urls:
+            video_id = extract_video_id(url or '')
+            item = {'url': url, 'video_id': video_id}
+            if not video_id:
+                item['error'] = '유효하지 않은 유튜브 URL'
+            else:
+                key = video_urls[video_id]
+                if key in cached:
+                    item.update(analysis=cached[key], cached=True)
+                elif key in fresh:
+                    item.update(analysis=fresh[key], cached=False)
+                elif key in deferred:
+                    item.update(error='요청당 분석 한도 초과 (다시 요청하면 이어서 분석)', deferred=True)
+                else:
+                    item['error'] = errors.get(key, '분석 실패')
+            items.append(item)
+        return items
 
     def optimize_search_query(self, user_input: str, context: dict):
         """
@@ -304,53 +472,85 @@ class AnalysisService:
         }
 
         all_collected_urls = set()  # 중복 기사 방지용 (URL)
+        relevance_scores = {}  # URL → 유사도 (같은 기사를 여러 질의에서 다시 평가하지 않음)
 
-        # 🔄 국가별 루프 실행
-        for target in target_countries:
-            country_code = target.get('code', 'Unknown')
-            role_desc = target.get('reason', '')
-
-            print(f"🌍 [{country_code}] 검색 시작 ({role_desc})...")
-
-            # 1. 해당 국가 전용 파라미터 설정
-            current_params = gdelt_base_params.copy()
-            current_params['locations'] = [country_code]  # GDELT Location 필터 활용
-
-            # 2. GDELT 검색 (수량을 넉넉하게 가져와서 필터링)
-            raw_articles = self.gdelt.search(current_params)
-
-            # 3. [스마트 필터링] 임베딩 유사도 검사
-            valid_articles = []
-            for article in raw_articles:
-                if article['url'] in all_collected_urls:
-                    continue
-
+        # [스마트 필터링] 임베딩 유사도 검사 (수신과 동시에 평가)
+        def is_relevant(article):
+            url = article['url']
+            if url not in relevance_scores:
                 # 제목이 없는 경우 소스로 대체
                 title = article.get('title') or article.get('source') or ''
 
                 # 유사도 계산 (주제 <-> 기사 제목)
-                score = 0.0
                 if topic_embedding:
                     article_embedding = self._get_embedding(title)
-                    score = self._calculate_similarity(topic_embedding, article_embedding)
-                else:
-                    score = 1.0  # 임베딩 실패 시 통과
-
-                # [필터링] 기준점(config.SIMILARITY_THRESHOLD) 이상만 합격
-                if score >= config.SIMILARITY_THRESHOLD:
-                    article['relevance_score'] = round(score, 3)
-                    valid_articles.append(article)
-                    all_collected_urls.add(article['url'])
-                    # print(f"   ✅ 합격 (유사도 {score:.3f}): {title[:50]}...")
+                    relevance_scores[url] = self._calculate_similarity(topic_embedding, article_embedding)
                 else:
-                    pass
-                    # print(f"   🗑️ 제외 (유사도 {score:.3f}): {title[:50]}...")
+                    relevance_scores[url] = 1.0  # 임베딩 실패 시 통과
+
+            score = relevance_scores[url]
+
+            # [필터링] 기준점(config.SIMILARITY_THRESHOLD) 이상만 합격
+            if score >= config.SIMILARITY_THRESHOLD:
+                article['relevance_score'] = round(score, 3)
+                return True
+            return False
+
+        # 1. 국가별 검색 파라미터로 질의 계획 수립 (동일 질의는 한 번만 실행)
+        plan = QueryPlan(self.gdelt)
+        for target in target_countries:
+            country_code = target.get('code', 'Unknown')
+            current_params = gdelt_base_params.copy()
+            current_params['locations'] = [country_code]  # GDELT Location 필터 활용
+            plan.add(country_code, current_params)
+
+        def run_query(params, keywords):
+            """제목 없는 후보(GKG/로컬 결과)는 보류했다가 <head> 메타데이터로 제목을 채운 뒤 평가"""
+            untitled = {}
+
+            def accept(article):
+                if not article.get('title'):
+                    untitled.setdefault(article['url'], article)
+                    return False
+                return is_relevant(article)
+
+            accepted = self.gdelt.search_adaptive(
+                params,
+                quota=config.COUNTRY_ARTICLE_QUOTA,
+                accept=accept,
+                merged_keywords=keywords,
+            )
+
+            if len(accepted) < config.COUNTRY_ARTICLE_QUOTA and untitled:
+                candidates = list(untitled.values())[:config.METADATA_PREFETCH_LIMIT]
+                self.metadata_fetcher.enrich(candidates)
+                accepted.extend(a for a in candidates if is_relevant(a))
+            return accepted
+
+        # 2. GDELT 점진 확장 검색 (최근 1주부터, 쿼터 부족 시에만 기간 확장)
+        results_by_country = plan.execute(run_query)
+
+        # 🔄 국가별 루프 실행
+        for target in target_countries:
+            country_code = target.get('code', 'Unknown')
+            role_desc = target.get('reason', '')
+
+            print(f"🌍 [{country_code}] 결과 정리 ({role_desc})...")
+
+            # 3. 다른 국가에서 이미 선택된 기사 제외
+            valid_articles = [
+                article for article in results_by_country.get(country_code, [])
+                if article['url'] not in all_collected_urls
+            ]
 
             # 관련성 점수 순으로 정렬 (높은 게 위로)
             valid_articles.sort(key=lambda x: x.get('relevance_score', 0), reverse=True)
+            # 최근 실패한 URL/차단 도메인은 제외하거나 뒤로 (쿼터를 다른 후보에 양보)
+            valid_articles = domain_scheduler.prioritize(valid_articles)
 
-            # 상위 5개만 선택 (쿼터제)
-            top_articles = valid_articles[:5]
+            # 상위 N개만 선택 (쿼터제)
+            top_articles = valid_articles[:config.COUNTRY_ARTICLE_QUOTA]
+            all_collected_urls.update(article['url'] for article in top_articles)
 
             # 4. 본문 추출 (병렬) + [New] 제목 번역
             if top_articles:
@@ -374,6 +574,27 @@ class AnalysisService:
 
         return final_response
 
+    def get_tone_timeline(self, search_params: dict):
+        """
+        국가별 보도량/톤 시계열 비교 (기사 추출·임베딩 없이 GDELT 집계만 사용)
+
+        get_global_perspectives와 같은 search_params(optimize-query 결과)를 받아
+        대상 국가별 일 단위 보도량과 평균 톤을 반환합니다.
+        """
+        gdelt_base_params = search_params.get('gdelt_params', {})
+        country_codes = [
+            c.get('code') for c in search_params.get('target_countries', []) if c.get('code')
+        ]
+
+        print(f"📈 국가별 톤 타임라인 조회: {country_codes}")
+        timelines = self.gdelt.tone_timeline(gdelt_base_params, country_codes)
+
+        return {
+            "status": "success",
+            "topic": search_params.get('topic_en', ''),
+            "data": timelines,
+        }
+
     # ==================================================================
     # 2️⃣ 2차 분석 (Find Sources) - AI 추론 없이 검색만 수행
     # ==================================================================
@@ -385,8 +606,9 @@ class AnalysisService:
         """
         all_results = []
         all_articles = []
+        planned_claims = []
 
-        # 각 주장별로 독립적인 검색 수행
+        # 각 주장별 검색 파라미터 정리
         for claim_data in claims_data:
             claim_kr = claim_data.get('claim_kr', '')
 
@@ -407,14 +629,24 @@ class AnalysisService:
                     'entities': [],
                     'locations': [],
                     'themes': [],
-                    'event_date': datetime.now().strftime('%Y-%m-%d')
                 }
                 print(f"🔍 '{claim_kr[:15]}...' 검색 (Legacy 모드: keywords={search_keywords})")
             else:
                 print(f"🔍 '{claim_kr[:15]}...' 검색 (5대 요소 모드)")
 
-            # GDELT 5대 요소 검색 실행
-            articles = self._search_real_articles_with_params(gdelt_params)
+            planned_claims.append((claim_kr, gdelt_params))
+
+        # 주장 간 동일한 하위 질의는 한 번만 실행 (QueryPlan)
+        plan = QueryPlan(self.gdelt)
+        for index, (_, gdelt_params) in enumerate(planned_claims):
+            plan.add(index, gdelt_params)
+        results_by_claim = plan.execute()
+
+        for index, (claim_kr, gdelt_params) in enumerate(planned_claims):
+            # GDELT 5대 요소 검색 결과로 본문 추출 (없으면 Google 폴백)
+            articles = self._search_real_articles_with_params(
+                gdelt_params, gdelt_results=results_by_claim.get(index, [])
+            )
 
             # 결과 구조화
             result_entry = {
@@ -434,20 +666,25 @@ class AnalysisService:
         # AI 분석 없이 검색 결과만 반환
         return {"results": all_results}, final_articles
 
-    def _search_real_articles_with_params(self, gdelt_params: dict):
+    def _search_real_articles_with_params(self, gdelt_params: dict, gdelt_results: list = None):
         """
         GDELT 5대 요소 검색 with Google Search Fallback
+
+        Args:
+            gdelt_params: GDELT 검색 파라미터
+            gdelt_results: QueryPlan으로 미리 실행한 검색 결과 (있으면 검색 생략)
         """
         if not gdelt_params:
             return []
 
         # 1️⃣ GDELT 5대 요소 검색 시도 (무료, 빠름, 글로벌)
-        print(f"📊 [1/2] GDELT 5대 요소 검색 중...")
-        gdelt_results = []
-        try:
-            gdelt_results = self.gdelt.search(gdelt_params)
-        except Exception as e:
-            print(f"⚠️ GDELT 검색 실패: {e}")
+        if gdelt_results is None:
+            print(f"📊 [1/2] GDELT 5대 요소 검색 중...")
+            gdelt_results = []
+            try:
+                gdelt_results = self.gdelt.search(gdelt_params)
+            except Exception as e:
+                print(f"⚠️ GDELT 검색 실패: {e}")
 
         # 2️⃣ 병렬 본문 추출 (ThreadPool 10개 워커)
         if gdelt_results:
@@ -479,7 +716,11 @@ class AnalysisService:
         병렬 처리로 기사 본문 추출 및 [New] 제목 번역 (ThreadPool)
         """
         extracted = []
-        extractor = self.extractors['article']
+
+        # 네트워크 작업 전에 캐시 일괄 조회 (코퍼스에서 본문을 받은 기사는 제외)
+        cached_articles = self.article_cache.get_many(
+            meta.get('url', '') for meta in articles_meta if not meta.get('content')
+        )
 
         def fetch_one(meta):
             """단일 기사 추출 (병렬 실행 함수)"""
@@ -488,10 +729,29 @@ class AnalysisService:
                 if not url or url == '#':
                     return None
 
-                # 제목과 본문 추출
-                result = extractor.extract_with_title(url)
-                title = result.get('title', '')
-                content = result.get('content', '')
+                # 코퍼스에서 온 기사는 본문/번역을 이미 보유 (fetch/parse 생략)
+                from_corpus = bool(meta.get('content'))
+
+                cached = cached_articles.get(url)
+
+                if from_corpus:
+                    title = meta.get('title', '')
+                    content = meta['content']
+                elif cached and cached.is_fresh:
+                    # 신선한 캐시: 요청 없이 재사용
+                    title, content = cached.title, cached.content
+                else:
+                    # 다른 요청이 같은 기사를 추출 중이면 새로 받지 않고 결과 공유
+                    shared = article_fetches.run(
+                        canonical_url(url),
+                        lambda: self._fetch_article(url, cached),
+                        timeout=config.INFLIGHT_WAIT_TIMEOUT_SEC,
+                    )
+                    if not shared:
+                        return None
+                    title, content = shared['title'], shared['content']
+                    if shared.get('title_kr') and not meta.get('title_kr'):
+                        meta['title_kr'] = shared['title_kr']
 
                 # 너무 짧으면 무시
                 if not content or len(content) < 100:
@@ -501,11 +761,19 @@ class AnalysisService:
                 meta['title'] = title if title else meta.get('source', 'No title')  # 제목이 없으면 출처를 제목으로
                 
                 # [New] 제목 한국어 번역 수행 (병렬 처리의 이점 활용)
-                meta['title_kr'] = self._translate_to_korean(meta['title'])
+                if not meta.get('title_kr'):
+                    meta['title_kr'] = self._translate_to_korean(meta['title'])
                 
                 meta['content'] = content
                 meta['snippet'] = content[:500]  # 미리보기
 
+                # 새로 추출한 기사는 코퍼스에 보관 (다음 검색에서 재사용)
+                if self.corpus and not from_corpus:
+                    try:
+                        self.corpus.add(meta)
+                    except Exception as e:
+                        print(f"⚠️ 코퍼스 저장 실패: {e}")
+
                 # 언론사 정보 추가 (국가/출처 기반)
                 media_info = get_media_credibility(
                     meta.get('source', ''),
@@ -524,9 +792,12 @@ class AnalysisService:
                 print(f"⚠️ 추출 실패: {meta.get('url', 'unknown')} - {e}")
                 return None
 
-        # ThreadPool 병렬 실행
+        # ThreadPool 병렬 실행 (도메인 라운드로빈 순서로 제출해 도메인 대기로 워커가 묶이지 않도록)
         with ThreadPoolExecutor(max_workers=config.THREAD_POOL_WORKERS) as executor:
-            futures = [executor.submit(fetch_one, item) for item in articles_meta]
+            futures = [
+                executor.submit(fetch_one, item)
+                for item in domain_scheduler.interleave(articles_meta)
+            ]
 
             for future in as_completed(futures):
                 result = future.result()
@@ -535,6 +806,61 @@ class AnalysisService:
 
         return extracted
 
+    def _fetch_article(self, url: str, cached=None):
+        """
+        기사 1건 다운로드 + 파싱 + 제목 번역 (요청 간 공유되는 단위 작업)
+
+        Args:
+            url: 기사 URL
+            cached: 만료된 ArticleContentCache 항목 (있으면 조건부 요청으로 재검증)
+
+        Returns:
+            {'title', 'content', 'title_kr'} 또는 None (건너뜀/본문 부족)
+        """
+        extractor = self.extractors['article']
+
+        skip_reason = domain_scheduler.skip_reason(url)
+        if skip_reason:
+            print(f"⏭️ 최근 실패 이력으로 건너뜀 ({skip_reason}): {url}")
+            return None
+
+        # 제목과 본문 추출 (만료된 캐시는 조건부 요청으로 재검증)
+        with domain_scheduler.slot(url):
+            result = extractor.extract_with_title(
+                url, validators=cached.validators if cached else None
+            )
+
+        if result.get('unsupported'):
+            domain_scheduler.record_failure(url, FAILURE_UNSUPPORTED)
+        elif result.get('not_modified') or len(result.get('content', '')) >= 100:
+            domain_scheduler.record_success(url)
+        else:
+            domain_scheduler.record_failure(url, classify_failure(
+                result.get('status', 0), fetch_failed='error' in result
+            ))
+
+        if cached and result.get('not_modified'):
+            self.article_cache.touch(url)
+            title, content = cached.title, cached.content
+        else:
+            title = result.get('title', '')
+            content = result.get('content', '')
+            if content and len(content) >= 100:
+                self.article_cache.set(
+                    url, title, content,
+                    etag=result.get('etag', ''),
+                    last_modified=result.get('last_modified', ''),
+                )
+
+        if not content or len(content) < 100:
+            return None
+
+        return {
+            'title': title,
+            'content': content,
+            'title_kr': self._translate_to_korean(title) if title else '',
+        }
+
     def _search_google_fallback(self, keywords: list, target_countries: list = None):
         """Google Search 폴백 (GDELT 실패 시)"""
         if not keywords:
@@ -600,10 +926,17 @@ class AnalysisService:
             return []
 
     # --- 캐시 및 유틸리티 ---
+    @staticmethod
+    def _cache_key(url: str) -> str:
+        """분석 캐시 키 (유튜브는 영상 ID, 기사는 정규화 URL 기준)"""
+        video_id = extract_video_id(url)
+        canonical = f"youtube:{video_id}" if video_id else canonical_url(url)
+        return hashlib.md5(canonical.encode()).hexdigest()
+
     def _get_cache(self, url: str):
         if not db: return None
         try:
-            cache_key = hashlib.md5(url.encode()).hexdigest()
+            cache_key = self._cache_key(url)
             doc = db.collection('cache').document(cache_key).get()
             if doc.exists:
                 print(f"✅ 캐시 히트: {url[:30]}...")
@@ -611,10 +944,25 @@ class AnalysisService:
         except: pass
         return None
 
+    def _get_cache_many(self, urls: list) -> dict:
+        """분석 캐시 일괄 조회 → {url: result} (히트만 포함)"""
+        if not db or not urls: return {}
+        try:
+            keys = {self._cache_key(url): url for url in urls}
+            refs = [db.collection('cache').document(key) for key in keys]
+            return {
+                keys[doc.id]: doc.to_dict().get('result')
+                for doc in db.get_all(refs)
+                if doc.exists and doc.to_dict().get('result')
+            }
+        except Exception as e:
+            print(f"⚠️ 캐시 일괄 조회 실패: {e}")
+            return {}
+
     def _set_cache(self, url: str, result):
         if not db: return
         try:
-            cache_key = hashlib.md5(url.encode()).hexdigest()
+            cache_key = self._cache_key(url)
             db.collection('cache').document(cache_key).set({
                 'url': url, 'result': result, 'cached_at': datetime.now()
             })
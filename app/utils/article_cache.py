@@ -0,0 +1,189 @@
+"""
+Article Content Cache - 추출된 기사 제목/본문의 영구 캐시 (Firestore)
+
+[문제]
+같은 GDELT URL이 사용자/국가를 넘나들며 반복 추출되지만, 추출 결과가 남지 않아
+매번 요청 + 파싱을 다시 수행합니다.
+
+[동작]
+- 키: 정규화 URL(canonical_url)의 해시 (추적 파라미터/fragment 제거, 쿼리 정렬)
+- 값: 제목 + zlib 압축 본문(최대 ARTICLE_CACHE_MAX_CHARS자) + ETag/Last-Modified
+- 신선도: 마지막 검증 후 ARTICLE_CACHE_TTL_SEC 이내면 그대로 사용
+- 만료 후: If-None-Match / If-Modified-Since 조건부 요청 → 304면 본문 재사용 (touch)
+- get_many(): Firestore get_all로 여러 URL을 한 번에 조회 (네트워크 작업 전 일괄 확인)
+- 보관 기간: expires_at 필드 (Firestore TTL 정책으로 자동 삭제)
+"""
+import zlib
+import hashlib
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from app.config import config
+
+
+# 기사 식별과 무관한 추적 파라미터
+_TRACKING_PARAMS = frozenset({
+    'fbclid', 'gclid', 'dclid', 'msclkid', 'yclid', 'mc_cid', 'mc_eid',
+    'ocid', 'cmpid', 'ref', 'ref_src', 'smid', 'spm', 'igshid', 'share', 'from',
+})
+
+
+def canonical_url(url: str) -> str:
+    """
+    캐시/중복 제거용 정규화 URL
+
+    예: "HTTPS://www.BBC.com/news/a?utm_source=x&b=2&a=1#top" → "https://www.bbc.com/news/a?a=1&b=2"
+    """
+    if not url:
+        return ''
+    try:
+        parts = urlsplit(url.strip())
+    except ValueError:
+        return url.strip()
+
+    netloc = parts.netloc.lower()
+    if netloc.endswith(':80') and parts.scheme == 'http':
+        netloc = netloc[:-3]
+    elif netloc.endswith(':443') and parts.scheme == 'https':
+        netloc = netloc[:-4]
+
+    query = sorted(
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if not k.lower().startswith('utm_') and k.lower() not in _TRACKING_PARAMS
+    )
+    path = parts.path or '/'
+    if len(path) > 1:
+        path = path.rstrip('/')
+
+    return urlunsplit((parts.scheme.lower(), netloc, path, urlencode(query), ''))
+
+
+def url_cache_key(url: str) -> str:
+    """정규화 URL → Firestore 문서 ID"""
+    return hashlib.md5(canonical_url(url).encode()).hexdigest()
+
+
+@dataclass
+class CachedArticle:
+    """캐시 항목"""
+    url: str
+    title: str
+    content: str
+    etag: str = ''
+    last_modified: str = ''
+    validated_at: Optional[datetime] = None
+
+    @property
+    def is_fresh(self) -> bool:
+        """검증 후 TTL 이내인지 (만료되면 조건부 요청으로 재검증)"""
+        if not self.validated_at:
+            return False
+        # Firestore는 UTC(timezone-aware)로 반환
+        now = datetime.now(timezone.utc) if self.validated_at.tzinfo else datetime.now()
+        return now - self.validated_at < timedelta(seconds=config.ARTICLE_CACHE_TTL_SEC)
+
+    @property
+    def validators(self) -> Dict[str, str]:
+        """조건부 요청 헤더"""
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+
+class ArticleContentCache:
+    """Firestore 기반 기사 본문 캐시 (db가 None이면 항상 miss)"""
+
+    COLLECTION = 'article_cache'
+
+    def __init__(self, db=None):
+        self.db = db
+
+    def is_available(self) -> bool:
+        return self.db is not None
+
+    def get_many(self, urls: Iterable[str]) -> Dict[str, CachedArticle]:
+        """
+        여러 URL 일괄 조회 (Firestore get_all 1회)
+
+        Returns:
+            {원본 URL: CachedArticle} (캐시에 있는 URL만)
+        """
+        if not self.db:
+            return {}
+
+        key_to_urls: Dict[str, list] = {}
+        for url in urls:
+            if url:
+                key_to_urls.setdefault(url_cache_key(url), []).append(url)
+        if not key_to_urls:
+            return {}
+
+        found: Dict[str, CachedArticle] = {}
+        try:
+            collection = self.db.collection(self.COLLECTION)
+            refs = [collection.document(key) for key in key_to_urls]
+            for snapshot in self.db.get_all(refs):
+                if not snapshot.exists:
+                    continue
+                entry = self._from_doc(snapshot.to_dict())
+                if entry:
+                    for url in key_to_urls.get(snapshot.id, []):
+                        found[url] = entry
+        except Exception as e:
+            print(f"⚠️ [ArticleCache] 일괄 조회 실패: {e}")
+            return {}
+
+        print(f"💾 [ArticleCache] {len(found)}/{len(key_to_urls)}개 캐시 히트")
+        return found
+
+    def set(self, url: str, title: str, content: str, etag: str = '', last_modified: str = '') -> None:
+        """추출 결과 저장 (본문은 최대 길이로 자른 뒤 압축)"""
+        if not self.db or not content:
+            return
+        try:
+            now = datetime.now(timezone.utc)
+            body = content[:config.ARTICLE_CACHE_MAX_CHARS].encode('utf-8')
+            self.db.collection(self.COLLECTION).document(url_cache_key(url)).set({
+                'url': canonical_url(url),
+                'title': title or '',
+                'content_z': zlib.compress(body, 6),
+                'etag': etag or '',
+                'last_modified': last_modified or '',
+                'validated_at': now,
+                'expires_at': now + timedelta(days=config.ARTICLE_CACHE_RETENTION_DAYS),
+            })
+        except Exception as e:
+            print(f"⚠️ [ArticleCache] 저장 실패: {e}")
+
+    def touch(self, url: str) -> None:
+        """304 응답으로 재검증된 항목의 신선도 갱신"""
+        if not self.db:
+            return
+        try:
+            now = datetime.now(timezone.utc)
+            self.db.collection(self.COLLECTION).document(url_cache_key(url)).update({
+                'validated_at': now,
+                'expires_at': now + timedelta(days=config.ARTICLE_CACHE_RETENTION_DAYS),
+            })
+        except Exception as e:
+            print(f"⚠️ [ArticleCache] 갱신 실패: {e}")
+
+    @staticmethod
+    def _from_doc(data: dict) -> Optional[CachedArticle]:
+        try:
+            content = zlib.decompress(data['content_z']).decode('utf-8')
+        except Exception:
+            return None
+        return CachedArticle(
+            url=data.get('url', ''),
+            title=data.get('title', ''),
+            content=content,
+            etag=data.get('etag', ''),
+            last_modified=data.get('last_modified', ''),
+            validated_at=data.get('validated_at'),
+        )
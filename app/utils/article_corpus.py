@@ -0,0 +1,227 @@
+"""
+Article Corpus - 추출에 성공한 기사 본문을 보관하는 로컬 전문 검색 저장소
+
+[Architecture]
+- Store: _extract_contents_parallel이 추출한 기사(제목/본문/출처/국가/날짜)를 SQLite에 저장
+- Index: SQLite FTS5 (title, content) + BM25 랭킹
+- Query: ArticleCorpusStrategy가 GDELT보다 먼저 조회 → 반복/연관 질의는 fetch/parse 없이 응답
+- Retention: 보관 기간(ARTICLE_CORPUS_RETENTION_DAYS) + 최대 문서 수(ARTICLE_CORPUS_MAX_DOCS)
+  초과분은 주기적 compaction에서 삭제 후 FTS 색인 최적화
+"""
+
+import os
+import re
+import time
+import sqlite3
+import threading
+from typing import Dict, List, Optional
+
+from app.config import config
+
+
+_TOKEN_PATTERN = re.compile(r'\W+', re.UNICODE)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS docs (
+    id INTEGER PRIMARY KEY,
+    url TEXT NOT NULL UNIQUE,
+    title TEXT,
+    title_kr TEXT,
+    content TEXT,
+    source TEXT,
+    country TEXT,
+    date TEXT,
+    stored_at REAL
+);
+CREATE INDEX IF NOT EXISTS idx_docs_stored_at ON docs(stored_at);
+CREATE INDEX IF NOT EXISTS idx_docs_country ON docs(country);
+CREATE VIRTUAL TABLE IF NOT EXISTS docs_fts USING fts5(
+    title, content,
+    content='docs', content_rowid='id'
+);
+CREATE TRIGGER IF NOT EXISTS docs_ai AFTER INSERT ON docs BEGIN
+    INSERT INTO docs_fts(rowid, title, content) VALUES (new.id, new.title, new.content);
+END;
+CREATE TRIGGER IF NOT EXISTS docs_ad AFTER DELETE ON docs BEGIN
+    INSERT INTO docs_fts(docs_fts, rowid, title, content)
+    VALUES ('delete', old.id, old.title, old.content);
+END;
+CREATE TRIGGER IF NOT EXISTS docs_au AFTER UPDATE ON docs BEGIN
+    INSERT INTO docs_fts(docs_fts, rowid, title, content)
+    VALUES ('delete', old.id, old.title, old.content);
+    INSERT INTO docs_fts(rowid, title, content) VALUES (new.id, new.title, new.content);
+END;
+"""
+
+
+def _to_fts_clause(keyword: str) -> str:
+    """키워드를 FTS5 조건으로 변환 ("trade war" → ("trade" AND "war"))"""
+    tokens = [t for t in _TOKEN_PATTERN.split(keyword.lower()) if t]
+    if not tokens:
+        return ''
+    return '(' + ' AND '.join(f'"{t}"' for t in tokens) + ')'
+
+
+class ArticleCorpus:
+    """추출 기사 전문 저장소 (SQLite FTS5 + BM25, 스레드 안전)"""
+
+    # compaction 실행 주기 (저장 N건마다)
+    COMPACT_EVERY = 200
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._writes_since_compact = 0
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+
+    def add(self, article: Dict) -> bool:
+        """
+        추출된 기사 저장 (같은 URL이면 최신 내용으로 갱신)
+
+        Args:
+            article: {'url', 'title', 'content', 'source', 'country', 'date', 'title_kr'(선택)}
+        """
+        url = article.get('url', '')
+        content = article.get('content', '')
+        if not url or not content:
+            return False
+
+        with self._lock:
+            self._conn.execute(
+                'INSERT INTO docs(url, title, title_kr, content, source, country, date, stored_at) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?, ?) '
+                'ON CONFLICT(url) DO UPDATE SET '
+                'title=excluded.title, title_kr=excluded.title_kr, content=excluded.content, '
+                'source=excluded.source, country=excluded.country, date=excluded.date, '
+                'stored_at=excluded.stored_at',
+                (
+                    url,
+                    article.get('title', ''),
+                    article.get('title_kr', ''),
+                    content,
+                    article.get('source', ''),
+                    article.get('country', 'Unknown'),
+                    article.get('date', ''),
+                    time.time(),
+                )
+            )
+            self._conn.commit()
+            self._writes_since_compact += 1
+            should_compact = self._writes_since_compact >= self.COMPACT_EVERY
+
+        if should_compact:
+            self.compact()
+        return True
+
+    def search(
+        self,
+        keywords: List[str],
+        countries: Optional[List[str]] = None,
+        max_age_days: Optional[int] = None,
+        limit: int = 20,
+    ) -> List[Dict]:
+        """
+        키워드(OR) BM25 검색
+
+        Args:
+            keywords: 검색 키워드 (각 키워드 내 단어는 AND)
+            countries: 국가 코드 필터 (선택)
+            max_age_days: 저장 후 경과일 제한 (기본값: 보관 기간)
+
+        Returns:
+            기사 딕셔너리 리스트 (관련도순, 'score'는 BM25 점수로 작을수록 관련도 높음)
+        """
+        clauses = [c for c in (_to_fts_clause(kw) for kw in keywords) if c]
+        if not clauses:
+            return []
+
+        max_age_days = max_age_days or config.ARTICLE_CORPUS_RETENTION_DAYS
+        sql = [
+            'SELECT d.url, d.title, d.title_kr, d.content, d.source, d.country, d.date,',
+            'bm25(docs_fts, 2.0, 1.0) AS score',
+            'FROM docs_fts JOIN docs d ON d.id = docs_fts.rowid',
+            'WHERE docs_fts MATCH ? AND d.stored_at >= ?',
+        ]
+        args: list = [' OR '.join(clauses), time.time() - max_age_days * 86400]
+
+        if countries:
+            sql.append(f"AND d.country IN ({','.join('?' * len(countries))})")
+            args.extend(countries)
+
+        sql.append('ORDER BY score LIMIT ?')
+        args.append(limit)
+
+        with self._lock:
+            rows = self._conn.execute(' '.join(sql), args).fetchall()
+
+        return [
+            {
+                'url': url,
+                'title': title or '',
+                'title_kr': title_kr or '',
+                'content': content or '',
+                'source': source or 'Unknown',
+                'country': country or 'Unknown',
+                'date': date or '',
+                'score': score,
+            }
+            for url, title, title_kr, content, source, country, date, score in rows
+        ]
+
+    def compact(self) -> int:
+        """보관 기간/최대 문서 수를 넘는 문서 삭제 후 FTS 색인 병합"""
+        cutoff = time.time() - config.ARTICLE_CORPUS_RETENTION_DAYS * 86400
+
+        with self._lock:
+            removed = self._conn.execute(
+                'DELETE FROM docs WHERE stored_at < ?', (cutoff,)
+            ).rowcount
+            removed += self._conn.execute(
+                'DELETE FROM docs WHERE id IN ('
+                '  SELECT id FROM docs ORDER BY stored_at DESC LIMIT -1 OFFSET ?'
+                ')',
+                (config.ARTICLE_CORPUS_MAX_DOCS,)
+            ).rowcount
+            self._conn.execute("INSERT INTO docs_fts(docs_fts) VALUES ('optimize')")
+            self._conn.commit()
+            self._writes_since_compact = 0
+
+        if removed:
+            print(f"🗑️ [Corpus] {removed}개 오래된 기사 정리")
+        return removed
+
+    def count(self) -> int:
+        with self._lock:
+            return self._conn.execute('SELECT COUNT(*) FROM docs').fetchone()[0]
+
+
+# ============================================================
+# Shared instance
+# ============================================================
+
+_corpus: Optional[ArticleCorpus] = None
+_corpus_lock = threading.Lock()
+
+
+def get_article_corpus() -> Optional[ArticleCorpus]:
+    """config.ARTICLE_CORPUS_PATH가 설정된 경우 공유 코퍼스 반환 (미설정 시 None)"""
+    global _corpus
+
+    if not config.ARTICLE_CORPUS_PATH:
+        return None
+
+    with _corpus_lock:
+        if _corpus is None:
+            try:
+                _corpus = ArticleCorpus(config.ARTICLE_CORPUS_PATH)
+                print(f"✅ [Corpus] 기사 코퍼스 연결: {config.ARTICLE_CORPUS_PATH}")
+            except Exception as e:
+                print(f"⚠️ [Corpus] 기사 코퍼스 열기 실패: {e}")
+                return None
+    return _corpus
@@ -0,0 +1,168 @@
+"""
+Domain Scheduler - 기사 수집 도메인별 예의(politeness) 제어 + 실패 기억
+
+[문제]
+_extract_contents_parallel이 도메인 구분 없이 최대 20개 요청을 동시에 보내
+reuters.com 같은 언론사에서 자주 차단(403/429)되고, 봇을 항상 차단하는
+도메인도 매 요청마다 다시 시도합니다.
+
+[동작]
+- slot(url): 도메인별 동시 요청 수(DOMAIN_MAX_CONCURRENCY) + 요청 시작 간 최소 간격 적용
+- record_failure(): 실패 URL(재시도 생략)과 도메인별 실패 점수를 만료 시간과 함께 기록
+  · 403/401/451(봇 차단), 429(요청 제한): 도메인 점수 크게 증가
+  · 본문 부족(페이월 등), 404/410, 기타 오류: 점수 1 증가
+  · URL 재시도 생략: 차단/없는 페이지/본문 부족/미지원은 URL_FAILURE_TTL_SEC,
+    429·타임아웃·5xx 같은 일시적 오류는 URL_TRANSIENT_FAILURE_TTL_SEC만
+- record_success(): 도메인 점수 초기화
+- prioritize(): 실패 URL/차단 도메인 제외, 점수 있는 도메인은 뒤로 (쿼터를 다른 후보에 양보)
+- interleave(): 도메인 라운드로빈 순서로 재배열 (한 도메인 대기로 워커가 묶이지 않도록)
+"""
+import time
+import threading
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+
+from app.config import config
+from app.models.domain_index import registrable_domain
+from app.utils.cache import TTLCache
+
+
+# 실패 사유
+FAILURE_BLOCKED = 'blocked'  # 401/403/451
+FAILURE_THROTTLED = 'throttled'  # 429
+FAILURE_GONE = 'gone'  # 404/410
+FAILURE_SHORT = 'short'  # 본문 부족 (페이월, 동의 화면 등)
+FAILURE_ERROR = 'error'  # 타임아웃, 연결 오류, 5xx
+FAILURE_UNSUPPORTED = 'unsupported'  # HTML이 아닌 응답 (URL만 기록, 도메인 점수 없음)
+
+# 다시 시도하면 성공할 수 있는 실패 → URL은 짧게만 건너뜀
+TRANSIENT_FAILURES = (FAILURE_THROTTLED, FAILURE_ERROR)
+
+
+def classify_failure(status_code: int = 0, fetch_failed: bool = False) -> str:
+    """
+    실패 사유 분류
+
+    Args:
+        status_code: HTTP 상태 코드 (응답이 없으면 0)
+        fetch_failed: 요청 자체가 실패했는지 (False면 응답은 받았으나 본문 부족)
+    """
+    if status_code in (401, 403, 451):
+        return FAILURE_BLOCKED
+    if status_code == 429:
+        return FAILURE_THROTTLED
+    if status_code in (404, 410):
+        return FAILURE_GONE
+    return FAILURE_ERROR if fetch_failed else FAILURE_SHORT
+
+
+class DomainScheduler:
+    """도메인별 동시성/간격 제한 + 만료되는 실패 기록 (스레드 안전)"""
+
+    def __init__(
+        self,
+        max_per_domain: Optional[int] = None,
+        min_interval: Optional[float] = None,
+    ):
+        self.max_per_domain = max_per_domain or config.DOMAIN_MAX_CONCURRENCY
+        self.min_interval = config.DOMAIN_MIN_INTERVAL if min_interval is None else min_interval
+        self._lock = threading.Lock()
+        self._semaphores: Dict[str, threading.BoundedSemaphore] = {}
+        self._next_start: Dict[str, float] = {}
+        # 도메인 → 실패 점수, URL → 실패 사유
+        self._domain_strikes = TTLCache(max_size=4096, ttl=config.DOMAIN_FAILURE_TTL_SEC)
+        self._failed_urls = TTLCache(max_size=20000, ttl=config.URL_FAILURE_TTL_SEC)
+
+    def _semaphore(self, domain: str) -> threading.BoundedSemaphore:
+        with self._lock:
+            semaphore = self._semaphores.get(domain)
+            if semaphore is None:
+                semaphore = threading.BoundedSemaphore(self.max_per_domain)
+                self._semaphores[domain] = semaphore
+            return semaphore
+
+    @contextmanager
+    def slot(self, url: str):
+        """도메인 요청 슬롯 (동시 요청 수 + 최소 간격)"""
+        domain = registrable_domain(url)
+        semaphore = self._semaphore(domain)
+        semaphore.acquire()
+        try:
+            # 시작 시각을 예약해 대기 중인 요청끼리도 간격 유지
+            with self._lock:
+                now = time.monotonic()
+                start_at = max(now, self._next_start.get(domain, 0.0))
+                self._next_start[domain] = start_at + self.min_interval
+            if start_at > now:
+                time.sleep(start_at - now)
+            yield
+        finally:
+            semaphore.release()
+
+    def record_failure(self, url: str, reason: str) -> None:
+        """실패 기록 (URL은 재시도 생략, 도메인은 점수 누적)"""
+        domain = registrable_domain(url)
+        if reason in TRANSIENT_FAILURES:
+            self._failed_urls.set(url, reason, ttl=config.URL_TRANSIENT_FAILURE_TTL_SEC)
+        else:
+            self._failed_urls.set(url, reason)
+        if reason == FAILURE_UNSUPPORTED:
+            return
+
+        if reason == FAILURE_THROTTLED:
+            weight = config.DOMAIN_FAILURE_THRESHOLD  # 즉시 쿨다운
+        elif reason == FAILURE_BLOCKED:
+            weight = 2
+        else:
+            weight = 1
+
+        with self._lock:
+            strikes = self._domain_strikes.get(domain, 0) + weight
+            self._domain_strikes.set(domain, strikes)
+
+        if strikes >= config.DOMAIN_FAILURE_THRESHOLD:
+            print(f"🚫 [Scheduler] {domain} 일시 제외 ({reason}, 점수 {strikes})")
+
+    def record_success(self, url: str) -> None:
+        self._domain_strikes.pop(registrable_domain(url))
+
+    def skip_reason(self, url: str) -> Optional[str]:
+        """최근 실패한 URL 또는 차단된 도메인이면 사유 반환"""
+        reason = self._failed_urls.get(url)
+        if reason:
+            return reason
+        if self._domain_strikes.get(registrable_domain(url), 0) >= config.DOMAIN_FAILURE_THRESHOLD:
+            return FAILURE_BLOCKED
+        return None
+
+    def prioritize(self, articles: List[Dict]) -> List[Dict]:
+        """
+        후보 정렬: 건너뛸 기사 제외, 실패 이력 도메인은 뒤로 (기존 순서는 유지)
+
+        쿼터를 자르기 전에 호출하면 차단된 기사 대신 다음 후보가 선택됩니다.
+        """
+        usable = [a for a in articles if a.get('content') or not self.skip_reason(a.get('url', ''))]
+        return sorted(
+            usable,
+            key=lambda a: 0 if a.get('content') else self._domain_strikes.get(
+                registrable_domain(a.get('url', '')), 0
+            ),
+        )
+
+    @staticmethod
+    def interleave(articles: List[Dict]) -> List[Dict]:
+        """도메인 라운드로빈 순서로 재배열"""
+        by_domain: Dict[str, List[Dict]] = {}
+        for article in articles:
+            by_domain.setdefault(registrable_domain(article.get('url', '')), []).append(article)
+
+        ordered = []
+        queues = list(by_domain.values())
+        while queues:
+            ordered.extend(queue.pop(0) for queue in queues)
+            queues = [queue for queue in queues if queue]
+        return ordered
+
+
+# 프로세스 공유 스케줄러
+domain_scheduler = DomainScheduler()
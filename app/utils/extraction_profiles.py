@@ -0,0 +1,141 @@
+"""
+Extraction Profiles - 도메인별 본문 추출 경로 학습 (fast path)
+
+[문제]
+모든 기사가 trafilatura → 본문 후보 태그 탐색의 동일한 범용 경로를 거칩니다.
+같은 언론사의 기사는 대부분 같은 템플릿이라 본문 위치가 고정되어 있습니다.
+
+[동작]
+1. 학습: 일반 경로가 성공하면 파서가 본문 컨테이너 XPath(selector)를 보고
+   → 같은 selector가 서로 다른 기사에서 PROFILE_CONFIRMATIONS번 관측되면 프로필 활성화
+   (기사별 ID 등 우연한 selector로 고정되는 것을 방지)
+2. fast path: 활성 프로필이 있으면 파서가 trafilatura 없이 XPath 노드 텍스트를 바로 사용
+3. 재학습: fast path 본문이 부족해 일반 경로로 폴백된 횟수가 PROFILE_MAX_MISSES에
+   도달하면 프로필 삭제 → 다음 기사부터 다시 학습
+
+[저장]
+- 도메인당 {'xpath', 'hits', 'misses'} 수준의 작은 딕셔너리
+- EXTRACTION_PROFILES_PATH가 설정되면 JSON 파일로 주기적 저장 (재시작 후에도 유지)
+"""
+import os
+import json
+import time
+import threading
+from typing import Dict, Optional
+
+from app.config import config
+from app.models.article_parser import STRATEGY_PROFILE
+from app.models.domain_index import registrable_domain
+
+
+class ExtractionProfileStore:
+    """도메인 → 본문 XPath 프로필 (스레드 안전)"""
+
+    # N번 갱신마다 파일 저장
+    SAVE_EVERY = 20
+
+    def __init__(self, path: str = ''):
+        self.path = path
+        self._lock = threading.Lock()
+        self._profiles: Dict[str, Dict] = {}  # 활성 프로필
+        self._candidates: Dict[str, Dict] = {}  # 도메인 → {selector: 관측 횟수}
+        self._dirty = 0
+
+        if path and os.path.exists(path):
+            try:
+                with open(path, encoding='utf-8') as f:
+                    self._profiles = json.load(f)
+                print(f"✅ (Profiles) 추출 프로필 {len(self._profiles)}개 로드")
+            except Exception as e:
+                print(f"⚠️ (Profiles) 추출 프로필 로드 실패: {e}")
+
+    def fast_path(self, url: str) -> Optional[str]:
+        """도메인의 활성 프로필 XPath (없으면 None)"""
+        profile = self._profiles.get(registrable_domain(url))
+        return profile['xpath'] if profile else None
+
+    def observe(self, url: str, used_xpath: Optional[str], strategy: str, selector: str) -> None:
+        """
+        파싱 결과 기록
+
+        Args:
+            url: 기사 URL
+            used_xpath: 파싱에 전달한 프로필 XPath (없으면 None)
+            strategy: 본문을 만든 경로 (article_parser.STRATEGY_*)
+            selector: 파서가 보고한 본문 컨테이너 XPath
+        """
+        domain = registrable_domain(url)
+        if not domain:
+            return
+
+        with self._lock:
+            if used_xpath:
+                profile = self._profiles.get(domain)
+                if not profile or profile['xpath'] != used_xpath:
+                    return
+                if strategy == STRATEGY_PROFILE:
+                    profile['hits'] += 1
+                    profile['misses'] = 0
+                else:
+                    profile['misses'] += 1
+                    if profile['misses'] >= config.PROFILE_MAX_MISSES:
+                        del self._profiles[domain]
+                        print(f"🔁 (Profiles) {domain} 프로필 폐기, 재학습 ({used_xpath})")
+                self._dirty += 1
+
+            elif selector:
+                seen = self._candidates.setdefault(domain, {})
+                seen[selector] = seen.get(selector, 0) + 1
+                if seen[selector] >= config.PROFILE_CONFIRMATIONS:
+                    self._profiles[domain] = {
+                        'xpath': selector,
+                        'hits': 0,
+                        'misses': 0,
+                        'learned_at': int(time.time()),
+                    }
+                    self._candidates.pop(domain, None)
+                    self._dirty += 1
+                    print(f"📐 (Profiles) {domain} 프로필 학습: {selector}")
+
+            should_save = self.path and self._dirty >= self.SAVE_EVERY
+
+        if should_save:
+            self.save()
+
+    def save(self) -> None:
+        """JSON 파일로 저장 (임시 파일 교체 방식)"""
+        if not self.path:
+            return
+        with self._lock:
+            snapshot = json.dumps(self._profiles, ensure_ascii=False)
+            self._dirty = 0
+        try:
+            directory = os.path.dirname(os.path.abspath(self.path))
+            os.makedirs(directory, exist_ok=True)
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(snapshot)
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            print(f"⚠️ (Profiles) 추출 프로필 저장 실패: {e}")
+
+    def __len__(self) -> int:
+        return len(self._profiles)
+
+
+# ============================================================
+# Shared instance
+# ============================================================
+
+_store: Optional[ExtractionProfileStore] = None
+_store_lock = threading.Lock()
+
+
+def get_profile_store() -> ExtractionProfileStore:
+    """프로세스 공유 프로필 저장소"""
+    global _store
+
+    with _store_lock:
+        if _store is None:
+            _store = ExtractionProfileStore(config.EXTRACTION_PROFILES_PATH)
+    return _store
@@ -0,0 +1,396 @@
+"""
+GDELT Local Mirror - GKG/Mentions 15분 export 파일 로컬 색인 저장소
+
+[Architecture]
+- Ingestion: GDELT 2.0 15분 단위 export 파일(*.gkg.csv.zip, *.mentions.CSV.zip)을
+  원격(data.gdeltproject.org) 또는 로컬 사본에서 읽어 SQLite에 적재
+- Index: SQLite FTS5 (URL 토큰 + 페이지 제목 + 위치명) + date/domain 인덱스
+- Query: GDELTLocalStrategy가 밀리초 단위로 조회 (원격 API는 miss 시에만 사용)
+
+[사용법]
+store = GDELTLocalStore('/data/gdelt_local.db')
+store.ingest_file('20240501120000.gkg.csv.zip')
+rows = store.search(['trade war'], start=datetime(2024, 4, 17), limit=50)
+
+파일 단위로 적재 이력을 기록하므로 동일 파일을 여러 번 넣어도 중복 적재되지 않습니다.
+"""
+
+import io
+import os
+import re
+import csv
+import sqlite3
+import zipfile
+import threading
+import requests
+from typing import Dict, Iterator, List, Optional
+from datetime import datetime, timedelta
+from urllib.parse import urlparse
+
+from app.config import config
+
+
+# GKG/Mentions 레코드는 한 필드가 매우 길 수 있음 (V2GCAM 등)
+csv.field_size_limit(1 << 24)
+
+# GDELT 2.0 GKG 컬럼 위치 (V2.1 기준)
+_GKG_DATE = 1
+_GKG_SOURCE = 3
+_GKG_URL = 4
+_GKG_LOCATIONS = 9
+_GKG_TONE = 15
+_GKG_EXTRAS = 26
+
+# GDELT 2.0 Mentions 컬럼 위치
+_MENTION_DATE = 2
+_MENTION_SOURCE = 4
+_MENTION_URL = 5
+_MENTION_TONE = 13
+
+_TITLE_PATTERN = re.compile(r'<PAGE_TITLE>(.*?)</PAGE_TITLE>', re.DOTALL)
+_TOKEN_PATTERN = re.compile(r'[^0-9a-zA-Z]+')
+# export 파일 이름의 15분 구간 시각 (예: .../20240501120000.gkg.csv.zip)
+_EXPORT_TIMESTAMP = re.compile(r'/(\d{14})\.')
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS articles (
+    id INTEGER PRIMARY KEY,
+    url TEXT NOT NULL UNIQUE,
+    domain TEXT,
+    date INTEGER,
+    tone REAL,
+    country TEXT,
+    title TEXT,
+    url_tokens TEXT,
+    locations TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_articles_date ON articles(date);
+CREATE INDEX IF NOT EXISTS idx_articles_domain ON articles(domain);
+CREATE VIRTUAL TABLE IF NOT EXISTS articles_fts USING fts5(
+    url_tokens, title, locations,
+    content='articles', content_rowid='id'
+);
+CREATE TRIGGER IF NOT EXISTS articles_ai AFTER INSERT ON articles BEGIN
+    INSERT INTO articles_fts(rowid, url_tokens, title, locations)
+    VALUES (new.id, new.url_tokens, new.title, new.locations);
+END;
+CREATE TRIGGER IF NOT EXISTS articles_ad AFTER DELETE ON articles BEGIN
+    INSERT INTO articles_fts(articles_fts, rowid, url_tokens, title, locations)
+    VALUES ('delete', old.id, old.url_tokens, old.title, old.locations);
+END;
+CREATE TABLE IF NOT EXISTS ingested_files (
+    name TEXT PRIMARY KEY,
+    rows INTEGER,
+    ingested_at TEXT
+);
+"""
+
+
+def tokenize_url(url: str) -> str:
+    """URL을 검색용 토큰 문자열로 변환 ("japan-trade-war" → "japan trade war")"""
+    try:
+        parsed = urlparse(url)
+        raw = f"{parsed.netloc} {parsed.path}"
+    except Exception:
+        raw = url
+    return ' '.join(t.lower() for t in _TOKEN_PATTERN.split(raw) if t)
+
+
+def _to_fts_phrase(keyword: str) -> str:
+    """키워드를 FTS5 구문 검색식으로 변환 (특수문자 제거)"""
+    tokens = [t for t in _TOKEN_PATTERN.split(keyword.lower()) if t]
+    if not tokens:
+        return ''
+    return '"' + ' '.join(tokens) + '"'
+
+
+class GDELTLocalStore:
+    """GDELT export 파일을 적재/조회하는 SQLite 기반 로컬 저장소 (스레드 안전)"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+
+    # ------------------------------------------------------------
+    # Ingestion
+    # ------------------------------------------------------------
+
+    def ingest_file(self, path_or_url: str) -> int:
+        """
+        GKG/Mentions export 파일 하나를 적재
+
+        Args:
+            path_or_url: 로컬 경로 또는 data.gdeltproject.org URL
+                         (.zip 압축 파일과 압축 해제된 .csv 모두 지원)
+
+        Returns:
+            새로 적재된 레코드 수 (이미 적재된 파일이면 0)
+        """
+        name = os.path.basename(urlparse(path_or_url).path or path_or_url)
+        if self.is_ingested(name):
+            return 0
+
+        if path_or_url.startswith(('http://', 'https://')):
+            response = requests.get(path_or_url, timeout=config.GDELT_DOC_TIMEOUT * 6)
+            response.raise_for_status()
+            raw = response.content
+        else:
+            with open(path_or_url, 'rb') as f:
+                raw = f.read()
+
+        is_mentions = '.mentions.' in name.lower()
+        rows = self._parse_export(raw, name, is_mentions)
+        count = self._insert_rows(rows)
+
+        with self._lock:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO ingested_files(name, rows, ingested_at) VALUES (?, ?, ?)',
+                (name, count, datetime.now().isoformat())
+            )
+            self._conn.commit()
+
+        print(f"✅ [LocalStore] {name}: {count}개 레코드 적재")
+        return count
+
+    def ingest_recent(self, intervals: int = 4, include_mentions: bool = False) -> int:
+        """
+        최근 N개의 15분 export 파일을 받아 적재
+
+        lastupdate.txt(최신 파일 3줄)에서 최신 시각만 읽고, 이전 파일 이름은
+        15분씩 거슬러 계산합니다. (2015년 이후 전체 목록인 masterfilelist.txt는 수십 MB)
+
+        Args:
+            intervals: 가져올 15분 구간 수 (96 = 하루)
+            include_mentions: mentions 파일도 함께 적재할지 여부
+        """
+        response = requests.get(
+            config.GDELT_EXPORT_BASE_URL + 'lastupdate.txt',
+            timeout=config.GDELT_DOC_TIMEOUT * 6
+        )
+        response.raise_for_status()
+
+        match = _EXPORT_TIMESTAMP.search(response.text)
+        if not match:
+            print(f"⚠️ [LocalStore] lastupdate.txt 형식 오류: {response.text[:200]}")
+            return 0
+        latest = datetime.strptime(match.group(1), '%Y%m%d%H%M%S')
+
+        # 오래된 파일부터 적재 (이미 적재한 파일은 요청 없이 건너뜀)
+        stamps = [
+            (latest - timedelta(minutes=15 * i)).strftime('%Y%m%d%H%M%S')
+            for i in reversed(range(intervals))
+        ]
+        targets = [f"{config.GDELT_EXPORT_BASE_URL}{stamp}.gkg.csv.zip" for stamp in stamps]
+        if include_mentions:
+            targets += [f"{config.GDELT_EXPORT_BASE_URL}{stamp}.mentions.CSV.zip" for stamp in stamps]
+
+        total = 0
+        for url in targets:
+            try:
+                total += self.ingest_file(url)
+            except Exception as e:
+                # GDELT는 간혹 구간 파일이 누락됨 (404) → 건너뜀
+                print(f"⚠️ [LocalStore] 적재 실패 ({url}): {e}")
+        return total
+
+    def is_ingested(self, name: str) -> bool:
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT 1 FROM ingested_files WHERE name = ?', (name,)
+            ).fetchone()
+        return row is not None
+
+    def _parse_export(self, raw: bytes, name: str, is_mentions: bool) -> Iterator[Dict]:
+        """export 파일(zip 또는 csv)을 레코드 딕셔너리로 변환"""
+        if raw[:2] == b'PK':
+            with zipfile.ZipFile(io.BytesIO(raw)) as zf:
+                raw = zf.read(zf.namelist()[0])
+
+        text = io.StringIO(raw.decode('utf-8', errors='replace'))
+        reader = csv.reader(text, delimiter='\t', quoting=csv.QUOTE_NONE)
+
+        for cols in reader:
+            try:
+                if is_mentions:
+                    record = self._mention_record(cols)
+                else:
+                    record = self._gkg_record(cols)
+            except (IndexError, ValueError):
+                continue
+            if record:
+                yield record
+
+    def _gkg_record(self, cols: List[str]) -> Optional[Dict]:
+        url = cols[_GKG_URL]
+        if not url.startswith('http'):
+            return None
+
+        locations = cols[_GKG_LOCATIONS]
+        extras = cols[_GKG_EXTRAS] if len(cols) > _GKG_EXTRAS else ''
+        title_match = _TITLE_PATTERN.search(extras)
+
+        return {
+            'url': url,
+            'domain': cols[_GKG_SOURCE].lower(),
+            'date': int(cols[_GKG_DATE][:8]),
+            'tone': float(cols[_GKG_TONE].split(',')[0]) if cols[_GKG_TONE] else 0.0,
+            'country': self._country_from_locations(locations),
+            'title': title_match.group(1).strip() if title_match else '',
+            'locations': ' '.join(
+                block.split('#')[1] for block in locations.split(';') if '#' in block
+            ),
+        }
+
+    def _mention_record(self, cols: List[str]) -> Optional[Dict]:
+        url = cols[_MENTION_URL]
+        if not url.startswith('http'):
+            return None
+
+        return {
+            'url': url,
+            'domain': cols[_MENTION_SOURCE].lower(),
+            'date': int(cols[_MENTION_DATE][:8]),
+            'tone': float(cols[_MENTION_TONE]) if cols[_MENTION_TONE] else 0.0,
+            'country': 'Unknown',
+            'title': '',
+            'locations': '',
+        }
+
+    def _country_from_locations(self, locations: str) -> str:
+        """V1Locations 첫 블록의 국가 코드 (GDELTBigQueryStrategy와 동일 규칙)"""
+        parts = locations.split('#')
+        return parts[2] if len(parts) > 2 and parts[2] else 'Unknown'
+
+    def _insert_rows(self, rows: Iterator[Dict]) -> int:
+        batch = []
+        inserted = 0
+        for row in rows:
+            batch.append((
+                row['url'], row['domain'], row['date'], row['tone'], row['country'],
+                row['title'], tokenize_url(row['url']), row['locations'],
+            ))
+            if len(batch) >= 1000:
+                inserted += self._flush(batch)
+                batch = []
+        if batch:
+            inserted += self._flush(batch)
+        return inserted
+
+    def _flush(self, batch: List[tuple]) -> int:
+        with self._lock:
+            cursor = self._conn.executemany(
+                'INSERT OR IGNORE INTO articles'
+                '(url, domain, date, tone, country, title, url_tokens, locations) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                batch
+            )
+            self._conn.commit()
+            # rowcount는 INSERT OR IGNORE로 실제 삽입된 행만 집계 (트리거 제외)
+            return cursor.rowcount
+
+    # ------------------------------------------------------------
+    # Query
+    # ------------------------------------------------------------
+
+    def search(
+        self,
+        keywords: List[str],
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        domains: Optional[tuple] = None,
+        limit: int = 50,
+    ) -> List[Dict]:
+        """
+        키워드(OR)로 로컬 색인 검색
+
+        Returns:
+            [{'url', 'domain', 'date', 'tone', 'country', 'title'}, ...] (최신순)
+        """
+        phrases = [p for p in (_to_fts_phrase(kw) for kw in keywords) if p]
+        if not phrases:
+            return []
+
+        sql = [
+            'SELECT a.url, a.domain, a.date, a.tone, a.country, a.title',
+            'FROM articles_fts JOIN articles a ON a.id = articles_fts.rowid',
+            'WHERE articles_fts MATCH ?',
+        ]
+        args: list = [' OR '.join(phrases)]
+
+        if start:
+            sql.append('AND a.date >= ?')
+            args.append(int(start.strftime('%Y%m%d')))
+        if end:
+            sql.append('AND a.date <= ?')
+            args.append(int(end.strftime('%Y%m%d')))
+        if domains:
+            sql.append(f"AND a.domain IN ({','.join('?' * len(domains))})")
+            args.extend(domains)
+
+        sql.append('ORDER BY a.date DESC LIMIT ?')
+        args.append(limit)
+
+        with self._lock:
+            rows = self._conn.execute(' '.join(sql), args).fetchall()
+
+        return [
+            {
+                'url': url,
+                'domain': domain,
+                'date': f"{str(date)[:4]}-{str(date)[4:6]}-{str(date)[6:8]}",
+                'tone': tone or 0.0,
+                'country': country or 'Unknown',
+                'title': title or '',
+            }
+            for url, domain, date, tone, country, title in rows
+        ]
+
+    def latest_date(self) -> Optional[datetime]:
+        """적재된 데이터 중 가장 최근 날짜"""
+        with self._lock:
+            row = self._conn.execute('SELECT MAX(date) FROM articles').fetchone()
+        if not row or not row[0]:
+            return None
+        return datetime.strptime(str(row[0]), '%Y%m%d')
+
+    def prune(self, keep_days: int) -> int:
+        """keep_days보다 오래된 레코드 삭제 후 FTS 색인 최적화"""
+        cutoff = int((datetime.now() - timedelta(days=keep_days)).strftime('%Y%m%d'))
+        with self._lock:
+            cursor = self._conn.execute('DELETE FROM articles WHERE date < ?', (cutoff,))
+            self._conn.execute("INSERT INTO articles_fts(articles_fts) VALUES ('optimize')")
+            self._conn.commit()
+            return cursor.rowcount
+
+
+# ============================================================
+# Shared instance
+# ============================================================
+
+_store: Optional[GDELTLocalStore] = None
+_store_lock = threading.Lock()
+
+
+def get_local_store() -> Optional[GDELTLocalStore]:
+    """config.GDELT_LOCAL_STORE_PATH가 설정된 경우 공유 저장소 반환 (미설정 시 None)"""
+    global _store
+
+    if not config.GDELT_LOCAL_STORE_PATH:
+        return None
+
+    with _store_lock:
+        if _store is None:
+            try:
+                _store = GDELTLocalStore(config.GDELT_LOCAL_STORE_PATH)
+                print(f"✅ [LocalStore] 로컬 GDELT 색인 연결: {config.GDELT_LOCAL_STORE_PATH}")
+            except Exception as e:
+                print(f"⚠️ [LocalStore] 로컬 색인 열기 실패: {e}")
+                return None
+    return _store
@@ -2,6 +2,8 @@
 GDELT Search Service - DOC API 기반 전문 검색 엔진 (v2 - Bug Fixed)
 
 [Architecture]
+- Corpus: 이전에 추출한 기사 본문 코퍼스 (설정 시, fetch/parse 없이 응답)
+- Local: GKG/Mentions export 로컬 색인 (설정 시, 원격 호출 없이 조회)
 - Primary: GDELT DOC 2.0 API (본문 전문 검색)
 - Fallback: BigQuery GKG (메타데이터 검색)
 
@@ -15,16 +17,28 @@ GDELT Search Service - DOC API 기반 전문 검색 엔진 (v2 - Bug Fixed)
 - API 레벨 중복 URL 제거
 """
 
+import re
+import json
+import time
+import queue
+import codecs
+import threading
 import requests
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import List, Dict, Optional, Set
+from typing import List, Dict, Optional, Set, Iterable, Iterator, Callable, Tuple
 from datetime import datetime, timedelta
 from urllib.parse import urlparse, urlunparse
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from google.cloud import bigquery
 from app.config import config
+from app.models.media import get_domain_index
+from app.models.domain_index import gdelt_country_name
+from app.utils.cache import TTLCache
+from app.utils.gdelt_local_store import GDELTLocalStore, get_local_store
+from app.utils.article_corpus import ArticleCorpus, get_article_corpus
 
 
 # ============================================================
@@ -42,9 +56,11 @@ class ArticleResult:
     country: str = "Unknown"
     tone: float = 0.0
     relevance_score: float = 0.0
+    content: str = ""  # 코퍼스에서 온 기사는 본문 보유 (재추출 생략)
+    title_kr: str = ""
 
     def to_dict(self) -> Dict:
-        return {
+        data = {
             'url': self.url,
             'title': self.title,
             'source': self.source,
@@ -54,6 +70,11 @@ class ArticleResult:
             'tone': self.tone,
             'relevance_score': self.relevance_score,
         }
+        if self.content:
+            data['content'] = self.content
+        if self.title_kr:
+            data['title_kr'] = self.title_kr
+        return data
 
 
 # ============================================================
@@ -95,6 +116,180 @@ def deduplicate_articles(articles: List[ArticleResult]) -> List[ArticleResult]:
     return unique_articles
 
 
+# ============================================================
+# Time Window Utilities (사건 발생일 기준 검색 범위)
+# ============================================================
+
+def resolve_event_window(
+    event_date: Optional[str],
+    days: Optional[int] = None,
+) -> Optional[Tuple[datetime, datetime]]:
+    """
+    event_date("YYYY-MM-DD")를 ±days 절대 검색 범위로 변환
+
+    종료 시각은 현재 시각을 넘지 않으며, 날짜가 없거나 해석할 수 없거나
+    미래인 경우 None을 반환합니다 (→ 현재 기준 상대 범위 사용).
+    """
+    if not event_date:
+        return None
+
+    days = config.SEARCH_WINDOW_DAYS if days is None else days
+    raw = str(event_date).strip()
+    anchor = None
+    for fmt, length in (('%Y-%m-%d', 10), ('%Y%m%d', 8), ('%Y-%m', 7)):
+        try:
+            anchor = datetime.strptime(raw[:length], fmt)
+            break
+        except ValueError:
+            continue
+    if anchor is None:
+        return None
+
+    now = datetime.now()
+    start = anchor - timedelta(days=days)
+    end = min(anchor + timedelta(days=days, hours=23, minutes=59, seconds=59), now)
+    if start >= now:
+        return None
+    return start, end
+
+
+_TIMESPAN_UNITS = {'min': 60, 'h': 3600, 'd': 86400, 'w': 7 * 86400, 'm': 30 * 86400, 'y': 365 * 86400}
+
+
+def timespan_to_timedelta(timespan: str) -> Optional[timedelta]:
+    """GDELT timespan 문자열("15min", "24h", "1w", "6m")을 timedelta로 변환"""
+    match = re.fullmatch(r'(\d+)\s*(min|h|d|w|m|y)', (timespan or '').strip().lower())
+    if not match:
+        return None
+    return timedelta(seconds=int(match.group(1)) * _TIMESPAN_UNITS[match.group(2)])
+
+
+def split_window(start: datetime, end: datetime, slices: int) -> List[Tuple[datetime, datetime]]:
+    """[start, end] 범위를 균등한 하위 구간 N개로 분할 (최신 구간부터)"""
+    slices = max(1, slices)
+    step = (end - start) / slices
+    bounds = [
+        (start + step * i, end if i == slices - 1 else start + step * (i + 1))
+        for i in range(slices)
+    ]
+    return list(reversed(bounds))
+
+
+# ============================================================
+# Rate Limiter (DOC API 동시 호출 예산)
+# ============================================================
+
+class RateLimiter:
+    """
+    동시 실행 수 + 최소 호출 간격 제한 (스레드 안전)
+
+    with limiter:
+        requests.get(...)
+    """
+
+    def __init__(self, max_concurrent: int, min_interval: float):
+        self._semaphore = threading.BoundedSemaphore(max(1, max_concurrent))
+        self._min_interval = min_interval
+        self._lock = threading.Lock()
+        self._next_start = 0.0
+
+    def acquire(self):
+        self._semaphore.acquire()
+        with self._lock:
+            now = time.monotonic()
+            wait = self._next_start - now
+            self._next_start = max(now, self._next_start) + self._min_interval
+        if wait > 0:
+            time.sleep(wait)
+
+    def release(self):
+        self._semaphore.release()
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.release()
+        return False
+
+
+# 프로세스 전체가 공유하는 DOC API 호출 예산
+doc_api_limiter = RateLimiter(config.GDELT_DOC_MAX_CONCURRENCY, config.GDELT_DOC_MIN_INTERVAL)
+
+
+# ============================================================
+# JSON Streaming Utilities (대용량 응답 증분 파싱)
+# ============================================================
+
+class JSONArrayStreamParser:
+    """
+    {"<key>": [ {...}, {...} ]} 형태 응답을 청크 단위로 증분 파싱
+
+    배열 원소(객체)가 완성되는 즉시 하나씩 반환하므로 전체 본문을
+    버퍼링하거나 json.loads를 기다릴 필요가 없습니다.
+    """
+
+    # 원소 하나가 이 크기를 넘도록 완성되지 않으면 손상된 응답으로 간주
+    MAX_PENDING_CHARS = 1 << 20
+
+    def __init__(self, key: str):
+        self.key = key
+        self.found_key = False
+        self.empty_object = False
+        self.head = ''
+        self._decoder = json.JSONDecoder()
+
+    def parse(self, chunks: Iterable[bytes]) -> Iterator[Dict]:
+        text_decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+        marker = f'"{self.key}"'
+        buf = ''
+        in_array = False
+
+        for chunk in chunks:
+            if not chunk:
+                continue
+            text = text_decoder.decode(chunk)
+            if len(self.head) < 200:
+                self.head += text[:200 - len(self.head)]
+            buf += text
+
+            while True:
+                if not in_array:
+                    idx = buf.find(marker)
+                    if idx < 0:
+                        # 다음 청크와 이어질 수 있는 꼬리만 유지
+                        buf = buf[-len(marker):]
+                        break
+                    bracket = buf.find('[', idx + len(marker))
+                    if bracket < 0:
+                        buf = buf[idx:]
+                        break
+                    buf = buf[bracket + 1:]
+                    in_array = True
+                    self.found_key = True
+                    continue
+
+                buf = buf.lstrip(' \t\r\n,')
+                if not buf:
+                    break
+                if buf[0] == ']':
+                    return
+                try:
+                    obj, end = self._decoder.raw_decode(buf)
+                except json.JSONDecodeError:
+                    if len(buf) > self.MAX_PENDING_CHARS:
+                        raise ValueError("DOC API 응답 원소가 손상되었습니다")
+                    break  # 원소가 아직 완성되지 않음 → 다음 청크 대기
+                buf = buf[end:]
+                if isinstance(obj, dict):
+                    yield obj
+
+        if not self.found_key and self.head.strip() in ('{}', ''):
+            # 결과가 없을 때 GDELT는 빈 객체를 반환
+            self.empty_object = True
+
+
 # ============================================================
 # Search Strategy Interface (Strategy Pattern)
 # ============================================================
@@ -137,15 +332,72 @@ class GDELTDocAPIStrategy(SearchStrategy):
     def __init__(self):
         self.base_url = config.GDELT_DOC_API_URL
         self.timeout = config.GDELT_DOC_TIMEOUT
-        self._available = True
+        # 연속 실패가 GDELT_DOC_FAILURE_THRESHOLD 이상이면 GDELT_DOC_COOLDOWN_SEC 동안 사용 중지
+        # (프로세스 공유 인스턴스이므로 한 번의 실패로 영구 비활성화하지 않음)
+        self._lock = threading.Lock()
+        self._consecutive_failures = 0
+        self._cooldown_until = 0.0
+        # 호출 단위 실패 기록 (failure_scope, 스레드별)
+        self._local = threading.local()
 
     def is_available(self) -> bool:
-        return self._available
+        return time.monotonic() >= self._cooldown_until
+
+    @contextmanager
+    def failure_scope(self):
+        """
+        이 스레드에서 실행하는 검색 호출의 실패 기록 범위
+
+        with doc_api.failure_scope() as scope:
+            searcher.search(...)
+        scope['failed']  # 범위 안의 DOC API 호출이 하나라도 실패(또는 쿨다운으로 생략)했는지
+        """
+        scope = {'failed': False}
+        previous = getattr(self._local, 'scope', None)
+        self._local.scope = scope
+        try:
+            yield scope
+        finally:
+            self._local.scope = previous
+
+    def note_failure(self) -> None:
+        """현재 failure_scope에 실패 표시 (가용성 통계에는 반영하지 않음)"""
+        scope = getattr(self._local, 'scope', None)
+        if scope is not None:
+            scope['failed'] = True
+
+    def _record_failure(self) -> None:
+        self.note_failure()
+        with self._lock:
+            self._consecutive_failures += 1
+            if self._consecutive_failures >= config.GDELT_DOC_FAILURE_THRESHOLD:
+                self._cooldown_until = time.monotonic() + config.GDELT_DOC_COOLDOWN_SEC
+                self._consecutive_failures = 0
+                print(f"🧊 [DOC API] 연속 실패 → {config.GDELT_DOC_COOLDOWN_SEC}초 동안 사용 중지")
+
+    def _record_success(self) -> None:
+        with self._lock:
+            self._consecutive_failures = 0
 
     def search(self, keywords: List[str], **kwargs) -> List[ArticleResult]:
-        """DOC API로 기사 본문 전문 검색"""
+        """DOC API로 기사 본문 전문 검색 (전체 결과 수집)"""
+        return list(self.search_iter(keywords, **kwargs))
+
+    def search_iter(self, keywords: List[str], **kwargs) -> Iterator[ArticleResult]:
+        """
+        DOC API 스트리밍 검색 - 응답을 증분 파싱하며 ArticleResult를 하나씩 생성
+
+        doc_api_limiter 슬롯은 요청 시작부터 응답 헤더 수신까지만 점유합니다.
+        본문 수신/파싱과 호출 측의 후보 처리(관련성 임베딩 등)는 슬롯 밖에서 겹쳐 진행되므로
+        느린 소비자가 다른 DOC API 호출을 막지 않습니다.
+        호출 측이 순회를 중단하면(generator close) 응답을 닫아 나머지 전송을 취소합니다.
+        """
         if not keywords:
-            return []
+            return
+
+        response = None
+        yielded = 0
+        completed = False
 
         try:
             # 1. 검색 쿼리 구성
@@ -155,73 +407,211 @@ class GDELTDocAPIStrategy(SearchStrategy):
             params = {
                 'query': query,
                 'mode': 'artlist',
-                'maxrecords': config.GDELT_DOC_MAX_RECORDS,
+                'maxrecords': kwargs.get('maxrecords', config.GDELT_DOC_MAX_RECORDS),
                 'format': 'json',
                 'sort': 'DateDesc',
             }
 
-            # [수정됨] timespan은 GDELT 공식 형식 사용 ("1w", "1m", "3m" 등)
-            timespan = kwargs.get('timespan', config.GDELT_SEARCH_TIMESPAN)
-            if timespan:
-                params['timespan'] = timespan
+            # 명시적 범위(시간 분할 검색) 또는 사건 발생일 ±SEARCH_WINDOW_DAYS 절대 범위로 검색
+            window = kwargs.get('window') or resolve_event_window(kwargs.get('event_date'))
+            if window:
+                params['startdatetime'] = window[0].strftime('%Y%m%d%H%M%S')
+                params['enddatetime'] = window[1].strftime('%Y%m%d%H%M%S')
+                timespan_desc = f"{window[0]:%Y-%m-%d} ~ {window[1]:%Y-%m-%d}"
+            else:
+                # [수정됨] timespan은 GDELT 공식 형식 사용 ("1w", "1m", "3m" 등)
+                timespan = kwargs.get('timespan', config.GDELT_SEARCH_TIMESPAN)
+                if timespan:
+                    params['timespan'] = timespan
+                timespan_desc = timespan
 
             print(f"🔍 [DOC API] 검색 쿼리: {query[:100]}...")
-            print(f"   timespan: {timespan}")
-
-            response = requests.get(
-                self.base_url,
-                params=params,
-                timeout=self.timeout
-            )
+            print(f"   timespan: {timespan_desc}")
+
+            # 프로세스 공용 호출 예산: 요청 시작 ~ 응답 헤더 수신까지만 점유
+            with doc_api_limiter:
+                response = requests.get(
+                    self.base_url,
+                    params=params,
+                    timeout=self.timeout,
+                    stream=True
+                )
             response.raise_for_status()
 
-            # 3. 결과 파싱
-            try:
-                data = response.json()
-            except ValueError as e:
-                # JSON 파싱 실패 시 응답 내용 출력
-                print(f"⚠️ [DOC API] JSON 파싱 실패: {e}")
-                print(f"   응답 내용 (처음 200자): {response.text[:200]}")
+            # 3. 결과 증분 파싱 + [추가됨] API 레벨 중복 제거
+            seen_urls: Set[str] = set()
+            parser = JSONArrayStreamParser('articles')
+            chunks = response.iter_content(chunk_size=8192, decode_unicode=False)
+
+            for item in parser.parse(chunks):
+                article = self._parse_item(item)
+                if not article:
+                    continue
+                normalized = normalize_url(article.url)
+                if normalized in seen_urls:
+                    continue
+                seen_urls.add(normalized)
+                yielded += 1
+                yield article
+
+            if not parser.found_key and not parser.empty_object:
+                # JSON이 아닌 응답 (GDELT는 쿼리 오류/요청 제한을 평문으로 반환)
+                print("⚠️ [DOC API] JSON 파싱 실패: 'articles' 배열 없음")
+                print(f"   응답 내용 (처음 200자): {parser.head[:200]}")
                 print(f"   응답 상태: {response.status_code}")
-                self._available = False
-                return []
+                self._record_failure()
+                return
 
-            articles = self._parse_response(data)
-
-            # [추가됨] API 레벨 중복 제거
-            articles = deduplicate_articles(articles)
-
-            print(f"✅ [DOC API] {len(articles)}개 기사 발견 (중복 제거 후)")
-            return articles
+            completed = True
+            self._record_success()
+            print(f"✅ [DOC API] {yielded}개 기사 발견 (중복 제거 후)")
 
         except requests.exceptions.Timeout:
             print(f"⚠️ [DOC API] 타임아웃 ({self.timeout}초)")
-            self._available = False
-            return []
+            self._record_failure()
         except requests.exceptions.RequestException as e:
             print(f"⚠️ [DOC API] 요청 실패: {e}")
-            self._available = False
-            return []
+            self._record_failure()
         except Exception as e:
             print(f"❌ [DOC API] 예외 발생: {e}")
-            return []
+            self.note_failure()
+        finally:
+            if response is not None:
+                # 조기 종료 시 남은 전송 취소
+                response.close()
+            if not completed and yielded:
+                print(f"⏹️ [DOC API] {yielded}개 기사 수신 후 스트림 종료")
+
+    def search_sliced_iter(self, keywords: List[str], slices: int, **kwargs) -> Iterator[ArticleResult]:
+        """
+        시간 분할 병렬 검색 - 검색 범위를 N개 구간으로 나눠 동시에 조회
 
-    def _build_query(self, keywords: List[str], domains: Optional[tuple] = None) -> str:
-        """GDELT DOC API 쿼리 문자열 생성 (경량화 버전)"""
+        DOC API는 호출당 maxrecords까지만 반환하므로(DateDesc 정렬 시 최신 기사만),
+        구간별로 나눠 조회하면 시간적으로 고른 후보를 단일 호출 수준의 지연으로 얻습니다.
+        동시 호출 수는 doc_api_limiter 예산을 따르며, 결과는 도착 순으로 중복 제거 후 반환합니다.
+        """
+        window = kwargs.get('window') or resolve_event_window(kwargs.get('event_date'))
+        if not window:
+            span = timespan_to_timedelta(kwargs.get('timespan') or config.GDELT_SEARCH_TIMESPAN)
+            if not span:
+                yield from self.search_iter(keywords, **kwargs)
+                return
+            end = datetime.now()
+            window = (end - span, end)
+
+        bounds = split_window(window[0], window[1], slices)
+        print(f"🧩 [DOC API] 시간 분할 검색: {len(bounds)}개 구간")
+
+        results: queue.Queue = queue.Queue()
+        stop = threading.Event()
+        done_marker = object()
+        # 호출 스레드의 failure_scope를 구간 스레드에도 적용 (구간 실패 = 이 호출의 실패)
+        scope = getattr(self._local, 'scope', None)
+
+        def fetch_slice(bound):
+            self._local.scope = scope
+            stream = self.search_iter(keywords, **{**kwargs, 'window': bound})
+            try:
+                for article in stream:
+                    if stop.is_set():
+                        break
+                    results.put(article)
+            finally:
+                stream.close()
+                results.put(done_marker)
+                self._local.scope = None
+
+        executor = ThreadPoolExecutor(max_workers=len(bounds))
+        for bound in bounds:
+            executor.submit(fetch_slice, bound)
+
+        seen_urls: Set[str] = set()
+        finished = 0
+        try:
+            while finished < len(bounds):
+                item = results.get()
+                if item is done_marker:
+                    finished += 1
+                    continue
+                normalized = normalize_url(item.url)
+                if normalized in seen_urls:
+                    continue
+                seen_urls.add(normalized)
+                yield item
+        finally:
+            # 호출 측이 조기 종료하면 남은 구간 스트림도 중단
+            stop.set()
+            executor.shutdown(wait=False)
+
+    def timeline(self, keywords: List[str], mode: str, **kwargs) -> Dict[str, Dict[str, float]]:
+        """
+        DOC API 타임라인 집계 (timelinetone / timelinevolraw)
+
+        Args:
+            keywords: 검색 키워드
+            mode: 'timelinetone' 또는 'timelinevolraw'
+            source_country: GDELT sourcecountry 필터 (국가명, 선택)
+            event_date / timespan: 검색 범위 (search_iter와 동일 규칙)
+
+        Returns:
+            {'YYYY-MM-DD': {'value': float, 'norm': float}} (일 단위로 합산)
+        """
+        query = self._build_query(keywords)
+        if not query:
+            return {}
+
+        source_country = kwargs.get('source_country')
+        if source_country:
+            query = f"{query} sourcecountry:{source_country.replace(' ', '')}"
+
+        params = {'query': query, 'mode': mode, 'format': 'json'}
+        window = kwargs.get('window') or resolve_event_window(kwargs.get('event_date'))
+        if window:
+            params['startdatetime'] = window[0].strftime('%Y%m%d%H%M%S')
+            params['enddatetime'] = window[1].strftime('%Y%m%d%H%M%S')
+        else:
+            params['timespan'] = kwargs.get('timespan') or config.GDELT_SEARCH_TIMESPAN
+
+        with doc_api_limiter:
+            response = requests.get(self.base_url, params=params, timeout=self.timeout)
+        response.raise_for_status()
+        data = response.json()
+
+        days: Dict[str, Dict[str, float]] = {}
+        for series in data.get('timeline', []):
+            for point in series.get('data', []):
+                day = self._format_date(point.get('date', ''))
+                if not day:
+                    continue
+                bucket = days.setdefault(day, {'value': 0.0, 'norm': 0.0, 'points': 0})
+                bucket['value'] += float(point.get('value', 0) or 0)
+                bucket['norm'] += float(point.get('norm', 0) or 0)
+                bucket['points'] += 1
+        return days
+
+    @staticmethod
+    def query_terms(keywords: List[str]) -> List[str]:
+        """DOC API 쿼리에 실제로 들어가는 검색어 (상위 3개, 각 최대 3단어)"""
 
         # [수정 1] 상위 3개 키워드만 사용 (API 제한 고려)
         top_keywords = keywords[:3]
 
-        refined_keywords = []
+        terms = []
         for kw in top_keywords:
             # [수정 2] 쿼리가 너무 길어지는 것을 방지하기 위해 3단어 이상은 핵심만 추출하거나 앞부분만 사용
             parts = kw.split()
             if len(parts) > 3:
                 # 예: "Japan China trade war impact" -> "Japan China trade"
                 kw = " ".join(parts[:3])
+            terms.append(kw)
+
+        return terms
+
+    def _build_query(self, keywords: List[str], domains: Optional[tuple] = None) -> str:
+        """GDELT DOC API 쿼리 문자열 생성 (경량화 버전)"""
 
-            # 따옴표로 감싸서 구문 검색 (정확도 향상)
-            refined_keywords.append(f'"{kw}"')
+        # 따옴표로 감싸서 구문 검색 (정확도 향상)
+        refined_keywords = [f'"{kw}"' for kw in self.query_terms(keywords)]
 
         if not refined_keywords:
             return ""
@@ -233,39 +623,30 @@ class GDELTDocAPIStrategy(SearchStrategy):
 
         return query
 
-    def _parse_response(self, data: Dict) -> List[ArticleResult]:
-        """API 응답을 ArticleResult 리스트로 변환"""
-        articles = []
-
-        if 'articles' not in data:
-            return articles
-
-        for item in data['articles']:
-            try:
-                # 날짜 포맷 변환 (20240501T120000Z → 2024-05-01)
-                raw_date = item.get('seendate', '')
-                formatted_date = self._format_date(raw_date)
-
-                # 도메인에서 소스명 추출
-                source = item.get('domain', 'Unknown')
-
-                article = ArticleResult(
-                    url=item.get('url', ''),
-                    title=item.get('title', ''),
-                    source=source,
-                    date=formatted_date,
-                    snippet=item.get('socialimage', '') or '',
-                    country=self._extract_country(item),
-                )
+    def _parse_item(self, item: Dict) -> Optional[ArticleResult]:
+        """artlist 항목 하나를 ArticleResult로 변환 (URL이 없으면 None)"""
+        try:
+            # 날짜 포맷 변환 (20240501T120000Z → 2024-05-01)
+            raw_date = item.get('seendate', '')
+            formatted_date = self._format_date(raw_date)
+
+            # 도메인에서 소스명 추출
+            source = item.get('domain', 'Unknown')
+
+            article = ArticleResult(
+                url=item.get('url', ''),
+                title=item.get('title', ''),
+                source=source,
+                date=formatted_date,
+                snippet=item.get('socialimage', '') or '',
+                country=self._extract_country(item),
+            )
 
-                if article.url:  # URL이 있는 경우만 추가
-                    articles.append(article)
+            return article if article.url else None  # URL이 있는 경우만 추가
 
-            except Exception as e:
-                print(f"⚠️ 기사 파싱 오류: {e}")
-                continue
-
-        return articles
+        except Exception as e:
+            print(f"⚠️ 기사 파싱 오류: {e}")
+            return None
 
     def _format_date(self, raw_date: str) -> str:
         """날짜 포맷 변환"""
@@ -279,25 +660,11 @@ class GDELTDocAPIStrategy(SearchStrategy):
             return raw_date[:10] if len(raw_date) >= 10 else raw_date
 
     def _extract_country(self, item: Dict) -> str:
-        """도메인에서 국가 추론"""
-        domain = item.get('domain', '')
-
-        # 도메인 기반 국가 매핑
-        country_mapping = {
-            '.kr': 'KR', '.co.kr': 'KR',
-            '.jp': 'JP', '.co.jp': 'JP',
-            '.cn': 'CN', '.com.cn': 'CN',
-            '.uk': 'GB', '.co.uk': 'GB',
-            '.de': 'DE',
-            '.fr': 'FR',
-            '.ru': 'RU',
-        }
-
-        for suffix, country in country_mapping.items():
-            if domain.endswith(suffix):
-                return country
-
-        return 'US' if domain.endswith('.com') else 'Unknown'
+        """도메인 색인으로 국가 추론 (언론사 컬렉션 > sourcecountry > ccTLD)"""
+        return get_domain_index().country_for(
+            item.get('domain', ''),
+            item.get('sourcecountry', '')
+        )
 
 
 # ============================================================
@@ -334,10 +701,14 @@ class GDELTBigQueryStrategy(SearchStrategy):
             return []
 
         try:
-            # 시간 범위 설정
-            days = kwargs.get('days', config.SEARCH_WINDOW_DAYS)
-            end_date = datetime.now()
-            start_date = end_date - timedelta(days=days)
+            # 시간 범위 설정 (사건 발생일이 있으면 해당 날짜 기준 ±SEARCH_WINDOW_DAYS)
+            window = resolve_event_window(kwargs.get('event_date'))
+            if window:
+                start_date, end_date = window
+            else:
+                days = kwargs.get('days', config.SEARCH_WINDOW_DAYS)
+                end_date = datetime.now()
+                start_date = end_date - timedelta(days=days)
 
             start_int = int(start_date.strftime('%Y%m%d000000'))
             end_int = int(end_date.strftime('%Y%m%d235959'))
@@ -372,7 +743,9 @@ class GDELTBigQueryStrategy(SearchStrategy):
                 V2Tone as tone,
                 Locations
             FROM `gdelt-bq.gdeltv2.gkg_partitioned`
-            WHERE DATE >= {start_int}
+            WHERE _PARTITIONTIME >= TIMESTAMP('{start_date:%Y-%m-%d}')
+              AND _PARTITIONTIME < TIMESTAMP('{end_date + timedelta(days=1):%Y-%m-%d}')
+              AND DATE >= {start_int}
               AND DATE <= {end_int}
               AND SourceCommonName IN ({domain_filter})
               AND ({keyword_conditions})
@@ -382,6 +755,7 @@ class GDELTBigQueryStrategy(SearchStrategy):
             """
 
             print(f"🔍 [BigQuery] 쿼리 실행: {keyword_conditions}")
+            print(f"   파티션 범위: {start_date:%Y-%m-%d} ~ {end_date:%Y-%m-%d}")
 
             results = self.client.query(query).result()
             articles = []
@@ -395,6 +769,8 @@ class GDELTBigQueryStrategy(SearchStrategy):
                     tone=float(row.tone.split(',')[0]) if row.tone else 0.0,
                     country=self._extract_country_from_locations(row.Locations),
                 )
+                if article.country == 'Unknown':
+                    article.country = get_domain_index().country_for(article.source)
                 if article.url:
                     articles.append(article)
 
@@ -421,6 +797,132 @@ class GDELTBigQueryStrategy(SearchStrategy):
         return 'Unknown'
 
 
+# ============================================================
+# Article Corpus Strategy (First Tier)
+# ============================================================
+
+class ArticleCorpusStrategy(SearchStrategy):
+    """
+    추출 기사 코퍼스 검색 전략 (First Tier)
+
+    장점:
+    - 본문까지 보유 → fetch/parse/번역 없이 바로 응답
+    - BM25 본문 전문 검색
+
+    단점:
+    - 이전에 추출된 최근 기사만 검색 가능
+    """
+
+    def __init__(self, corpus: Optional[ArticleCorpus] = None):
+        self.corpus = corpus or get_article_corpus()
+
+    def is_available(self) -> bool:
+        return self.corpus is not None
+
+    def search(self, keywords: List[str], **kwargs) -> List[ArticleResult]:
+        """코퍼스에서 최근 기사 본문 검색 (locations가 있으면 해당 국가 기사만)"""
+        if not self.corpus or not keywords:
+            return []
+
+        try:
+            rows = self.corpus.search(
+                keywords[:config.MAX_KEYWORDS],
+                countries=kwargs.get('locations') or None,
+                limit=config.GDELT_MAX_RESULTS,
+            )
+
+            articles = [
+                ArticleResult(
+                    url=row['url'],
+                    title=row['title'],
+                    source=row['source'],
+                    date=row['date'],
+                    snippet=row['content'][:500],
+                    country=row['country'],
+                    content=row['content'],
+                    title_kr=row['title_kr'],
+                )
+                for row in rows
+            ]
+            articles = deduplicate_articles(articles)
+
+            print(f"✅ [Corpus] {len(articles)}개 기사 발견 (중복 제거 후)")
+            return articles
+
+        except Exception as e:
+            print(f"❌ [Corpus] 검색 실패: {e}")
+            return []
+
+
+# ============================================================
+# Local Mirror Strategy (Second Tier)
+# ============================================================
+
+class GDELTLocalStrategy(SearchStrategy):
+    """
+    GDELT 로컬 미러 검색 전략 (Second Tier)
+
+    장점:
+    - 네트워크 호출 없음 (밀리초 단위 응답)
+    - 오프라인 테스트 가능 (fixture export 파일 적재)
+
+    단점:
+    - 적재된 기간/파일 범위만 검색 가능
+    - URL 토큰/제목/위치 검색 (본문 X)
+    """
+
+    def __init__(self, store: Optional[GDELTLocalStore] = None):
+        self.store = store or get_local_store()
+
+    def is_available(self) -> bool:
+        return self.store is not None
+
+    def search(self, keywords: List[str], **kwargs) -> List[ArticleResult]:
+        """로컬 색인에서 SEARCH_WINDOW_DAYS 범위 검색 (event_date가 있으면 해당 날짜 기준)"""
+        if not self.store or not keywords:
+            return []
+
+        try:
+            window = resolve_event_window(kwargs.get('event_date'))
+            if window:
+                start_date, end_date = window
+            else:
+                days = kwargs.get('days', config.SEARCH_WINDOW_DAYS)
+                start_date, end_date = datetime.now() - timedelta(days=days), None
+
+            rows = self.store.search(
+                keywords[:config.MAX_KEYWORDS],
+                start=start_date,
+                end=end_date,
+                domains=kwargs.get('domains'),
+                limit=config.GDELT_MAX_RESULTS,
+            )
+
+            articles = [
+                ArticleResult(
+                    url=row['url'],
+                    title=row['title'],
+                    source=row['domain'] or 'Unknown',
+                    date=row['date'],
+                    country=row['country'],
+                    tone=row['tone'],
+                )
+                for row in rows
+            ]
+            articles = deduplicate_articles(articles)
+
+            print(f"✅ [Local] {len(articles)}개 기사 발견 (중복 제거 후)")
+            return articles
+
+        except Exception as e:
+            print(f"❌ [Local] 검색 실패: {e}")
+            return []
+
+
+# 국가별 타임라인 집계 캐시 (질의/국가/기간 단위)
+_timeline_cache = TTLCache(max_size=2048, ttl=config.GDELT_TIMELINE_CACHE_TTL_SEC)
+
+
 # ============================================================
 # Main Search Engine (Facade Pattern)
 # ============================================================
@@ -434,6 +936,8 @@ class GDELTSearcher:
     results = searcher.search({'keywords': ['trade war', 'China']})
 
     [전략]
+    0a. Article Corpus (설정 시) - 추출 완료된 기사 본문, 결과 부족 시 다음 단계로
+    0b. Local Mirror (설정 시) - 로컬 색인, 결과 부족 시 원격으로 전환
     1. DOC API (Primary) - 본문 전문 검색
     2. BigQuery (Fallback) - DOC API 실패 시
 
@@ -441,14 +945,20 @@ class GDELTSearcher:
     - 기존 로직 호환성: entities, themes를 keywords로 자동 병합
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        local_store: Optional[GDELTLocalStore] = None,
+        corpus: Optional[ArticleCorpus] = None,
+    ):
         # 검색 전략 초기화
+        self.corpus = ArticleCorpusStrategy(corpus)
+        self.local = GDELTLocalStrategy(local_store)
         self.doc_api = GDELTDocAPIStrategy()
         self.bigquery = GDELTBigQueryStrategy()
 
         print("✅ [GDELTSearcher] 초기화 완료")
 
-    def search(self, search_params: dict) -> List[Dict]:
+    def search(self, search_params: dict, merged_keywords: Optional[List[str]] = None) -> List[Dict]:
         """
         통합 검색 메서드
 
@@ -459,40 +969,89 @@ class GDELTSearcher:
                 'themes': ['ECON_TRADE'],  # 선택 (자동 병합됨)
                 'timespan': '3m',  # 선택 (DOC API용, 기본값: config에서)
                 'days': 30,  # 선택 (BigQuery용)
+                'event_date': '2024-05-01',  # 선택 (있으면 ±SEARCH_WINDOW_DAYS 절대 범위 검색)
+                'time_slices': 4,  # 선택 (DOC API 시간 분할 병렬 검색 구간 수)
             }
 
+            merged_keywords: 이미 병합된 키워드 (QueryPlan이 전달, 있으면 병합 생략)
+
         Returns:
             기사 딕셔너리 리스트
         """
+        return list(self.iter_search(search_params, merged_keywords))
+
+    def iter_search(
+        self,
+        search_params: dict,
+        merged_keywords: Optional[List[str]] = None,
+    ) -> Iterator[Dict]:
+        """
+        스트리밍 통합 검색 - 기사 딕셔너리를 도착하는 대로 하나씩 반환
+
+        DOC API 응답은 증분 파싱되므로 호출 측은 관련성 평가를 전송과 동시에
+        진행할 수 있고, 충분한 후보를 얻으면 순회를 중단해 나머지 전송을 취소합니다.
+        (DOC API 호출 예산 슬롯은 응답 헤더 수신 후 반납되므로 순회 중에는 점유하지 않음)
+        (search_params 형식은 search()와 동일)
+        """
         # [추가됨] 호환성 보완: entities/themes가 있으면 keywords로 병합
-        keywords = self._merge_search_params(search_params)
+        keywords = merged_keywords or self._merge_search_params(search_params)
 
         if not keywords:
             print("⚠️ 검색 키워드가 없습니다")
-            return []
+            return
 
         # search_params에 병합된 keywords 업데이트
         merged_params = {**search_params, 'keywords': keywords}
 
-                
-
-        # 1. DOC API 시도 (Primary)
+        # 0a. 기사 코퍼스 시도 (본문까지 보유, 충분하면 GDELT 호출 생략)
+        if self.corpus.is_available():
+            corpus_kwargs = {k: v for k, v in merged_params.items() if k != 'keywords'}
+            corpus_results = self.corpus.search(keywords, **corpus_kwargs)
+            if len(corpus_results) >= config.ARTICLE_CORPUS_MIN_RESULTS:
+                for r in corpus_results:
+                    yield r.to_dict()
+                return
+
+        # 0b. 로컬 미러 시도 (충분한 결과가 있으면 원격 호출 생략)
+        local_results = []
+        if self.local.is_available():
+            local_kwargs = {k: v for k, v in merged_params.items() if k != 'keywords'}
+            local_results = self.local.search(keywords, **local_kwargs)
+            if len(local_results) >= config.GDELT_LOCAL_MIN_RESULTS:
+                for r in local_results:
+                    yield r.to_dict()
+                return
+            print("⚠️ [Local] 결과 부족, 원격 API로 전환")
+
+        # 1. DOC API 시도 (Primary, 스트리밍)
         if self.doc_api.is_available():
+            yielded = 0
             try:
                 # ⭕ 해결책: 딕셔너리에서 'keywords' 키를 제외한 나머지 옵션만 분리
                 api_kwargs = {k: v for k, v in merged_params.items() if k != 'keywords'}
-                
-                # 분리된 옵션(**api_kwargs)만 추가로 전달
-                results = self.doc_api.search(keywords, **api_kwargs)
-                
-                if results:
-                    return [r.to_dict() for r in results]
-                print("⚠️ [DOC API] 결과 없음, BigQuery로 전환")
-                
+
+                # 시간 분할 병렬 검색 (time_slices > 1인 경우)
+                slices = api_kwargs.pop('time_slices', config.GDELT_TIME_SLICES)
+                if slices and slices > 1:
+                    stream = self.doc_api.search_sliced_iter(keywords, slices, **api_kwargs)
+                else:
+                    # 분리된 옵션(**api_kwargs)만 추가로 전달
+                    stream = self.doc_api.search_iter(keywords, **api_kwargs)
+
+                for r in stream:
+                    yielded += 1
+                    yield r.to_dict()
+
             except Exception as e:
                 print(f"⚠️ [DOC API] 실행 중 오류: {e}")
                 # 오류 발생 시 BigQuery로 넘어가도록 예외 처리
-                pass
+
+            if yielded:
+                return
+            print("⚠️ [DOC API] 결과 없음, BigQuery로 전환")
+        else:
+            # 쿨다운으로 생략 → 이 호출의 결과는 DOC API 기준 결과가 아님
+            self.doc_api.note_failure()
 
         # 2. BigQuery Fallback
         if self.bigquery.is_available():
@@ -500,10 +1059,170 @@ class GDELTSearcher:
             bq_kwargs = {k: v for k, v in merged_params.items() if k != 'keywords'}
             results = self.bigquery.search(keywords, **bq_kwargs)
             if results:
-                return [r.to_dict() for r in results]
+                for r in results:
+                    yield r.to_dict()
+                return
+
+        # 원격 전략이 모두 실패하면 부족하더라도 로컬 결과 반환
+        if local_results:
+            for r in local_results:
+                yield r.to_dict()
+            return
 
         print("❌ 모든 검색 전략 실패")
-        return []
+
+    def tone_timeline(self, search_params: dict, country_codes: List[str]) -> Dict[str, Dict]:
+        """
+        국가별 일 단위 보도량 + 평균 톤 시계열 (기사 추출 없이 정량 비교)
+
+        동일한 주제 질의를 국가별 sourcecountry 필터로 나눠 DOC API
+        timelinevolraw / timelinetone 모드로 조회하며, 결과는 TTL 캐시에 보관합니다.
+
+        Returns:
+            {
+                'KR': {
+                    'series': [{'date': '2024-05-01', 'volume': 12, 'tone': -2.3}, ...],
+                    'total_volume': 120,
+                    'avg_tone': -1.8,
+                },
+                ...
+            }
+        """
+        # 국가별 맥락 주입 없이 공통 주제 키워드로 비교
+        base_params = {k: v for k, v in search_params.items() if k != 'locations'}
+        keywords = self._merge_search_params(base_params)
+        if not keywords:
+            return {}
+
+        window = resolve_event_window(base_params.get('event_date'))
+        window_key = (
+            (window[0].strftime('%Y%m%d'), window[1].strftime('%Y%m%d'))
+            if window else base_params.get('timespan') or config.GDELT_SEARCH_TIMESPAN
+        )
+        terms = tuple(sorted(t.lower() for t in self.doc_api.query_terms(keywords)))
+
+        def fetch_country(code: str):
+            cache_key = (terms, code, window_key)
+            cached = _timeline_cache.get(cache_key)
+            if cached is not None:
+                return code, cached
+
+            name = gdelt_country_name(code)
+            if not name:
+                return code, {'series': [], 'total_volume': 0, 'avg_tone': None,
+                              'message': '지원하지 않는 국가 코드입니다.'}
+
+            try:
+                extra = {'source_country': name, 'window': window,
+                         'timespan': base_params.get('timespan')}
+                volume = self.doc_api.timeline(keywords, 'timelinevolraw', **extra)
+                tone = self.doc_api.timeline(keywords, 'timelinetone', **extra)
+            except Exception as e:
+                print(f"⚠️ [Timeline] {code} 조회 실패: {e}")
+                return code, {'series': [], 'total_volume': 0, 'avg_tone': None,
+                              'message': '타임라인 조회에 실패했습니다.'}
+
+            series = []
+            weighted_tone = 0.0
+            total_volume = 0
+            for day in sorted(set(volume) | set(tone)):
+                count = int(volume.get(day, {}).get('value', 0))
+                tone_bucket = tone.get(day)
+                day_tone = (
+                    round(tone_bucket['value'] / tone_bucket['points'], 3)
+                    if tone_bucket and tone_bucket['points'] else None
+                )
+                series.append({'date': day, 'volume': count, 'tone': day_tone})
+                if day_tone is not None:
+                    weighted_tone += day_tone * count
+                total_volume += count
+
+            result = {
+                'series': series,
+                'total_volume': total_volume,
+                'avg_tone': round(weighted_tone / total_volume, 3) if total_volume else None,
+            }
+            _timeline_cache.set(cache_key, result)
+            return code, result
+
+        with ThreadPoolExecutor(max_workers=config.GDELT_DOC_MAX_CONCURRENCY) as executor:
+            return dict(executor.map(fetch_country, country_codes))
+
+    def search_adaptive(
+        self,
+        search_params: dict,
+        quota: int,
+        accept: Optional[Callable[[Dict], bool]] = None,
+        merged_keywords: Optional[List[str]] = None,
+    ) -> List[Dict]:
+        """
+        점진 확장 검색 - 좁은 최근 기간부터 시작해 관련 기사가 부족할 때만 확장
+
+        GDELT_ADAPTIVE_STEPS의 (timespan, maxrecords) 단계를 순서대로 시도하며
+        (기본: 1w/25건 → 1m/50건 → 6m/50건), accept를 통과한 기사가 quota 이상이면
+        즉시 종료합니다. search_params에 timespan이 명시되면 해당 기간만 검색하고,
+        event_date로 절대 범위가 정해지면 그 범위를 먼저 검색한 뒤 부족할 때 상대 기간 단계로 넘어갑니다.
+
+        Args:
+            search_params: search()와 동일
+            quota: 필요한 관련 기사 수
+            accept: 관련성 판정 함수 (None이면 모두 통과)
+            merged_keywords: 이미 병합된 키워드 (있으면 단계마다 병합 생략)
+
+        Returns:
+            accept를 통과한 기사 딕셔너리 리스트 (수신 순)
+        """
+        anchored = resolve_event_window(search_params.get('event_date')) is not None
+        relative_params = {k: v for k, v in search_params.items() if k != 'event_date'}
+
+        if config.GDELT_ADAPTIVE_SEARCH and not search_params.get('timespan'):
+            relative_steps = [(timespan, maxrecords, relative_params)
+                              for timespan, maxrecords in config.GDELT_ADAPTIVE_STEPS]
+        else:
+            relative_steps = [(search_params.get('timespan', config.GDELT_SEARCH_TIMESPAN),
+                               search_params.get('maxrecords', config.GDELT_DOC_MAX_RECORDS),
+                               relative_params)]
+
+        if anchored:
+            # 사건 발생일 기준 절대 범위를 먼저 검색하고, 부족하면 (추정 날짜가 틀렸을 수 있으므로)
+            # event_date 없이 상대 기간 단계로 이어서 검색
+            steps = [(None, config.GDELT_ADAPTIVE_STEPS[-1][1], search_params)] + relative_steps
+        else:
+            steps = relative_steps
+
+        accepted: List[Dict] = []
+        seen_urls: Set[str] = set()
+
+        for i, (timespan, maxrecords, base_params) in enumerate(steps):
+            if i > 0:
+                print(f"   ↔️ 관련 기사 부족 ({len(accepted)}/{quota}), 검색 기간 확장: {timespan}")
+
+            step_params = {**base_params, 'timespan': timespan, 'maxrecords': maxrecords}
+            if merged_keywords is None:
+                merged_keywords = self._merge_search_params(search_params)
+            stream = self.iter_search(step_params, merged_keywords)
+
+            for article in stream:
+                normalized = normalize_url(article['url'])
+                if normalized in seen_urls:
+                    continue
+                seen_urls.add(normalized)
+
+                if accept is None or accept(article):
+                    accepted.append(article)
+                    # 충분한 후보가 모이면 순회 중단 (남은 후보 검사 생략)
+                    if len(accepted) >= max(quota, config.GDELT_STREAM_TARGET_CANDIDATES):
+                        stream.close()
+                        break
+
+            if len(accepted) >= quota:
+                break
+
+            # DOC API를 쓸 수 없으면 이후 단계도 동일한 (기간 무관) 전략만 반복됨
+            if not self.doc_api.is_available():
+                break
+
+        return accepted
 
     def _merge_search_params(self, search_params: dict) -> List[str]:
         """
@@ -0,0 +1,241 @@
+"""
+Shared HTTP Client - 기사 수집용 공유 커넥션 풀
+
+[문제]
+ArticleExtractor가 기사마다 세션 없이 requests.get()을 호출하면, 같은 언론사의
+기사 5개를 받아도 매번 DNS 조회 + TCP 연결 + TLS 핸드셰이크를 새로 수행합니다.
+
+[동작]
+- 프로세스 전체가 하나의 클라이언트(스레드 안전)를 공유하며 호스트별 keep-alive 연결을 재사용
+- httpx + h2가 설치되어 있고 HTTP2_ENABLED이면 HTTP/2 (호스트당 연결 1개로 다중화)
+- 그 외에는 requests.Session + HTTPAdapter (호스트별 풀 크기: HTTP_POOL_PER_HOST)
+- 백엔드와 무관하게 FetchedResponse / FetchError 로 통일
+- 본문은 스트리밍으로 수신: Content-Type 불일치 시 본문을 읽지 않고, 크기 제한 또는
+  중단 마커(</article> 등)에 도달하면 나머지를 받지 않음
+  · 중단 마커는 HTTP/2 백엔드에서만 적용 (스트림만 취소하고 연결은 유지됨)
+  · HTTP/1.1(requests)에서 읽다 만 응답을 닫으면 keep-alive 연결이 버려져 다음 요청이
+    TCP+TLS 핸드셰이크를 다시 하므로, 마커를 무시하고 본문 끝까지 수신해 연결을 풀에 반환
+  · 크기 제한(max_bytes)은 두 백엔드 모두 적용 (비정상적으로 큰 응답에 한해 연결을 버림)
+
+[사용법]
+client = get_http_client()
+response = client.get(url, max_bytes=2_000_000)  # FetchedResponse (status_code, headers, content)
+"""
+import threading
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Tuple
+
+from app.config import config
+
+
+# 봇 탐지 우회를 위한 현대적인 브라우저 헤더
+BROWSER_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+    'Accept-Encoding': 'gzip, deflate, br',
+    'Referer': 'https://www.google.com/',
+    'DNT': '1',
+    'Upgrade-Insecure-Requests': '1'
+}
+
+
+class FetchError(Exception):
+    """HTTP 요청 실패 (연결 오류, 타임아웃, 4xx/5xx 응답)"""
+
+    def __init__(self, message: str, status_code: int = 0):
+        super().__init__(message)
+        self.status_code = status_code  # 응답을 받지 못했으면 0
+
+
+class SkippedContent(FetchError):
+    """허용되지 않은 Content-Type (본문을 읽지 않고 건너뜀)"""
+
+
+@dataclass
+class FetchedResponse:
+    """백엔드 공통 응답 (헤더 키는 소문자)"""
+    url: str
+    status_code: int
+    headers: Dict[str, str] = field(default_factory=dict)
+    content: bytes = b''
+    truncated: bool = False  # 크기 제한/중단 마커로 본문 일부만 수신
+
+    @property
+    def encoding(self) -> Optional[str]:
+        """Content-Type 헤더의 charset (없으면 None)"""
+        content_type = self.headers.get('content-type', '')
+        for part in content_type.split(';')[1:]:
+            key, _, value = part.strip().partition('=')
+            if key.lower() == 'charset' and value:
+                return value.strip('"\' ')
+        return None
+
+    @property
+    def not_modified(self) -> bool:
+        """조건부 요청(If-None-Match/If-Modified-Since)에 대한 304 응답"""
+        return self.status_code == 304
+
+    @property
+    def text(self) -> str:
+        return self.content.decode(self.encoding or 'utf-8', errors='replace')
+
+
+class HttpClient:
+    """스레드 안전 공유 HTTP 클라이언트 (httpx HTTP/2 또는 requests.Session 풀)"""
+
+    CHUNK_SIZE = 16 * 1024
+
+    def __init__(
+        self,
+        pool_hosts: Optional[int] = None,
+        pool_per_host: Optional[int] = None,
+        http2: Optional[bool] = None,
+    ):
+        self.pool_hosts = pool_hosts or config.HTTP_POOL_HOSTS
+        self.pool_per_host = pool_per_host or config.HTTP_POOL_PER_HOST
+        http2 = config.HTTP2_ENABLED if http2 is None else http2
+
+        self._httpx = None
+        self._session = None
+
+        if http2 and self._h2_available():
+            import httpx
+            self._httpx = httpx.Client(
+                http2=True,
+                headers=BROWSER_HEADERS,
+                follow_redirects=True,
+                limits=httpx.Limits(
+                    max_connections=self.pool_hosts * self.pool_per_host,
+                    max_keepalive_connections=self.pool_hosts,
+                    keepalive_expiry=config.HTTP_KEEPALIVE_SEC,
+                ),
+            )
+            self.backend = 'httpx/h2'
+        else:
+            import requests
+            from requests.adapters import HTTPAdapter
+            self._session = requests.Session()
+            self._session.headers.update(BROWSER_HEADERS)
+            adapter = HTTPAdapter(
+                pool_connections=self.pool_hosts,
+                pool_maxsize=self.pool_per_host,
+            )
+            self._session.mount('http://', adapter)
+            self._session.mount('https://', adapter)
+            self.backend = 'requests'
+
+    @staticmethod
+    def _h2_available() -> bool:
+        try:
+            import httpx  # noqa: F401
+            import h2  # noqa: F401
+            return True
+        except ImportError:
+            return False
+
+    def get(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+        max_bytes: Optional[int] = None,
+        content_types: Optional[Tuple[str, ...]] = None,
+        stop_markers: Tuple[bytes, ...] = (),
+    ) -> FetchedResponse:
+        """
+        스트리밍 GET 요청 (2xx/304가 아니면 FetchError)
+
+        Args:
+            url: 요청 URL
+            headers: 기본 브라우저 헤더에 덮어쓸 헤더 (선택)
+            timeout: 타임아웃 초 (기본값: ARTICLE_FETCH_TIMEOUT)
+            max_bytes: 최대 읽기 바이트 (초과분은 받지 않고 연결 종료)
+            content_types: 허용 Content-Type 접두사 (불일치 시 본문을 읽지 않고 SkippedContent)
+            stop_markers: 이 바이트열(소문자 비교)이 나타나면 읽기 중단 (예: b'</article>')
+                          - HTTP/2 백엔드에서만 적용 (HTTP/1.1은 연결 재사용을 위해 끝까지 수신)
+        """
+        timeout = timeout or config.ARTICLE_FETCH_TIMEOUT
+        try:
+            if self._httpx is not None:
+                with self._httpx.stream('GET', url, headers=headers, timeout=timeout) as response:
+                    if response.status_code != 304:  # 조건부 요청의 304는 정상 응답
+                        response.raise_for_status()
+                    return self._read(
+                        response, response.iter_bytes(self.CHUNK_SIZE),
+                        max_bytes, content_types, stop_markers,
+                    )
+
+            response = self._session.get(url, headers=headers, timeout=timeout, stream=True)
+            try:
+                response.raise_for_status()
+                return self._read(
+                    response, response.iter_content(self.CHUNK_SIZE),
+                    max_bytes, content_types, (),
+                )
+            finally:
+                response.close()
+        except FetchError:
+            raise
+        except Exception as e:
+            status_code = getattr(getattr(e, 'response', None), 'status_code', 0) or 0
+            raise FetchError(str(e), status_code) from e
+
+    @staticmethod
+    def _read(response, chunks, max_bytes, content_types, stop_markers) -> FetchedResponse:
+        """응답 헤더 확인 후 제한 범위까지만 본문 수신"""
+        fetched = FetchedResponse(
+            url=str(response.url),
+            status_code=response.status_code,
+            headers={k.lower(): v for k, v in response.headers.items()},
+        )
+
+        content_type = fetched.headers.get('content-type', '').split(';')[0].strip().lower()
+        if content_types and content_type and not content_type.startswith(content_types):
+            raise SkippedContent(f"지원하지 않는 Content-Type: {content_type}")
+
+        buffer = bytearray()
+        overlap = max((len(m) for m in stop_markers), default=0)
+        for chunk in chunks:
+            if not chunk:
+                continue
+            start = max(0, len(buffer) - overlap)
+            buffer.extend(chunk)
+
+            if max_bytes and len(buffer) >= max_bytes:
+                del buffer[max_bytes:]
+                fetched.truncated = True
+                break
+            # 직전 청크와 경계에 걸친 마커도 찾도록 겹치는 구간부터 검사
+            window = bytes(buffer[start:]).lower()
+            if any(marker in window for marker in stop_markers):
+                fetched.truncated = True
+                break
+
+        fetched.content = bytes(buffer)
+        return fetched
+
+    def close(self) -> None:
+        if self._httpx is not None:
+            self._httpx.close()
+        if self._session is not None:
+            self._session.close()
+
+
+# ============================================================
+# Shared instance
+# ============================================================
+
+_client: Optional[HttpClient] = None
+_client_lock = threading.Lock()
+
+
+def get_http_client() -> HttpClient:
+    """프로세스 공유 HTTP 클라이언트 (최초 호출 시 생성)"""
+    global _client
+
+    with _client_lock:
+        if _client is None:
+            _client = HttpClient()
+            print(f"✅ (HttpClient) 공유 커넥션 풀 생성: {_client.backend}")
+    return _client
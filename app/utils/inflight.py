@@ -0,0 +1,80 @@
+"""
+In-Flight Registry - 프로세스 전체 진행 중 작업 중복 제거 (single flight)
+
+[문제]
+비슷한 주제를 동시에 검색한 두 사용자가 같은 URL을 같은 순간에 추출하면,
+요청마다 스레드 풀이 각자 다운로드 + 파싱 + 번역을 수행합니다.
+
+[동작]
+- run(key, fn): 같은 key의 작업이 진행 중이면 새로 시작하지 않고 그 Future에 합류
+- 먼저 온 호출(owner)이 fn을 실행하고 결과/예외를 Future에 기록 → 모든 대기자가 동일하게 수신
+- 대기자는 timeout까지만 기다림 (owner 작업은 계속 진행, 완료 후 registry에서 제거)
+- 완료된 결과는 보관하지 않음 (캐시는 ArticleContentCache 등 별도 계층 담당)
+
+[사용법]
+result = article_fetches.run(canonical_url(url), lambda: fetch(url), timeout=30)
+"""
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Hashable, Optional
+
+
+class InFlightRegistry:
+    """key별 진행 중 Future 레지스트리 (스레드 안전)"""
+
+    def __init__(self, name: str = ''):
+        self.name = name
+        self._lock = threading.Lock()
+        self._futures: Dict[Hashable, Future] = {}
+        self.started = 0
+        self.joined = 0
+
+    def run(self, key: Hashable, fn: Callable[[], Any], timeout: Optional[float] = None) -> Any:
+        """
+        key 단위로 fn을 한 번만 실행
+
+        Args:
+            key: 작업 식별 키 (예: 정규화 URL)
+            fn: 실제 작업
+            timeout: 합류한 대기자의 최대 대기 시간 (초, owner에는 적용되지 않음)
+
+        Raises:
+            fn이 던진 예외 (owner/대기자 모두 동일), 대기 시간 초과 시 concurrent.futures.TimeoutError
+        """
+        with self._lock:
+            future = self._futures.get(key)
+            is_owner = future is None
+            if is_owner:
+                future = Future()
+                future.set_running_or_notify_cancel()
+                self._futures[key] = future
+                self.started += 1
+            else:
+                self.joined += 1
+
+        if not is_owner:
+            print(f"🔗 [{self.name or 'InFlight'}] 진행 중인 작업에 합류: {key}")
+            return future.result(timeout=timeout)
+
+        # 결과를 알리기 전에 registry에서 제거 (예외를 받은 대기자가 다시 run()하면 새 작업 시작)
+        try:
+            result = fn()
+        except BaseException as e:
+            self._release(key, future)
+            future.set_exception(e)
+            raise
+        self._release(key, future)
+        future.set_result(result)
+        return result
+
+    def _release(self, key: Hashable, future: Future) -> None:
+        with self._lock:
+            if self._futures.get(key) is future:
+                del self._futures[key]
+
+    def __len__(self) -> int:
+        return len(self._futures)
+
+
+# 기사 다운로드 + 파싱 + 제목 번역 (키: 정규화 URL)
+article_fetches = InFlightRegistry('ArticleFetch')
@@ -0,0 +1,159 @@
+"""
+Long Content - 긴 자막/기사의 map-reduce 1차 분석 보조 함수
+
+[문제]
+_analyze_with_gemini_bridge는 본문을 MAX_CONTENT_LENGTH_FIRST_ANALYSIS(8000자)에서 잘랐습니다.
+→ 1시간짜리 영상 자막은 앞부분 10% 남짓만 분석되고, 후반부 주장은 누락
+
+[동작]
+- split_chunks(): 문장 경계 기준, 앞 청크와 overlap만큼 겹치도록 분할 (경계에 걸친 주장 보존)
+- select_within_budget(): 요청당 토큰 예산을 넘으면 앞에서 자르지 않고 전체 구간에 고르게 분포하도록 선택
+- merge_claims(): 청크별 key_claims를 유사 문장 기준으로 합치고 키워드/국가 코드는 합집합
+  (여러 청크에서 반복된 주장일수록 앞에 배치)
+"""
+import re
+from collections import Counter
+from difflib import SequenceMatcher
+from typing import Dict, List
+
+from app.config import config
+
+
+# 문장 끝 (종결 부호 뒤 공백 또는 줄바꿈)
+_SENTENCE_END = re.compile(r'(?<=[.!?。])\s+|\n+')
+_NORMALIZE = re.compile(r'[\s\W_]+', re.UNICODE)
+
+# 같은 주장으로 볼 유사도
+CLAIM_SIMILARITY = 0.75
+
+
+def estimate_tokens(text: str) -> int:
+    """대략적인 토큰 수 (문자 수 기반 추정)"""
+    return int(len(text) / config.LONG_CONTENT_CHARS_PER_TOKEN) + 1
+
+
+def split_chunks(text: str, size: int, overlap: int) -> List[str]:
+    """
+    겹치는 청크로 분할
+
+    청크 끝은 size 안의 마지막 문장 경계(없으면 size)에서 자르고,
+    다음 청크는 그 지점보다 약 overlap만큼 앞의 문장 경계에서 시작합니다.
+    """
+    text = text.strip()
+    if len(text) <= size:
+        return [text] if text else []
+
+    chunks = []
+    start = 0
+    while start < len(text):
+        end = min(start + size, len(text))
+        if end < len(text):
+            # 청크 후반부의 마지막 문장 경계
+            boundary = None
+            for match in _SENTENCE_END.finditer(text, start + size // 2, end):
+                boundary = match.end()
+            if boundary:
+                end = boundary
+        chunks.append(text[start:end].strip())
+        if end >= len(text):
+            break
+        # 겹침 구간도 문장 경계에서 시작
+        next_start = end - overlap
+        match = _SENTENCE_END.search(text, next_start, end)
+        if match and match.end() < end:
+            next_start = match.end()
+        start = max(next_start, start + 1)
+    return [c for c in chunks if c]
+
+
+def select_within_budget(chunks: List[str], tokens_per_call: int, budget: int) -> List[int]:
+    """
+    토큰 예산 안에서 분석할 청크 인덱스
+
+    Args:
+        tokens_per_call: 청크 외 호출당 고정 비용 (프롬프트 + 출력)
+        budget: map 단계에 쓸 수 있는 토큰
+
+    Returns:
+        선택된 인덱스 (오름차순, 처음/끝 청크 포함, 나머지는 균등 간격)
+    """
+    costs = [estimate_tokens(c) + tokens_per_call for c in chunks]
+    if sum(costs) <= budget:
+        return list(range(len(chunks)))
+
+    average = sum(costs) / len(costs)
+    count = max(1, min(len(chunks), int(budget // average)))
+    if count == 1:
+        return [0]
+    step = (len(chunks) - 1) / (count - 1)
+    return sorted({round(i * step) for i in range(count)})
+
+
+def _normalize(text: str) -> str:
+    return _NORMALIZE.sub('', text or '').lower()
+
+
+def _merge_unique(target: List[str], values: List[str], limit: int) -> None:
+    seen = {v.lower() for v in target}
+    for value in values or []:
+        if value and value.lower() not in seen and len(target) < limit:
+            target.append(value)
+            seen.add(value.lower())
+
+
+def merge_claims(partials: List[Dict], max_claims: int) -> List[Dict]:
+    """
+    청크별 key_claims 병합 + 중복 제거
+
+    Args:
+        partials: 청크 순서대로 정렬된 1차 분석 결과 목록
+        max_claims: 최대 주장 수
+
+    Returns:
+        기존 스키마의 key_claims ({'claim_kr', 'search_keywords_en', 'target_country_codes'})
+    """
+    merged: List[Dict] = []
+    for order, partial in enumerate(partials):
+        for claim in partial.get('key_claims', []) or []:
+            text = claim.get('claim_kr', '')
+            key = _normalize(text)
+            if not key:
+                continue
+
+            match = None
+            for existing in merged:
+                if SequenceMatcher(None, key, existing['_key']).ratio() >= CLAIM_SIMILARITY:
+                    match = existing
+                    break
+
+            if match is None:
+                match = {
+                    'claim_kr': text,
+                    'search_keywords_en': [],
+                    'target_country_codes': [],
+                    '_key': key,
+                    '_support': 0,
+                    '_order': order,
+                }
+                merged.append(match)
+            match['_support'] += 1
+            _merge_unique(match['search_keywords_en'], claim.get('search_keywords_en', []), 8)
+            _merge_unique(match['target_country_codes'], claim.get('target_country_codes', []), 8)
+
+    # 반복 언급된 주장 우선, 같으면 영상/기사 순서
+    merged.sort(key=lambda c: (-c['_support'], c['_order']))
+    return [
+        {k: v for k, v in claim.items() if not k.startswith('_')}
+        for claim in merged[:max_claims]
+    ]
+
+
+def merge_topics(partials: List[Dict], limit: int = 5) -> List[str]:
+    """청크별 topics를 등장 빈도순으로 병합"""
+    counts = Counter()
+    first_seen: Dict[str, int] = {}
+    for partial in partials:
+        for topic in partial.get('topics', []) or []:
+            counts[topic] += 1
+            first_seen.setdefault(topic, len(first_seen))
+    return sorted(counts, key=lambda t: (-counts[t], first_seen[t]))[:limit]
@@ -0,0 +1,151 @@
+"""
+Media Stream - yt-dlp 출력을 GCS Resumable Upload로 바로 전송 (임시 파일 없음)
+
+[문제]
+기존 yt-dlp 단계는 720p 영상을 tempfile.gettempdir()에 통째로 받은 뒤
+upload_from_filename으로 다시 읽어 올렸습니다.
+→ 디스크 I/O 2배, Cloud Run에서는 임시 디렉터리가 메모리 파일시스템이라 메모리 압박
+
+[동작]
+- yt-dlp를 하위 프로세스로 실행하고 출력을 stdout('-o -')으로 받음
+- stdout을 청크 단위로 읽어 blob.open('wb') (Resumable Upload)에 그대로 기록
+  → 메모리에는 업로드 청크 1개(YOUTUBE_UPLOAD_CHUNK_BYTES)만 유지
+- 오디오 모드: 음성 위주 콘텐츠는 m4a 오디오만 전송 (영상 대비 전송량 1/10 수준)
+- 취소/실패/용량 초과 시 하위 프로세스를 종료하고 업로드 폐기 (_abort_upload)
+  (닫지 않은 writer는 GC 시점에 close()되어 잘린 객체가 확정되므로 그대로 두지 않음)
+
+[주의]
+stdout 출력은 단일 파일 포맷만 가능 (영상+오디오 병합 불가) → 포맷 문자열은 progressive mp4 / m4a로 제한
+"""
+import sys
+import threading
+import subprocess
+from collections import deque
+from typing import Callable, Optional
+
+from app.config import config
+
+
+MEDIA_AUDIO = 'audio'
+MEDIA_VIDEO = 'video'
+
+# 모드별 (yt-dlp 포맷, Gemini/GCS 콘텐츠 타입)
+MEDIA_FORMATS = {
+    MEDIA_AUDIO: (config.YOUTUBE_AUDIO_FORMAT, 'audio/mp4'),
+    MEDIA_VIDEO: (config.YOUTUBE_VIDEO_FORMAT, 'video/mp4'),
+}
+
+
+class MediaStreamError(Exception):
+    """yt-dlp 스트리밍 실패 (received: 실패 전까지 받은 바이트 수)"""
+
+    def __init__(self, message: str, received: int = 0):
+        super().__init__(message)
+        self.received = received
+
+
+def _drain(stream, lines: deque) -> None:
+    """stderr를 계속 비워 파이프가 막히지 않게 하고 마지막 몇 줄만 보관"""
+    for raw in iter(stream.readline, b''):
+        lines.append(raw.decode('utf-8', errors='replace').strip())
+    stream.close()
+
+
+def _abort_upload(writer, blob) -> None:
+    """
+    확정하지 않은 업로드 폐기
+
+    google-cloud-storage 3.x는 writer.terminate()로 세션만 취소합니다.
+    2.x에는 terminate()가 없으므로 직접 close()해 확정한 뒤 즉시 삭제합니다.
+    (완료 표시 메타데이터가 없으므로 삭제 전 잠깐 보이는 객체도 재사용되지 않음)
+    """
+    try:
+        terminate = getattr(writer, 'terminate', None)
+        if terminate is not None:
+            terminate()
+            return
+        writer.close()
+        blob.delete()
+    except Exception as e:
+        print(f"⚠️ (MediaStream) 업로드 폐기 실패: {e}")
+
+
+def stream_to_blob(
+    url: str,
+    blob,
+    mode: str = MEDIA_AUDIO,
+    should_stop: Optional[Callable[[], bool]] = None,
+) -> int:
+    """
+    유튜브 미디어를 GCS blob으로 스트리밍 업로드
+
+    Args:
+        url: 유튜브 URL
+        blob: google.cloud.storage Blob (open('wb') 지원 객체)
+        mode: MEDIA_AUDIO 또는 MEDIA_VIDEO
+        should_stop: 청크마다 확인하는 중단 조건 (True면 즉시 중단)
+
+    Returns:
+        업로드한 바이트 수
+
+    Raises:
+        MediaStreamError: yt-dlp 실패, 빈 출력, 용량 초과
+        should_stop이 True가 된 경우에는 InterruptedError
+    """
+    fmt, content_type = MEDIA_FORMATS[mode]
+    command = [
+        sys.executable, '-m', 'yt_dlp',
+        '--format', fmt,
+        '--output', '-',
+        '--no-playlist',
+        '--no-part',
+        '--quiet',
+        '--no-warnings',
+        url,
+    ]
+
+    process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    stderr_tail: deque = deque(maxlen=5)
+    stderr_thread = threading.Thread(target=_drain, args=(process.stderr, stderr_tail), daemon=True)
+    stderr_thread.start()
+
+    writer = None
+    received = 0
+    finished = False
+    try:
+        writer = blob.open('wb', chunk_size=config.YOUTUBE_UPLOAD_CHUNK_BYTES, content_type=content_type)
+        while True:
+            if should_stop and should_stop():
+                raise InterruptedError("스트리밍 중단 요청")
+            chunk = process.stdout.read(config.YOUTUBE_UPLOAD_CHUNK_BYTES)
+            if not chunk:
+                break
+            received += len(chunk)
+            if received > config.YOUTUBE_MAX_MEDIA_BYTES:
+                raise MediaStreamError(
+                    f"미디어 용량 초과 ({config.YOUTUBE_MAX_MEDIA_BYTES // (1024 * 1024)}MB)", received
+                )
+            writer.write(chunk)
+
+        return_code = process.wait()
+        stderr_thread.join(timeout=1)
+        if return_code != 0:
+            raise MediaStreamError(
+                f"yt-dlp 종료 코드 {return_code}: {' | '.join(stderr_tail) or '원인 불명'}", received
+            )
+        if received == 0:
+            raise MediaStreamError("yt-dlp 출력이 비어 있음", received)
+
+        # 마지막 청크 전송 + 업로드 확정
+        writer.close()
+        finished = True
+        return received
+
+    finally:
+        if process.poll() is None:
+            process.kill()
+            process.wait()
+        if not finished:
+            if writer is not None:
+                _abort_upload(writer, blob)
+            print(f"⚠️ (MediaStream) 업로드 중단: {received // 1024}KB 수신 후")
@@ -0,0 +1,99 @@
+"""
+Article Metadata Fetcher - <head>까지만 받아 제목/설명/발행일을 얻는 경량 요청
+
+[문제]
+get_global_perspectives의 관련성 필터는 제목만 있으면 되지만, BigQuery GKG/로컬 미러
+결과는 title이 비어 있어 도메인명으로 임베딩을 계산하게 됩니다.
+
+[동작]
+- </head>가 나오면(HTTP/2 백엔드) 또는 METADATA_MAX_BYTES에 도달하면 수신 중단
+- <title>, og:title, og:description, 발행일 메타 태그만 추출 (본문 파싱 없음)
+- 도메인 스케줄러의 슬롯/건너뛰기 판단은 공유하되 실패는 기록하지 않음
+  (5초 타임아웃의 경량 조회 실패로 본문 추출까지 막히지 않도록)
+- URL별 결과는 TTL 캐시에 보관 (빈 결과는 METADATA_EMPTY_CACHE_TTL_SEC만)
+- enrich(): 제목 없는 후보들을 병렬로 채워 본문 추출 전에 제대로 점수화
+"""
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List
+
+from app.config import config
+from app.models.article_parser import parse_head
+from app.utils.cache import TTLCache
+from app.utils.domain_scheduler import domain_scheduler
+from app.utils.http_client import FetchError, SkippedContent, get_http_client
+
+
+class ArticleMetadataFetcher:
+    """<head> 메타데이터 전용 요청기"""
+
+    STOP_MARKERS = (b'</head>', b'<body')
+
+    def __init__(self):
+        self._cache = TTLCache(max_size=10000, ttl=config.METADATA_CACHE_TTL_SEC)
+
+    def fetch(self, url: str) -> Dict[str, str]:
+        """
+        URL의 <head> 메타데이터
+
+        Returns:
+            {'title', 'description', 'published', 'site_name'} (실패 시 빈 딕셔너리)
+        """
+        cached = self._cache.get(url)
+        if cached is not None:
+            return cached
+
+        if domain_scheduler.skip_reason(url):
+            return {}
+
+        metadata: Dict[str, str] = {}
+        try:
+            with domain_scheduler.slot(url):
+                response = get_http_client().get(
+                    url,
+                    timeout=config.METADATA_FETCH_TIMEOUT,
+                    max_bytes=config.METADATA_MAX_BYTES,
+                    content_types=config.ARTICLE_CONTENT_TYPES,
+                    stop_markers=self.STOP_MARKERS,
+                )
+            metadata = parse_head(response.content, response.encoding)
+        except SkippedContent:
+            pass
+        except FetchError as e:
+            print(f"⚠️ [Metadata] 메타데이터 요청 실패: {url} - {e}")
+        except Exception as e:
+            print(f"⚠️ [Metadata] 메타데이터 추출 실패: {url} - {e}")
+
+        if metadata:
+            self._cache.set(url, metadata)
+        else:
+            self._cache.set(url, metadata, ttl=config.METADATA_EMPTY_CACHE_TTL_SEC)
+        return metadata
+
+    def enrich(self, articles: List[Dict]) -> int:
+        """
+        제목 없는 기사에 메타데이터 채우기 (병렬)
+
+        title이 비어 있으면 title, date가 비어 있으면 published(YYYY-MM-DD)를 채우고
+        설명은 'description'으로 추가합니다.
+
+        Returns:
+            제목을 얻은 기사 수
+        """
+        targets = [a for a in articles if not a.get('title') and a.get('url')]
+        if not targets:
+            return 0
+
+        print(f"🏷️ [Metadata] 제목 없는 후보 {len(targets)}개 메타데이터 조회")
+        with ThreadPoolExecutor(max_workers=config.THREAD_POOL_WORKERS) as executor:
+            results = list(executor.map(lambda a: self.fetch(a['url']), targets))
+
+        enriched = 0
+        for article, metadata in zip(targets, results):
+            if metadata.get('title'):
+                article['title'] = metadata['title']
+                enriched += 1
+            if metadata.get('description'):
+                article['description'] = metadata['description']
+            if not article.get('date') and metadata.get('published'):
+                article['date'] = metadata['published'][:10]
+        return enriched
@@ -0,0 +1,214 @@
+"""
+Parse Pool - HTML 파싱 전용 프로세스 풀 (GIL 회피)
+
+[문제]
+trafilatura/lxml 후처리/BeautifulSoup은 CPU 바운드 파이썬 코드라서,
+_extract_contents_parallel의 20개 스레드 안에서 실행하면 GIL에서 직렬화되고
+부하 시 Flask 요청 스레드까지 굶게 됩니다.
+
+[동작]
+- 네트워크 수신(I/O)은 기존 스레드에서, 파싱(CPU)은 별도 프로세스 풀에서 수행
+- 입력은 원본 바이트 + charset (+ 도메인 프로필 XPath), 출력은 {'title', 'content', ...} 작은 딕셔너리
+- 워커 수: PARSE_POOL_WORKERS (0이면 CPU 코어 수), 대기 작업 수 상한: PARSE_POOL_MAX_PENDING
+- 풀을 사용할 수 없으면(비활성화/프로세스 손상/재생성 중) 현재 스레드에서 파싱
+- 시간 초과/워커 예외는 ParseError로 알림 (빈 본문으로 돌려주면 호출 측이
+  '본문 부족'으로 기록해 정상 URL을 오래 건너뛰므로)
+- 실행 중인 파싱이 PARSE_TIMEOUT_SEC를 넘기면 워커를 종료하고 풀 재생성
+  (실행 중인 future는 cancel()되지 않아 멈춘 파싱이 워커를 계속 점유하므로)
+- stats(): 처리량/대기 시간/파싱 시간 지표 (/health에 노출)
+"""
+import os
+import time
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, Optional
+
+from app.config import config
+from app.models.article_parser import parse_to_dict
+
+
+class ParseError(Exception):
+    """파싱 풀 내부 실패 (시간 초과, 워커 예외) - 문서 자체의 문제가 아님"""
+
+
+class ParsePool:
+    """HTML 파싱 프로세스 풀 + 지표"""
+
+    def __init__(self, workers: Optional[int] = None, max_pending: Optional[int] = None):
+        self.workers = workers or config.PARSE_POOL_WORKERS or os.cpu_count() or 1
+        self.max_pending = max_pending or config.PARSE_POOL_MAX_PENDING
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        # 대기 작업 수 상한 (원본 바이트가 메모리에 쌓이지 않도록)
+        self._pending = threading.BoundedSemaphore(self.max_pending)
+
+        self._metrics = {
+            'submitted': 0,
+            'completed': 0,
+            'failed': 0,
+            'timeouts': 0,
+            'recycled': 0,
+            'inline': 0,
+            'in_flight': 0,
+            'bytes_in': 0,
+            'parse_sec': 0.0,
+            'wait_sec': 0.0,
+        }
+
+    def _get_executor(self) -> Optional[ProcessPoolExecutor]:
+        if not config.PARSE_POOL_ENABLED:
+            return None
+        with self._lock:
+            if self._executor is None:
+                method = config.PARSE_POOL_START_METHOD
+                if method not in multiprocessing.get_all_start_methods():
+                    method = 'spawn'
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context(method),
+                )
+                print(f"✅ (ParsePool) 파싱 프로세스 풀 시작: {self.workers}개 워커 ({method})")
+            return self._executor
+
+    def _reset_executor(self) -> None:
+        """손상된 풀 폐기 (다음 호출에서 재생성)"""
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+    def _recycle_executor(self, executor: ProcessPoolExecutor) -> None:
+        """멈춘 워커가 있는 풀 폐기 (워커 프로세스 종료, 다음 호출에서 재생성)"""
+        with self._lock:
+            if self._executor is not executor:
+                return  # 다른 스레드가 이미 재생성
+            self._executor = None
+            self._metrics['recycled'] += 1
+        processes = list((getattr(executor, '_processes', None) or {}).values())
+        executor.shutdown(wait=False, cancel_futures=True)
+        for process in processes:
+            try:
+                if process.is_alive():
+                    process.terminate()
+            except Exception as e:
+                print(f"⚠️ (ParsePool) 워커 종료 실패: {e}")
+
+    def _record(self, **deltas) -> None:
+        with self._lock:
+            for key, value in deltas.items():
+                self._metrics[key] += value
+
+    def parse(
+        self,
+        content: bytes,
+        header_charset: Optional[str] = None,
+        profile_xpath: Optional[str] = None,
+    ) -> Dict:
+        """
+        HTML 바이트 파싱 (호출 스레드는 결과를 기다리는 동안 GIL을 놓음)
+
+        Args:
+            profile_xpath: 도메인 프로필 본문 XPath (fast path)
+
+        Returns:
+            {'title', 'content', 'strategy', 'selector'}
+
+        Raises:
+            ParseError: 시간 초과 또는 워커 예외
+        """
+        executor = self._get_executor()
+        if executor is None:
+            return self._parse_inline(content, header_charset, profile_xpath)
+
+        self._pending.acquire()
+        self._record(submitted=1, in_flight=1, bytes_in=len(content))
+        started = time.perf_counter()
+        try:
+            try:
+                future = executor.submit(parse_to_dict, content, header_charset, profile_xpath)
+            except BrokenProcessPool:
+                raise  # 아래에서 풀 재생성
+            except RuntimeError:
+                # 다른 스레드가 방금 풀을 폐기함 (shutdown 후 submit) → 현재 스레드에서 파싱
+                print("⚠️ (ParsePool) 재생성 중인 풀, 현재 스레드에서 파싱")
+                return self._parse_inline(content, header_charset, profile_xpath)
+            result = future.result(timeout=config.PARSE_TIMEOUT_SEC)
+        except FutureTimeoutError:
+            self._record(timeouts=1)
+            if future.cancel():
+                print("⚠️ (ParsePool) 파싱 시간 초과 (대기 중 취소)")
+            else:
+                # 실행 중인 파싱은 취소할 수 없음 → 워커를 종료하고 풀 재생성
+                # (같은 풀의 다른 작업은 BrokenProcessPool → 현재 스레드에서 파싱)
+                print("⚠️ (ParsePool) 파싱 시간 초과, 워커 종료 후 풀 재생성")
+                self._recycle_executor(executor)
+            raise ParseError(f"파싱 시간 초과 ({config.PARSE_TIMEOUT_SEC}초)")
+        except BrokenProcessPool:
+            self._record(failed=1)
+            print("⚠️ (ParsePool) 프로세스 풀 손상, 재생성 후 현재 스레드에서 파싱")
+            self._reset_executor()
+            return self._parse_inline(content, header_charset, profile_xpath)
+        except Exception as e:
+            self._record(failed=1)
+            print(f"⚠️ (ParsePool) 파싱 실패: {e}")
+            raise ParseError(f"파싱 실패: {e}") from e
+        finally:
+            self._record(in_flight=-1)
+            self._pending.release()
+
+        elapsed = time.perf_counter() - started
+        parse_sec = result.pop('parse_sec', 0.0)
+        self._record(completed=1, parse_sec=parse_sec, wait_sec=max(0.0, elapsed - parse_sec))
+        return result
+
+    def _parse_inline(self, content: bytes, header_charset: Optional[str], profile_xpath: Optional[str]) -> Dict:
+        result = parse_to_dict(content, header_charset, profile_xpath)
+        self._record(inline=1, parse_sec=result.pop('parse_sec', 0.0))
+        return result
+
+    def stats(self) -> Dict:
+        """처리 지표 (평균 파싱/대기 시간은 ms)"""
+        with self._lock:
+            metrics = dict(self._metrics)
+        completed = metrics['completed'] or 1
+        return {
+            'enabled': bool(config.PARSE_POOL_ENABLED),
+            'workers': self.workers,
+            'max_pending': self.max_pending,
+            'submitted': metrics['submitted'],
+            'completed': metrics['completed'],
+            'failed': metrics['failed'],
+            'timeouts': metrics['timeouts'],
+            'recycled': metrics['recycled'],
+            'inline': metrics['inline'],
+            'in_flight': metrics['in_flight'],
+            'mb_in': round(metrics['bytes_in'] / 1_000_000, 2),
+            'avg_parse_ms': round(metrics['parse_sec'] / completed * 1000, 1),
+            'avg_wait_ms': round(metrics['wait_sec'] / completed * 1000, 1),
+        }
+
+    def shutdown(self) -> None:
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+
+
+# ============================================================
+# Shared instance
+# ============================================================
+
+_pool: Optional[ParsePool] = None
+_pool_lock = threading.Lock()
+
+
+def get_parse_pool() -> ParsePool:
+    """프로세스 공유 파싱 풀 (최초 파싱 시 워커 프로세스 시작)"""
+    global _pool
+
+    with _pool_lock:
+        if _pool is None:
+            _pool = ParsePool()
+    return _pool
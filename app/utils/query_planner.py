@@ -0,0 +1,158 @@
+"""
+GDELT Query Planner - 요청 단위 검색 계획 (중복 호출 제거)
+
+[문제]
+국가별/주장별로 GDELTSearcher.search()를 따로 호출하면, DOC API 쿼리에 실제로
+들어가는 검색어(상위 3개 키워드)가 같은 하위 질의가 여러 번 전송됩니다.
+
+[동작]
+1. add(): 라벨(국가 코드, 주장 인덱스 등)별 검색 파라미터를 한 번만 병합하고
+   실제 검색 조건(검색어 집합 + 기간 + 옵션)으로 정규화한 키를 계산
+2. 동일 키는 하나의 PlannedQuery로 합치고, 캐시된 통계로 예상 결과 수를 추정
+   (최근 반복적으로 0건이었던 질의는 실행 생략)
+3. execute(): 최소한의 질의만 병렬 실행한 뒤 결과를 필요한 라벨에 다시 분배
+
+[사용법]
+plan = QueryPlan(searcher)
+plan.add('KR', {'keywords': [...], 'locations': ['KR']})
+plan.add('US', {'keywords': [...], 'locations': ['US']})
+results = plan.execute()  # {'KR': [...], 'US': [...]}
+"""
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Hashable, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+
+from app.config import config
+from app.utils.cache import TTLCache
+from app.utils.gdelt_search import GDELTSearcher, resolve_event_window
+
+
+# 질의 키 → (평균 결과 수, 관측 횟수)
+_query_stats = TTLCache(max_size=4096, ttl=config.QUERY_STATS_TTL_SEC)
+
+
+@dataclass
+class PlannedQuery:
+    """실행 단위 하위 질의"""
+    key: tuple
+    params: dict
+    keywords: List[str]
+    labels: List[Hashable] = field(default_factory=list)
+    estimated_yield: Optional[float] = None
+    skipped: bool = False
+
+
+class QueryPlan:
+    """요청 하나에 필요한 GDELT 질의 집합"""
+
+    def __init__(self, searcher: GDELTSearcher):
+        self.searcher = searcher
+        self.queries: Dict[tuple, PlannedQuery] = {}
+        self._label_keys: Dict[Hashable, Optional[tuple]] = {}
+
+    def add(self, label: Hashable, search_params: dict) -> None:
+        """라벨별 검색 파라미터 등록 (동일 조건 질의는 하나로 병합)"""
+        keywords = self.searcher._merge_search_params(search_params)
+        if not keywords:
+            self._label_keys[label] = None
+            return
+
+        key = self._canonical_key(search_params, keywords)
+        self._label_keys[label] = key
+
+        query = self.queries.get(key)
+        if query is None:
+            query = PlannedQuery(key=key, params=search_params, keywords=keywords)
+            query.estimated_yield = self.estimate_yield(key)
+            # 최근 반복적으로 결과가 없던 질의는 실행하지 않음
+            stats = _query_stats.get(key)
+            query.skipped = bool(stats and stats[0] == 0 and stats[1] >= 2)
+            self.queries[key] = query
+        query.labels.append(label)
+
+    def _canonical_key(self, search_params: dict, keywords: List[str]) -> tuple:
+        """실제 검색 결과를 결정하는 조건만으로 정규화한 질의 키"""
+        terms = tuple(sorted({t.lower() for t in self.searcher.doc_api.query_terms(keywords)}))
+        window = resolve_event_window(search_params.get('event_date'))
+        window_key = (
+            (window[0].strftime('%Y%m%d'), window[1].strftime('%Y%m%d'))
+            if window else search_params.get('timespan')
+        )
+        # 코퍼스는 locations로 국가를 필터링하므로 코퍼스 사용 시에만 키에 포함
+        locations = (
+            tuple(sorted(search_params.get('locations') or []))
+            if self.searcher.corpus.is_available() else ()
+        )
+        return (
+            terms,
+            window_key,
+            search_params.get('maxrecords'),
+            search_params.get('time_slices'),
+            tuple(search_params.get('domains') or ()),
+            locations,
+        )
+
+    @staticmethod
+    def estimate_yield(key: tuple) -> Optional[float]:
+        """캐시된 통계 기반 예상 결과 수 (관측 이력이 없으면 None)"""
+        stats = _query_stats.get(key)
+        return stats[0] if stats else None
+
+    @staticmethod
+    def _record_yield(key: tuple, count: int) -> None:
+        stats = _query_stats.get(key)
+        if stats:
+            average, observations = stats
+            # 지수 이동 평균 (최근 결과에 가중치)
+            _query_stats.set(key, (average * 0.5 + count * 0.5, observations + 1))
+        else:
+            _query_stats.set(key, (float(count), 1))
+
+    def execute(
+        self,
+        runner: Optional[Callable[[dict, List[str]], List[Dict]]] = None,
+    ) -> Dict[Hashable, List[Dict]]:
+        """
+        최소 질의 집합을 병렬 실행하고 라벨별 결과로 분배
+
+        Args:
+            runner: (search_params, merged_keywords) → 기사 리스트
+                    (기본값: GDELTSearcher.search)
+
+        Returns:
+            {label: 기사 딕셔너리 리스트} (라벨마다 독립된 사본)
+        """
+        runner = runner or self.searcher.search
+        to_run = [q for q in self.queries.values() if not q.skipped]
+        # 예상 결과가 많은 질의부터 실행 (관측 이력이 없으면 우선)
+        to_run.sort(key=lambda q: -1 if q.estimated_yield is None else -q.estimated_yield)
+
+        print(
+            f"🗺️ [QueryPlan] 라벨 {len(self._label_keys)}개 → 질의 {len(self.queries)}개 "
+            f"(실행 {len(to_run)}개, 생략 {len(self.queries) - len(to_run)}개)"
+        )
+
+        results_by_key: Dict[tuple, List[Dict]] = {}
+
+        def run(query: PlannedQuery):
+            # DOC API 타임아웃/429 등은 전략 내부에서 빈 결과로 처리되므로 이 호출의 실패 기록으로 판별
+            with self.searcher.doc_api.failure_scope() as scope:
+                try:
+                    results = runner(query.params, query.keywords)
+                except Exception as e:
+                    print(f"⚠️ [QueryPlan] 질의 실행 실패: {e}")
+                    return query.key, [], False
+            return query.key, results, not scope['failed']
+
+        if to_run:
+            with ThreadPoolExecutor(max_workers=config.GDELT_DOC_MAX_CONCURRENCY) as executor:
+                for key, results, succeeded in executor.map(run, to_run):
+                    results_by_key[key] = results
+                    # 실패한 실행은 '결과 없음' 통계에 넣지 않음 (일시 장애로 질의가 생략되지 않도록)
+                    if succeeded:
+                        self._record_yield(key, len(results))
+
+        return {
+            label: [dict(article) for article in results_by_key.get(key, [])] if key else []
+            for label, key in self._label_keys.items()
+        }
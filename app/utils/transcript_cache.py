@@ -0,0 +1,83 @@
+"""
+Transcript Cache - 유튜브 영상 텍스트 영구 캐시 (Firestore)
+
+[문제]
+같은 영상이 youtu.be/..., watch?v=...&t=, /shorts/, 모바일 URL 등 여러 형태로 들어오면
+URL 기반 캐시가 모두 miss가 되어 자막 조회(또는 영상 다운로드 + Gemini 분석)를 반복합니다.
+
+[동작]
+- 키: (정규화 video_id, 출처) → 문서 ID "{video_id}_{출처}"
+  · 출처: 자막 언어 코드('ko', 'en') 또는 폴백 단계('gemini_video', 'gemini_url')
+- 값: zlib 압축 텍스트 (최대 TRANSCRIPT_CACHE_MAX_CHARS자)
+- get_best(): 선호 순서(ko → en → gemini_video → gemini_url)의 모든 키를 get_all 1회로 조회
+  → 어떤 단계로든 한 번 얻은 텍스트는 비싼 단계를 다시 실행하지 않음
+"""
+import zlib
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Tuple
+
+from app.config import config
+
+
+# 출처 선호 순서 (자막 > 영상 분석)
+SOURCE_PREFERENCE = ('ko', 'en', 'gemini_video', 'gemini_url')
+
+
+class TranscriptCache:
+    """Firestore 기반 영상 텍스트 캐시 (db가 None이면 항상 miss)"""
+
+    COLLECTION = 'transcript_cache'
+
+    def __init__(self, db=None):
+        self.db = db
+
+    def is_available(self) -> bool:
+        return self.db is not None
+
+    @staticmethod
+    def _doc_id(video_id: str, source: str) -> str:
+        return f"{video_id}_{source}"
+
+    def get_best(self, video_id: str) -> Optional[Tuple[str, str]]:
+        """
+        선호 순서상 가장 좋은 캐시 텍스트
+
+        Returns:
+            (텍스트, 출처) 또는 None
+        """
+        if not self.db or not video_id:
+            return None
+        try:
+            collection = self.db.collection(self.COLLECTION)
+            refs = [collection.document(self._doc_id(video_id, s)) for s in SOURCE_PREFERENCE]
+            found = {}
+            for snapshot in self.db.get_all(refs):
+                if snapshot.exists:
+                    data = snapshot.to_dict()
+                    found[data.get('source', '')] = zlib.decompress(data['text_z']).decode('utf-8')
+        except Exception as e:
+            print(f"⚠️ [TranscriptCache] 조회 실패: {e}")
+            return None
+
+        for source in SOURCE_PREFERENCE:
+            if found.get(source):
+                return found[source], source
+        return None
+
+    def set(self, video_id: str, source: str, text: str) -> None:
+        """영상 텍스트 저장 (압축)"""
+        if not self.db or not video_id or not text:
+            return
+        try:
+            now = datetime.now(timezone.utc)
+            body = text[:config.TRANSCRIPT_CACHE_MAX_CHARS].encode('utf-8')
+            self.db.collection(self.COLLECTION).document(self._doc_id(video_id, source)).set({
+                'video_id': video_id,
+                'source': source,
+                'text_z': zlib.compress(body, 6),
+                'length': len(text),
+                'cached_at': now,
+                'expires_at': now + timedelta(days=config.TRANSCRIPT_CACHE_RETENTION_DAYS),
+            })
+        except Exception as e:
+            print(f"⚠️ [TranscriptCache] 저장 실패: {e}")
@@ -0,0 +1,200 @@
+"""
+Video Blob Store - 영상 ID 기반 GCS 미디어 재사용 (content-addressed)
+
+[문제]
+yt-dlp 단계는 매번 uuid4 이름으로 업로드하고 finally에서 삭제했습니다.
+→ 인기 영상도 캐시 miss마다(Gemini 호출 실패 후 재시도 포함) 다운로드 + 업로드를 반복
+
+[동작]
+- 객체 이름: video-analysis/{video_id}/{mode}.{ext} (mode: audio/video)
+  → 같은 영상·같은 포맷이면 같은 객체, 이미 있으면 다운로드/업로드 생략
+- 업로드가 끝나면 객체 메타데이터에 완료 표시(바이트 수)를 기록하고, find()는 표시가 있고
+  크기가 일치하는 객체만 재사용 (중단/GC로 확정된 잘린 객체는 무시하고 다시 업로드)
+- 같은 영상의 동시 업로드는 하나로 합침 (InFlightRegistry)
+  → owner 요청이 취소되어 업로드가 중단되면, 취소되지 않은 대기자가 다시 시도 (새 owner)
+- 삭제는 하지 않고 버킷 수명 주기 규칙에 맡김: 마지막 사용 후 VIDEO_BLOB_TTL_DAYS일 지나면 삭제
+  · 업로드/재사용 시 객체 custom time을 현재 시각으로 갱신 (재사용은 1시간에 한 번만)
+  · 규칙 조건은 daysSinceCustomTime → 자주 쓰이는 객체가 Gemini 호출 중에 삭제되지 않음
+  → ensure_lifecycle()로 규칙 등록 (scripts/setup_video_lifecycle.py)
+
+[테스트]
+bucket은 get_blob(name), blob(name) → open('wb', ...)/patch()만 있으면 되므로 로컬 가짜 객체로 대체 가능
+(YoutubeExtractor(storage_client=...)로 주입)
+"""
+import hashlib
+from datetime import datetime, timedelta, timezone
+from typing import Iterable, Optional, Tuple
+
+from app.config import config
+from app.utils.inflight import InFlightRegistry
+from app.utils.media_stream import MEDIA_AUDIO, MEDIA_VIDEO, MediaStreamError, stream_to_blob
+
+
+MEDIA_EXTENSIONS = {MEDIA_AUDIO: 'm4a', MEDIA_VIDEO: 'mp4'}
+
+# 업로드 완료 표시 (객체 메타데이터, 값: 업로드한 바이트 수)
+COMPLETE_METADATA = 'upload-complete-bytes'
+
+# 재사용 시 custom time(마지막 사용 시각) 갱신 간격
+TOUCH_INTERVAL = timedelta(hours=1)
+
+# 영상 ID 단위 업로드 (키: 객체 키)
+video_uploads = InFlightRegistry('VideoUpload')
+
+
+class VideoBlobStore:
+    """영상 ID + 포맷 → GCS 객체"""
+
+    PREFIX = 'video-analysis'
+
+    def __init__(self, bucket, bucket_name: str = ''):
+        self.bucket = bucket
+        self.bucket_name = bucket_name or getattr(bucket, 'name', '') or config.GCS_BUCKET_NAME
+
+    @staticmethod
+    def media_key(url: str, video_id: Optional[str]) -> str:
+        """객체 키 (영상 ID를 못 얻은 URL은 URL 해시)"""
+        return video_id or hashlib.sha1(url.encode()).hexdigest()[:16]
+
+    def blob_name(self, key: str, mode: str) -> str:
+        return f"{self.PREFIX}/{key}/{mode}.{MEDIA_EXTENSIONS[mode]}"
+
+    def uri(self, key: str, mode: str) -> str:
+        return f"gs://{self.bucket_name}/{self.blob_name(key, mode)}"
+
+    @staticmethod
+    def is_complete(blob) -> bool:
+        """완료 표시가 있고 크기가 일치하는 객체인지"""
+        expected = (blob.metadata or {}).get(COMPLETE_METADATA)
+        return expected is not None and str(blob.size) == expected
+
+    def find(self, key: str, modes: Iterable[str]) -> Optional[str]:
+        """이미 업로드가 끝난 포맷 (modes 순서대로 확인, 없으면 None)"""
+        for mode in modes:
+            try:
+                blob = self.bucket.get_blob(self.blob_name(key, mode))
+            except Exception as e:
+                print(f"⚠️ (VideoBlobStore) 객체 확인 실패: {e}")
+                return None
+            if blob is None:
+                continue
+            if self.is_complete(blob):
+                if self._touch(blob):
+                    return mode
+                continue
+            print(f"⚠️ (VideoBlobStore) 완료 표시 없는 객체 무시 (다시 업로드): {blob.name}")
+        return None
+
+    def get_or_upload(
+        self,
+        url: str,
+        video_id: Optional[str],
+        modes: Iterable[str],
+        should_stop=None,
+    ) -> Tuple[str, str]:
+        """
+        영상 미디어의 GCS URI (있으면 재사용, 없으면 스트리밍 업로드)
+
+        Args:
+            modes: 선호 포맷 순서 (예: [audio, video]) — 앞 포맷이 없으면 다음 포맷으로 업로드
+            should_stop: 이 요청의 스트리밍 중단 조건 (합류한 업로드가 다른 요청의 취소로
+                중단되면 이 조건이 False인 한 다시 시도)
+
+        Returns:
+            (gs:// URI, 사용한 mode)
+        """
+        modes = list(modes)
+        key = self.media_key(url, video_id)
+
+        mode = self.find(key, modes)
+        if mode:
+            print(f"♻️ (VideoBlobStore) 업로드된 미디어 재사용: {self.blob_name(key, mode)}")
+            return self.uri(key, mode), mode
+
+        while True:
+            try:
+                mode = video_uploads.run(key, lambda: self._upload(url, key, modes, should_stop))
+            except InterruptedError:
+                if should_stop and should_stop():
+                    raise
+                # 합류한 업로드의 owner 요청이 취소됨 → 이 요청이 다시 시도
+                print(f"🔁 (VideoBlobStore) 다른 요청의 업로드가 취소되어 다시 시도: {key}")
+                continue
+            return self.uri(key, mode), mode
+
+    def _upload(self, url: str, key: str, modes, should_stop) -> str:
+        for index, mode in enumerate(modes):
+            blob = self.bucket.blob(self.blob_name(key, mode))
+            print(f"📥 yt-dlp → GCS 스트리밍 업로드 중 ({mode})...")
+            try:
+                uploaded = stream_to_blob(url, blob, mode, should_stop=should_stop)
+            except MediaStreamError as e:
+                # 해당 포맷이 없는 영상 → 다음 포맷으로 재시도
+                if e.received == 0 and index + 1 < len(modes):
+                    print(f"⚠️ {mode} 스트림 실패, 다음 포맷으로 재시도: {e}")
+                    continue
+                raise
+            print(f"✅ GCS 업로드 완료: {self.uri(key, mode)} ({uploaded / (1024 * 1024):.1f}MB)")
+            self._mark_complete(blob, uploaded)
+            return mode
+        raise MediaStreamError("업로드할 포맷이 없음")
+
+    @staticmethod
+    def _touch(blob) -> bool:
+        """
+        마지막 사용 시각(custom time) 갱신 (TOUCH_INTERVAL 안에 갱신했으면 생략)
+
+        Returns:
+            객체를 사용할 수 있으면 True (그 사이 삭제되었으면 False → 다시 업로드)
+        """
+        now = datetime.now(timezone.utc)
+        if blob.custom_time and now - blob.custom_time < TOUCH_INTERVAL:
+            return True
+        try:
+            blob.custom_time = now
+            blob.patch()
+        except Exception as e:
+            if getattr(e, 'code', None) == 404:
+                print(f"⚠️ (VideoBlobStore) 재사용 직전 삭제된 객체: {blob.name}")
+                return False
+            print(f"⚠️ (VideoBlobStore) 사용 시각 갱신 실패: {e}")
+        return True
+
+    @staticmethod
+    def _mark_complete(blob, size: int) -> None:
+        """완료 표시 + 사용 시각 기록 (실패해도 이번 요청은 업로드한 객체 사용, 다음 요청은 다시 업로드)"""
+        try:
+            blob.metadata = {COMPLETE_METADATA: str(size)}
+            blob.custom_time = datetime.now(timezone.utc)
+            blob.patch()
+        except Exception as e:
+            print(f"⚠️ (VideoBlobStore) 완료 표시 기록 실패: {e}")
+
+    def ensure_lifecycle(self, ttl_days: Optional[int] = None) -> bool:
+        """
+        PREFIX 객체를 마지막 사용(custom time) 후 ttl_days일 지나면 삭제하는 버킷 수명 주기 규칙 등록
+        (버킷 관리자 권한 필요, 같은 접두사의 기존 age 기반 삭제 규칙은 교체)
+
+        custom time이 없는 객체(완료 표시 도입 전 업로드)는 이 규칙에 해당하지 않으므로
+        한 번 직접 정리해야 합니다. (완료 표시가 없어 재사용되지 않고, 다시 업로드되면 덮어씀)
+
+        Returns:
+            규칙을 새로 추가/교체했으면 True (이미 있으면 False)
+        """
+        ttl_days = ttl_days or config.VIDEO_BLOB_TTL_DAYS
+        prefix = f"{self.PREFIX}/"
+        self.bucket.reload()
+        rules = list(self.bucket.lifecycle_rules)
+        ours = [
+            rule for rule in rules
+            if rule.get('action', {}).get('type') == 'Delete'
+            and prefix in rule.get('condition', {}).get('matchesPrefix', [])
+        ]
+        if len(ours) == 1 and ours[0].get('condition', {}).get('daysSinceCustomTime') == ttl_days \
+                and 'age' not in ours[0].get('condition', {}):
+            return False
+
+        self.bucket.lifecycle_rules = [rule for rule in rules if rule not in ours]
+        self.bucket.add_lifecycle_delete_rule(days_since_custom_time=ttl_days, matches_prefix=[prefix])
+        self.bucket.patch()
+        return True
@@ -0,0 +1,150 @@
+"""
+Video Probe - 유튜브 추출 단계 선택을 위한 사전 메타데이터 조회
+
+[문제]
+YoutubeExtractor.extract는 영상 정보를 모른 채 모든 단계를 시작합니다.
+- 자막이 없는 영상도 자막 단계의 실패를 기다림
+- 3시간짜리 영상/라이브도 다운로드 + Gemini 영상 분석을 시도해 워커 시간을 수 분씩 소모
+- 비공개/삭제 영상도 모든 단계가 각자 실패할 때까지 진행
+
+[동작]
+- yt-dlp extract_info(download=False)로 길이, 라이브 여부, 자막 언어를 조회 (다운로드 없음)
+- yt-dlp 조회가 실패하면 oEmbed로 공개 여부/제목만 확인
+  (404만 사용 불가로 판단, 401/403은 퍼가기 금지 영상도 해당되므로 판단하지 않음)
+- 결과는 영상 ID별 TTL 캐시에 보관 (YOUTUBE_PROBE_TTL_SEC)
+- 조회 자체가 실패하면 None → 호출 측은 기존처럼 모든 단계를 시도 (fail open)
+"""
+import json
+import threading
+from dataclasses import dataclass, field
+from typing import Iterable, Optional, Tuple
+from urllib.parse import quote
+
+import yt_dlp
+
+from app.config import config
+from app.utils.cache import TTLCache
+from app.utils.http_client import FetchError, get_http_client
+
+
+OEMBED_URL = 'https://www.youtube.com/oembed?format=json&url='
+
+
+@dataclass
+class VideoProbeResult:
+    """사전 조회 결과 (None 필드는 '알 수 없음')"""
+    video_id: str
+    available: bool = True
+    title: str = ''
+    duration: Optional[int] = None  # 초
+    is_live: bool = False
+    has_captions: Optional[bool] = None
+    caption_languages: Tuple[str, ...] = field(default_factory=tuple)
+    source: str = ''  # 'ytdlp' | 'oembed'
+
+    def has_transcript_for(self, languages: Iterable[str]) -> Optional[bool]:
+        """
+        지정 언어 자막(수동/자동 생성) 존재 여부
+
+        Returns:
+            True/False, 판단할 수 없으면 None
+        """
+        if self.has_captions is None:
+            return None
+        if not self.has_captions:
+            return False
+        if not self.caption_languages:
+            return None
+        prefixes = tuple(languages)
+        return any(lang.split('-')[0] in prefixes for lang in self.caption_languages)
+
+
+class VideoProbe:
+    """영상 ID별 사전 메타데이터 조회 (스레드 안전)"""
+
+    def __init__(self):
+        self._cache = TTLCache(max_size=5000, ttl=config.YOUTUBE_PROBE_TTL_SEC)
+
+    def probe(self, url: str, video_id: str) -> Optional[VideoProbeResult]:
+        """영상 메타데이터 (조회 실패 시 None)"""
+        cached = self._cache.get(video_id)
+        if cached is not None:
+            return cached
+
+        result = self._probe_ytdlp(url, video_id) or self._probe_oembed(url, video_id)
+        if result is not None:
+            self._cache.set(video_id, result)
+        return result
+
+    def _probe_ytdlp(self, url: str, video_id: str) -> Optional[VideoProbeResult]:
+        options = {
+            'quiet': True,
+            'no_warnings': True,
+            'skip_download': True,
+            'noplaylist': True,
+            'socket_timeout': config.YOUTUBE_PROBE_TIMEOUT_SEC,
+        }
+        try:
+            with yt_dlp.YoutubeDL(options) as ydl:
+                info = ydl.extract_info(url, download=False)
+        except Exception as e:
+            print(f"⚠️ (VideoProbe) yt-dlp 조회 실패, oEmbed 확인: {e}")
+            return None
+
+        subtitles = info.get('subtitles') or {}
+        automatic = info.get('automatic_captions') or {}
+        # 자동 자막 목록에는 번역 언어가 모두 포함됨 → 원본 언어('-orig')만 사용
+        languages = set(subtitles)
+        originals = {lang[:-len('-orig')] for lang in automatic if lang.endswith('-orig')}
+        if automatic and not originals and info.get('language'):
+            originals.add(info['language'])
+        languages |= originals
+
+        duration = info.get('duration')
+        return VideoProbeResult(
+            video_id=video_id,
+            title=info.get('title') or '',
+            duration=int(duration) if duration else None,
+            is_live=bool(info.get('is_live')),
+            has_captions=bool(subtitles or automatic),
+            caption_languages=tuple(sorted(languages)),
+            source='ytdlp',
+        )
+
+    def _probe_oembed(self, url: str, video_id: str) -> Optional[VideoProbeResult]:
+        try:
+            response = get_http_client().get(
+                OEMBED_URL + quote(f"https://www.youtube.com/watch?v={video_id}", safe=''),
+                timeout=config.YOUTUBE_PROBE_TIMEOUT_SEC,
+                max_bytes=64 * 1024,
+            )
+            data = json.loads(response.text)
+        except FetchError as e:
+            if e.status_code == 404:
+                print(f"🚫 (VideoProbe) 사용할 수 없는 영상: {video_id} ({e.status_code})")
+                return VideoProbeResult(video_id=video_id, available=False, source='oembed')
+            print(f"⚠️ (VideoProbe) oEmbed 조회 실패: {e}")
+            return None
+        except Exception as e:
+            print(f"⚠️ (VideoProbe) oEmbed 조회 실패: {e}")
+            return None
+
+        return VideoProbeResult(video_id=video_id, title=data.get('title', ''), source='oembed')
+
+
+# ============================================================
+# Shared instance
+# ============================================================
+
+_probe: Optional[VideoProbe] = None
+_probe_lock = threading.Lock()
+
+
+def get_video_probe() -> VideoProbe:
+    """프로세스 공유 영상 사전 조회기"""
+    global _probe
+
+    with _probe_lock:
+        if _probe is None:
+            _probe = VideoProbe()
+    return _probe
@@ -3,6 +3,11 @@ YouTube Video Analysis Service using Direct URL Processing
 유튜브 URL을 직접 Gemini API에 전달하여 분석 (다운로드 불필요)
 """
 import json
+import asyncio
+import threading
+from typing import Dict, List, Optional
+
+from tenacity import retry, wait_exponential, stop_after_attempt
 from google import genai
 from google.genai import types
 from app.config import config
@@ -124,112 +129,109 @@ class YouTubeVideoService:
 
 # ============================================================
 # 🔄 비동기 병렬 처리 버전 (Async Processing)
-# 여러 영상을 동시에 빠르게 처리하고 싶을 때 주석 해제하여 사용
+# 여러 영상을 한 번의 요청으로 동시에 분석 (/api/analyze-batch)
 # ============================================================
 
-# import asyncio
-# from tenacity import retry, wait_exponential, stop_after_attempt
-#
-# class AsyncYouTubeVideoService:
-#     """비동기 방식으로 여러 영상을 병렬 처리"""
-#
-#     def __init__(self, api_key: str = None):
-#         try:
-#             self.client = genai.Client(
-#                 vertexai=True,
-#                 project=config.GCP_PROJECT,
-#                 location=config.GCP_REGION
-#             )
-#             self.model = "gemini-2.0-flash"
-#             print("✅ (AsyncYouTubeVideoService) Gemini API 연결 성공")
-#         except Exception as e:
-#             print(f"⚠️ (AsyncYouTubeVideoService) 연결 실패: {e}")
-#             self.client = None
-#
-#     @retry(
-#         wait=wait_exponential(multiplier=2, min=2, max=60),
-#         stop=stop_after_attempt(3)
-#     )
-#     async def analyze_video_async(self, video_url: str, prompt: str) -> dict:
-#         """
-#         단일 영상 비동기 분석 (재시도 로직 포함)
-#
-#         Args:
-#             video_url: 유튜브 URL
-#             prompt: 분석 프롬프트
-#
-#         Returns:
-#             분석 결과
-#         """
-#         if not self.client:
-#             raise Exception("Gemini API를 사용할 수 없습니다.")
-#
-#         print(f"🎬 비동기 분석 시작: {video_url[:50]}...")
-#
-#         response = await self.client.aio.models.generate_content(
-#             model=self.model,
-#             contents=[
-#                 types.Part.from_uri(file_uri=video_url, mime_type="video/webm"),
-#                 prompt
-#             ],
-#             config=types.GenerateContentConfig(
-#                 temperature=0.0,
-#                 response_mime_type="application/json"
-#             )
-#         )
-#
-#         result_text = response.text.strip().replace('```json', '').replace('```', '').strip()
-#         return json.loads(result_text)
-#
-#     async def analyze_multiple_videos(
-#         self,
-#         video_urls: list[str],
-#         analysis_type: str = "summary",
-#         max_concurrent: int = 5
-#     ) -> list[dict]:
-#         """
-#         여러 영상을 병렬로 분석
-#
-#         Args:
-#             video_urls: 유튜브 URL 리스트
-#             analysis_type: 분석 타입
-#             max_concurrent: 최대 동시 처리 수
-#
-#         Returns:
-#             분석 결과 리스트
-#         """
-#         semaphore = asyncio.Semaphore(max_concurrent)
-#         prompt = self._get_prompt(analysis_type)
-#
-#         async def analyze_with_semaphore(url):
-#             async with semaphore:
-#                 try:
-#                     return await self.analyze_video_async(url, prompt)
-#                 except Exception as e:
-#                     print(f"❌ 분석 실패: {url} - {e}")
-#                     return None
-#
-#         tasks = [analyze_with_semaphore(url) for url in video_urls]
-#         results = await asyncio.gather(*tasks)
-#
-#         # None 제외
-#         return [r for r in results if r is not None]
-#
-#     def _get_prompt(self, analysis_type: str) -> str:
-#         """분석 타입에 따른 프롬프트 반환"""
-#         # (위의 동기 버전과 동일)
-#         pass
-#
-#
-# # 사용 예시:
-# # async def main():
-# #     service = AsyncYouTubeVideoService()
-# #     video_urls = [
-# #         "https://www.youtube.com/watch?v=VIDEO_ID_1",
-# #         "https://www.youtube.com/watch?v=VIDEO_ID_2",
-# #         "https://www.youtube.com/watch?v=VIDEO_ID_3",
-# #     ]
-# #     results = await service.analyze_multiple_videos(video_urls, max_concurrent=5)
-# #     print(results)
-# #
-# # asyncio.run(main())
+class AsyncYouTubeVideoService(YouTubeVideoService):
+    """
+    비동기 방식으로 여러 영상을 병렬 처리 (동시 실행 수 제한 + 재시도)
+
+    genai.Client의 aio 클라이언트는 처음 사용한 이벤트 루프에 묶이므로,
+    요청마다 asyncio.run()으로 새 루프를 만들지 않고 전용 루프 스레드 하나에서 실행합니다.
+    """
+
+    def __init__(self, api_key: str = None):
+        super().__init__(api_key)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_lock = threading.Lock()
+
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        """aio 클라이언트 전용 이벤트 루프 (최초 호출 시 백그라운드 스레드에서 시작)"""
+        with self._loop_lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(target=loop.run_forever, name='youtube-batch-loop', daemon=True).start()
+                self._loop = loop
+            return self._loop
+
+    @retry(
+        wait=wait_exponential(multiplier=2, min=2, max=60),
+        stop=stop_after_attempt(3),
+        reraise=True,
+    )
+    async def analyze_video_async(self, video_url: str, prompt: str) -> dict:
+        """
+        단일 영상 비동기 분석 (재시도 로직 포함)
+
+        Args:
+            video_url: 유튜브 URL
+            prompt: 분석 프롬프트
+
+        Returns:
+            분석 결과
+        """
+        if not self.client:
+            raise Exception("Gemini API를 사용할 수 없습니다.")
+
+        print(f"🎬 비동기 분석 시작: {video_url[:50]}...")
+
+        response = await self.client.aio.models.generate_content(
+            model=self.model,
+            contents=[
+                types.Part.from_uri(file_uri=video_url, mime_type="video/webm"),
+                prompt
+            ],
+            config=types.GenerateContentConfig(
+                temperature=0.0,
+                response_mime_type="application/json"
+            )
+        )
+
+        result_text = response.text.strip().replace('```json', '').replace('```', '').strip()
+        return json.loads(result_text)
+
+    async def analyze_multiple_videos(
+        self,
+        video_urls: List[str],
+        analysis_type: str = "summary",
+        max_concurrent: int = 5,
+        prompt: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ) -> List[Dict]:
+        """
+        여러 영상을 병렬로 분석
+
+        Args:
+            video_urls: 유튜브 URL 리스트
+            analysis_type: 분석 타입 (prompt가 없을 때 사용)
+            max_concurrent: 최대 동시 처리 수
+            prompt: 직접 지정할 분석 프롬프트
+            timeout: 영상당 최대 시간 (초, 재시도 포함)
+
+        Returns:
+            입력 순서대로 {'url', 'result'} 또는 {'url', 'error'}
+        """
+        semaphore = asyncio.Semaphore(max_concurrent)
+        prompt = prompt or self._get_prompt(analysis_type)
+
+        async def analyze_with_semaphore(url):
+            async with semaphore:
+                try:
+                    result = await asyncio.wait_for(self.analyze_video_async(url, prompt), timeout)
+                    return {'url': url, 'result': result}
+                except asyncio.TimeoutError:
+                    print(f"❌ 분석 시간 초과: {url}")
+                    return {'url': url, 'error': '분석 시간 초과'}
+                except Exception as e:
+                    print(f"❌ 분석 실패: {url} - {e}")
+                    return {'url': url, 'error': str(e)}
+
+        tasks = [analyze_with_semaphore(url) for url in video_urls]
+        return await asyncio.gather(*tasks)
+
+    def analyze_many(self, video_urls: List[str], **kwargs) -> List[Dict]:
+        """동기 코드(Flask 라우트)에서 호출하는 진입점 (전용 루프에서 실행하고 결과를 기다림)"""
+        future = asyncio.run_coroutine_threadsafe(
+            self.analyze_multiple_videos(video_urls, **kwargs), self._get_loop()
+        )
+        return future.result()
@@ -0,0 +1,63 @@
+"""
+GDELT 15분 export 파일을 로컬 색인(SQLite FTS5)에 적재하는 스크립트
+
+사용법:
+    # 최근 하루치(96개 구간) GKG 파일 적재
+    python scripts/ingest_gdelt_local.py --intervals 96
+
+    # 로컬 사본(fixture 등) 적재
+    python scripts/ingest_gdelt_local.py --files data/20240501120000.gkg.csv.zip
+
+    # 보관 기간이 지난 레코드 정리
+    python scripts/ingest_gdelt_local.py --prune
+
+저장 경로는 GDELT_LOCAL_STORE_PATH 환경변수 또는 --db 옵션으로 지정합니다.
+"""
+import argparse
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from app.config import config
+from app.utils.gdelt_local_store import GDELTLocalStore
+
+
+def main():
+    parser = argparse.ArgumentParser(description='GDELT export 파일 로컬 적재')
+    parser.add_argument('--db', default=config.GDELT_LOCAL_STORE_PATH, help='SQLite 파일 경로')
+    parser.add_argument('--files', nargs='*', default=[], help='적재할 로컬 파일 또는 URL')
+    parser.add_argument('--intervals', type=int, default=0, help='원격에서 받을 최근 15분 구간 수')
+    parser.add_argument('--mentions', action='store_true', help='mentions 파일도 함께 적재')
+    parser.add_argument('--prune', action='store_true', help='보관 기간 지난 레코드 삭제')
+    args = parser.parse_args()
+
+    if not args.db:
+        print("❌ 저장 경로가 없습니다 (--db 또는 GDELT_LOCAL_STORE_PATH 설정 필요)")
+        sys.exit(1)
+
+    store = GDELTLocalStore(args.db)
+    print(f"✅ 로컬 색인 열기: {args.db}")
+
+    total = 0
+    for path in args.files:
+        try:
+            total += store.ingest_file(path)
+        except Exception as e:
+            print(f"⚠️ 적재 실패 ({path}): {e}")
+
+    if args.intervals:
+        print(f"\n⬇️ 최근 {args.intervals}개 구간 다운로드 중...")
+        total += store.ingest_recent(args.intervals, include_mentions=args.mentions)
+
+    if args.prune:
+        removed = store.prune(config.GDELT_LOCAL_RETENTION_DAYS)
+        print(f"🗑️ {removed}개 오래된 레코드 삭제 (보관 {config.GDELT_LOCAL_RETENTION_DAYS}일)")
+
+    print(f"\n🎉 적재 완료: 신규 {total}개 레코드 (최신 날짜: {store.latest_date()})")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,46 @@
+"""
+영상 분석용 GCS 미디어(video-analysis/)의 수명 주기 규칙을 등록하는 스크립트
+
+yt-dlp 단계는 업로드한 미디어를 영상 ID 기준으로 재사용하고 직접 삭제하지 않으므로,
+버킷에 "마지막 사용(custom time) 후 N일 지난 video-analysis/ 객체 삭제" 규칙이 있어야 합니다.
+(버킷 관리자 권한 필요, 예전 age 기반 규칙이 있으면 교체)
+
+사용법:
+    python scripts/setup_video_lifecycle.py            # VIDEO_BLOB_TTL_DAYS 사용
+    python scripts/setup_video_lifecycle.py --days 3
+"""
+import argparse
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from google.cloud import storage
+
+from app.config import config
+from app.utils.video_blob_store import VideoBlobStore
+
+
+def main():
+    parser = argparse.ArgumentParser(description='영상 분석 미디어 수명 주기 규칙 등록')
+    parser.add_argument('--bucket', default=config.GCS_BUCKET_NAME, help='GCS 버킷 이름')
+    parser.add_argument('--days', type=int, default=config.VIDEO_BLOB_TTL_DAYS, help='보관 기간 (일)')
+    args = parser.parse_args()
+
+    if not args.bucket:
+        print("❌ 버킷 이름이 없습니다 (--bucket 또는 GCS_BUCKET_NAME 설정 필요)")
+        sys.exit(1)
+
+    client = storage.Client(project=config.GCP_PROJECT)
+    store = VideoBlobStore(client.bucket(args.bucket), args.bucket)
+
+    if store.ensure_lifecycle(args.days):
+        print(f"✅ 규칙 추가: gs://{args.bucket}/{store.PREFIX}/ 객체 마지막 사용 {args.days}일 후 삭제")
+    else:
+        print(f"ℹ️ 이미 같은 규칙이 있습니다 ({args.days}일)")
+
+
+if __name__ == '__main__':
+    main()
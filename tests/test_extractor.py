@@ -0,0 +1,48 @@
+"""
+extract_video_id 단위 테스트
+"""
+import pytest
+
+from app.models.extractor import extract_video_id
+
+
+VIDEO_ID = 'dQw4w9WgXcQ'
+
+
+@pytest.mark.parametrize('url', [
+    f'https://www.youtube.com/watch?v={VIDEO_ID}',
+    f'https://www.youtube.com/watch?v={VIDEO_ID}&t=42s',
+    f'https://www.youtube.com/watch?feature=share&v={VIDEO_ID}',
+    f'https://m.youtube.com/watch?v={VIDEO_ID}',
+    f'https://music.youtube.com/watch?v={VIDEO_ID}&list=RDAMVM',
+    f'https://youtu.be/{VIDEO_ID}',
+    f'https://youtu.be/{VIDEO_ID}?si=abc&t=10',
+    f'https://www.youtube.com/shorts/{VIDEO_ID}',
+    f'https://www.youtube.com/embed/{VIDEO_ID}?start=5',
+    f'https://www.youtube.com/live/{VIDEO_ID}',
+    f'https://www.youtube.com/v/{VIDEO_ID}',
+    f'https://www.youtube-nocookie.com/embed/{VIDEO_ID}',
+    f'http://youtube.com:443/watch?v={VIDEO_ID}',
+    f'youtube.com/watch?v={VIDEO_ID}',
+    f'youtu.be/{VIDEO_ID}',
+    f'  https://youtu.be/{VIDEO_ID}  ',
+    VIDEO_ID,
+])
+def test_extracts_id_from_supported_formats(url):
+    assert extract_video_id(url) == VIDEO_ID
+
+
+@pytest.mark.parametrize('url', [
+    '',
+    None,
+    'https://www.youtube.com/',
+    'https://www.youtube.com/watch',
+    'https://www.youtube.com/watch?v=short',
+    'https://www.youtube.com/shorts/',
+    'https://www.youtube.com/channel/UC1234567890',
+    f'https://vimeo.com/watch?v={VIDEO_ID}',
+    f'https://notyoutube.com/watch?v={VIDEO_ID}',
+    f'https://youtube.com.evil.example/watch?v={VIDEO_ID}',
+])
+def test_rejects_non_video_urls(url):
+    assert extract_video_id(url) is None
@@ -0,0 +1,135 @@
+"""
+long_content (map-reduce 보조 함수) 단위 테스트
+"""
+from app.utils.long_content import estimate_tokens, merge_claims, select_within_budget, split_chunks
+
+
+def _sentences(count: int) -> str:
+    return ' '.join(f'Sentence number {i} talks about topic {i}.' for i in range(count))
+
+
+# ------------------------------------------------------------
+# split_chunks
+# ------------------------------------------------------------
+
+def test_split_short_text_is_single_chunk():
+    assert split_chunks('  짧은 본문입니다.  ', size=100, overlap=10) == ['짧은 본문입니다.']
+
+
+def test_split_empty_text():
+    assert split_chunks('   ', size=100, overlap=10) == []
+
+
+def test_split_respects_size_and_sentence_boundaries():
+    text = _sentences(100)
+    chunks = split_chunks(text, size=500, overlap=100)
+
+    assert len(chunks) > 1
+    assert all(len(chunk) <= 500 for chunk in chunks)
+    # 마지막 청크를 제외하면 모두 문장 끝에서 잘림
+    assert all(chunk.endswith('.') for chunk in chunks[:-1])
+    # 모든 청크가 문장 시작에서 시작
+    assert all(chunk.startswith('Sentence') for chunk in chunks)
+
+
+def test_split_covers_whole_text_with_overlap():
+    text = _sentences(100)
+    chunks = split_chunks(text, size=500, overlap=100)
+
+    assert chunks[0].startswith('Sentence number 0 ')
+    assert chunks[-1].endswith('topic 99.')
+    for previous, current in zip(chunks, chunks[1:]):
+        # 다음 청크의 첫 문장은 앞 청크에 이미 포함 (경계에 걸친 문장 보존)
+        first_sentence = current.split('.')[0] + '.'
+        assert first_sentence in previous
+
+
+def test_split_without_sentence_boundaries_falls_back_to_size():
+    text = 'x' * 1050
+    chunks = split_chunks(text, size=500, overlap=50)
+
+    assert all(len(chunk) <= 500 for chunk in chunks)
+    assert ''.join(chunks).count('x') >= 1050
+
+
+# ------------------------------------------------------------
+# select_within_budget
+# ------------------------------------------------------------
+
+def test_select_all_when_within_budget():
+    chunks = ['a' * 100] * 5
+    cost = estimate_tokens(chunks[0]) + 10
+    assert select_within_budget(chunks, tokens_per_call=10, budget=cost * 5) == [0, 1, 2, 3, 4]
+
+
+def test_select_spreads_over_whole_content():
+    chunks = ['a' * 100] * 10
+    cost = estimate_tokens(chunks[0]) + 10
+    selected = select_within_budget(chunks, tokens_per_call=10, budget=cost * 4)
+
+    assert len(selected) == 4
+    assert selected[0] == 0 and selected[-1] == 9
+    assert selected == sorted(selected)
+
+
+def test_select_at_least_first_chunk():
+    chunks = ['a' * 100] * 3
+    assert select_within_budget(chunks, tokens_per_call=10, budget=1) == [0]
+
+
+# ------------------------------------------------------------
+# merge_claims
+# ------------------------------------------------------------
+
+def test_merge_deduplicates_similar_claims_and_unions_fields():
+    partials = [
+        {'key_claims': [
+            {'claim_kr': '정부가 금리를 인상했다.', 'search_keywords_en': ['rate hike'],
+             'target_country_codes': ['KR']},
+        ]},
+        {'key_claims': [
+            {'claim_kr': '정부가 금리를 인상했다', 'search_keywords_en': ['Rate Hike', 'central bank'],
+             'target_country_codes': ['KR', 'US']},
+        ]},
+    ]
+    merged = merge_claims(partials, max_claims=10)
+
+    assert merged == [{
+        'claim_kr': '정부가 금리를 인상했다.',
+        'search_keywords_en': ['rate hike', 'central bank'],
+        'target_country_codes': ['KR', 'US'],
+    }]
+
+
+def test_merge_orders_by_support_then_position():
+    partials = [
+        {'key_claims': [{'claim_kr': '첫 번째 청크에만 나온 주장'}]},
+        {'key_claims': [{'claim_kr': '반복해서 등장하는 핵심 주장'}]},
+        {'key_claims': [{'claim_kr': '반복해서 등장하는 핵심 주장'}, {'claim_kr': '마지막 청크의 다른 내용'}]},
+    ]
+    merged = merge_claims(partials, max_claims=10)
+
+    assert [c['claim_kr'] for c in merged] == [
+        '반복해서 등장하는 핵심 주장',
+        '첫 번째 청크에만 나온 주장',
+        '마지막 청크의 다른 내용',
+    ]
+
+
+def test_merge_limits_claims_and_skips_empty():
+    partials = [
+        {'key_claims': [{'claim_kr': ''}, {'claim_kr': '...'}]},
+        {'key_claims': [
+            {'claim_kr': '수출이 3개월 연속 감소했다'},
+            {'claim_kr': '중앙은행은 기준금리를 동결했다'},
+            {'claim_kr': '신규 주택 착공 건수가 늘었다'},
+            {'claim_kr': '여당이 추경 예산안을 발의했다'},
+        ]},
+        {'key_claims': None},
+        {},
+    ]
+    merged = merge_claims(partials, max_claims=3)
+
+    assert len(merged) == 3
+    assert all(c['claim_kr'] for c in merged)
+    assert all(set(c) == {'claim_kr', 'search_keywords_en', 'target_country_codes'} for c in merged)